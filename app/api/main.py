@@ -1,7 +1,10 @@
 from fastapi import APIRouter
 
 from app.api.routes import (
+    availability_templates,
     available_matches,
+    available_matches_bulk,
+    available_matches_search,
     businesses,
     items,
     items_service,
@@ -22,3 +25,18 @@ api_router.include_router(
     prefix="/businesses/{business_public_id}/padel-courts/{court_name}/available-matches",
     tags=["available-matches"],
 )
+api_router.include_router(
+    available_matches_search.router,
+    prefix="/available-matches",
+    tags=["available-matches-search"],
+)
+api_router.include_router(
+    availability_templates.router,
+    prefix="/businesses/{business_public_id}/padel-courts/{court_name}/availability-template",
+    tags=["availability-templates"],
+)
+api_router.include_router(
+    available_matches_bulk.router,
+    prefix="/businesses/{business_public_id}/available-matches/bulk",
+    tags=["available-matches-bulk"],
+)
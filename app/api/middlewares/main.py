@@ -1,24 +1,41 @@
-from urllib.parse import parse_qs, urlencode
+from urllib.parse import quote, unquote_plus
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+USER_ID_HEADER = b"x-user-id"
+OWNER_ID_PARAM = "owner_id"
 
-class HeaderToQueryMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        scope = request.scope
-        headers = dict(scope["headers"])
-        query_string = scope["query_string"].decode()
 
-        query_params = parse_qs(query_string)
+def _has_query_param(query_string: bytes, name: str) -> bool:
+    for param in query_string.split(b"&"):
+        key, _, value = param.partition(b"=")
+        if value and unquote_plus(key.decode("latin-1")) == name:
+            return True
+    return False
 
-        x_user_id = headers.get(b"x-user-id")
-        if x_user_id:
-            user_id_value = x_user_id.decode()
-            if "owner_id" not in query_params:
-                query_params["owner_id"] = [user_id_value]
 
-        new_query_string = urlencode(query_params, doseq=True)
-        scope["query_string"] = new_query_string.encode()
+class HeaderToQueryMiddleware:
+    """Send the x-user-id header as the owner_id query param, unless it is set.
 
-        return await call_next(request)
+    Plain ASGI middleware: requests without the header go through untouched,
+    and the query string is only appended to, never re-encoded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            user_id = next(
+                (value for key, value in scope["headers"] if key == USER_ID_HEADER),
+                None,
+            )
+            query_string = scope["query_string"]
+            if user_id and not _has_query_param(query_string, OWNER_ID_PARAM):
+                param = f"{OWNER_ID_PARAM}={quote(user_id.decode('latin-1'), safe='')}"
+                separator = b"&" if query_string else b""
+                scope = {
+                    **scope,
+                    "query_string": query_string + separator + param.encode(),
+                }
+        await self.app(scope, receive, send)
@@ -0,0 +1,111 @@
+import uuid
+from datetime import date
+from typing import Any
+
+from fastapi import APIRouter, Response, status
+
+from app.models.availability_template import (
+    AvailabilityTemplateCreate,
+    AvailabilityTemplatePublic,
+)
+from app.services.availability_template_service import AvailabilityTemplateService
+from app.utilities.dependencies import SessionDep
+from app.utilities.messages import (
+    AVAILABILITY_TEMPLATE_EXCEPTION_RESPONSES,
+    AVAILABILITY_TEMPLATE_GET_RESPONSES,
+    AVAILABILITY_TEMPLATE_PUT_RESPONSES,
+)
+
+router = APIRouter()
+
+service_availability_template = AvailabilityTemplateService()
+
+
+@router.put(
+    "/",
+    response_model=AvailabilityTemplatePublic,
+    status_code=status.HTTP_200_OK,
+    responses={**AVAILABILITY_TEMPLATE_PUT_RESPONSES},  # type: ignore[dict-item]
+)
+async def set_availability_template(
+    *,
+    session: SessionDep,
+    owner_id: uuid.UUID,
+    court_name: str,
+    business_public_id: uuid.UUID,
+    template_in: AvailabilityTemplateCreate,
+) -> Any:
+    """
+    Replace the weekly template of the court: the matches of each weekday are
+    created for every future date not handled yet, when it is first read or by
+    the scheduler. Dates already handled keep their matches.
+    """
+    return await service_availability_template.set_template(
+        session, owner_id, court_name, business_public_id, template_in
+    )
+
+
+@router.get(
+    "/",
+    response_model=AvailabilityTemplatePublic,
+    status_code=status.HTTP_200_OK,
+    responses={**AVAILABILITY_TEMPLATE_GET_RESPONSES},  # type: ignore[dict-item]
+)
+async def get_availability_template(
+    *,
+    session: SessionDep,
+    court_name: str,
+    business_public_id: uuid.UUID,
+) -> Any:
+    """
+    Get the weekly template of the court and its future exceptions.
+    """
+    return await service_availability_template.get_template(
+        session, court_name, business_public_id
+    )
+
+
+@router.post(
+    "/exceptions",
+    response_model=AvailabilityTemplatePublic,
+    status_code=status.HTTP_201_CREATED,
+    responses={**AVAILABILITY_TEMPLATE_EXCEPTION_RESPONSES},  # type: ignore[dict-item]
+)
+async def add_availability_template_exception(
+    *,
+    session: SessionDep,
+    owner_id: uuid.UUID,
+    court_name: str,
+    business_public_id: uuid.UUID,
+    date: date,
+) -> Any:
+    """
+    Do not create the template matches in the date. Matches already created
+    are kept, delete them with the available matches endpoint.
+    """
+    return await service_availability_template.add_exception(
+        session, owner_id, court_name, business_public_id, date
+    )
+
+
+@router.delete(
+    "/exceptions",
+    response_model=None,
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={**AVAILABILITY_TEMPLATE_EXCEPTION_RESPONSES},  # type: ignore[dict-item]
+)
+async def delete_availability_template_exception(
+    *,
+    session: SessionDep,
+    owner_id: uuid.UUID,
+    court_name: str,
+    business_public_id: uuid.UUID,
+    date: date,
+) -> Response:
+    """
+    Remove the exception, the template matches of the date are created again.
+    """
+    await service_availability_template.delete_exception(
+        session, owner_id, court_name, business_public_id, date
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
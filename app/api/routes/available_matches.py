@@ -1,33 +1,58 @@
 import uuid
 from datetime import date
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.models.available_match import (
+    AvailableMatchBase,
     AvailableMatchCreate,
+    AvailableMatchesCreatedPublic,
+    AvailableMatchesDeletedPublic,
+    AvailableMatchesHoldPublic,
+    AvailableMatchesHours,
+    AvailableMatchesInRangePublic,
     AvailableMatchesPublic,
+    AvailableMatchesRangeFilter,
     AvailableMatchPublic,
 )
+from app.services.availability_event_service import AvailabilityEventService
 from app.services.available_match_public_service import AvailableMatchServicePublic
 from app.services.available_match_service import AvailableMatchService
 from app.utilities.dependencies import SessionDep
+from app.utilities.http_cache import (
+    AVAILABILITY_CACHE_CONTROL,
+    AVAILABILITY_EVENTS_HEADERS,
+    cached_json_response,
+)
 from app.utilities.messages import (
     AVAILABLE_DATE_DELETE_RESPONSES,
     AVAILABLE_DATE_GET_RESPONSES,
+    AVAILABLE_DATE_HOLD_DELETE_RESPONSES,
+    AVAILABLE_DATE_HOLD_POST_RESPONSES,
     AVAILABLE_DATE_PATCH_RESPONSES,
     AVAILABLE_DATE_POST_RESPONSES,
+    AVAILABLE_DATE_RANGE_GET_RESPONSES,
+    AVAILABLE_DATE_RANGE_PATCH_RESPONSES,
 )
 
 router = APIRouter()
 
+# Validated as a query parameter so an hour out of the day answers 422
+InitialHourQuery = Annotated[
+    int,
+    Query(ge=AvailableMatchBase.TIME_LIMIT_MIN, le=AvailableMatchBase.TIME_LIMIT_MAX),
+]
+
 service_available_match = AvailableMatchService()
 service_available_match_public = AvailableMatchServicePublic()
+service_availability_event = AvailabilityEventService()
 
 
 @router.post(
     "/",
-    response_model=AvailableMatchesPublic,
+    response_model=AvailableMatchesCreatedPublic,
     status_code=status.HTTP_201_CREATED,
     responses={**AVAILABLE_DATE_POST_RESPONSES},  # type: ignore[dict-item]
 )
@@ -38,13 +63,21 @@ async def add_available_matches_in_date(
     court_name: str,
     business_public_id: uuid.UUID,
     available_match_in: AvailableMatchCreate,
+    ignore_existing: bool = False,
 ) -> Any:
     """
     Create new available date, enabling games on the date.
+    With ignore_existing, hours already available are skipped and listed in
+    existing_hours instead of failing with 409.
     """
     available_matches = (
         await service_available_match_public.create_available_matches_in_date(
-            session, owner_id, court_name, business_public_id, available_match_in
+            session,
+            owner_id,
+            court_name,
+            business_public_id,
+            available_match_in,
+            ignore_existing,
         )
     )
     return available_matches
@@ -63,14 +96,23 @@ async def delete_available_matches_in_date(
     court_name: str,
     business_public_id: uuid.UUID,
     date: date,
+    force: bool = True,
+    return_count: bool = False,
 ) -> Any:
     """
-    Delete a item.
+    Delete all available matches of the date.
+    With force=false nothing is deleted if any match of the date is reserved.
+    With return_count, responds 200 with the number of deleted matches.
     """
-    await service_available_match.delete_available_matches_in_date(
-        session, owner_id, court_name, business_public_id, date
+    count = await service_available_match.delete_available_matches_in_date(
+        session, owner_id, court_name, business_public_id, date, force
     )
-    return
+    if return_count:
+        deleted = AvailableMatchesDeletedPublic(count=count)
+        return JSONResponse(
+            status_code=status.HTTP_200_OK, content=deleted.model_dump()
+        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get(
@@ -81,20 +123,67 @@ async def delete_available_matches_in_date(
 )
 async def get_available_matches_in_date(
     *,
+    request: Request,
     session: SessionDep,
     court_name: str,
     business_public_id: uuid.UUID,
     date: date,
-) -> Any:
+) -> Response:
     """
     Get all item.
+    Answers 304 Not Modified when If-None-Match matches the ETag.
     """
     available_matches = (
         await service_available_match_public.get_available_matches_in_date(
             session, court_name, business_public_id, date
         )
     )
-    return available_matches
+    return cached_json_response(request, available_matches, AVAILABILITY_CACHE_CONTROL)
+
+
+@router.get(
+    "/range",
+    response_model=AvailableMatchesInRangePublic,
+    status_code=status.HTTP_200_OK,
+    responses={**AVAILABLE_DATE_RANGE_GET_RESPONSES},  # type: ignore[dict-item]
+)
+async def get_available_matches_in_range(
+    *,
+    request: Request,
+    session: SessionDep,
+    court_name: str,
+    business_public_id: uuid.UUID,
+    range_filter: AvailableMatchesRangeFilter = Depends(),
+) -> Response:
+    """
+    Get all available matches between date_from and date_to (both included),
+    optionally filtered by an hour window and by reserve, grouped by date.
+    Answers 304 Not Modified when If-None-Match matches the ETag.
+    """
+    available_matches = (
+        await service_available_match_public.get_available_matches_in_range(
+            session, court_name, business_public_id, range_filter
+        )
+    )
+    return cached_json_response(request, available_matches, AVAILABILITY_CACHE_CONTROL)
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def stream_available_matches_events(
+    *,
+    court_name: str,
+    business_public_id: uuid.UUID,
+    date: date | None = None,
+) -> StreamingResponse:
+    """
+    Stream of server-sent events with the available matches created, reserved or
+    deleted in the court, optionally only those of a date.
+    """
+    return StreamingResponse(
+        service_availability_event.stream(business_public_id, court_name, date),
+        media_type="text/event-stream",
+        headers=AVAILABILITY_EVENTS_HEADERS,
+    )
 
 
 @router.patch(
@@ -110,11 +199,90 @@ async def reserve_available_match(
     business_public_id: uuid.UUID,
     date: date,
     hour: int,
+    hold_id: uuid.UUID | None = None,
 ) -> Any:
     """
-    Update an item.
+    Reserve the match. A match on hold can only be reserved with its hold_id.
     """
     available_match = await service_available_match_public.reserve_available_match(
-        session, court_name, business_public_id, date, hour
+        session, court_name, business_public_id, date, hour, hold_id
     )
     return available_match
+
+
+@router.patch(
+    "/consecutive",
+    response_model=AvailableMatchesPublic,
+    status_code=status.HTTP_200_OK,
+    responses={**AVAILABLE_DATE_RANGE_PATCH_RESPONSES},  # type: ignore[dict-item]
+)
+async def reserve_consecutive_available_matches(
+    *,
+    session: SessionDep,
+    court_name: str,
+    business_public_id: uuid.UUID,
+    date: date,
+    initial_hour: InitialHourQuery,
+    n_matches: int,
+    hold_id: uuid.UUID | None = None,
+) -> Any:
+    """
+    Reserve n_matches consecutive matches from initial_hour in one operation:
+    all of them are reserved, or none if any is missing, already reserved or on
+    hold (other than hold_id).
+    """
+    matches_in = AvailableMatchesHours(initial_hour=initial_hour, n_matches=n_matches)
+    available_matches = await service_available_match_public.reserve_available_matches(
+        session, court_name, business_public_id, date, matches_in, hold_id
+    )
+    return available_matches
+
+
+@router.post(
+    "/holds",
+    response_model=AvailableMatchesHoldPublic,
+    status_code=status.HTTP_201_CREATED,
+    responses={**AVAILABLE_DATE_HOLD_POST_RESPONSES},  # type: ignore[dict-item]
+)
+async def hold_available_matches(
+    *,
+    session: SessionDep,
+    court_name: str,
+    business_public_id: uuid.UUID,
+    date: date,
+    initial_hour: InitialHourQuery,
+    n_matches: int = 1,
+    hold_id: uuid.UUID | None = None,
+) -> Any:
+    """
+    Hold n_matches consecutive matches from initial_hour during a checkout,
+    all or none. Until expires_at only the hold_id can reserve them; holding
+    them again with the same hold_id extends the hold.
+    """
+    matches_in = AvailableMatchesHours(initial_hour=initial_hour, n_matches=n_matches)
+    return await service_available_match_public.hold_available_matches(
+        session, court_name, business_public_id, date, matches_in, hold_id
+    )
+
+
+@router.delete(
+    "/holds/{hold_id}",
+    response_model=None,
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={**AVAILABLE_DATE_HOLD_DELETE_RESPONSES},  # type: ignore[dict-item]
+)
+async def release_available_matches_hold(
+    *,
+    session: SessionDep,
+    court_name: str,
+    business_public_id: uuid.UUID,
+    date: date,
+    hold_id: uuid.UUID,
+) -> Response:
+    """
+    Release the matches of the hold, for instance when the checkout is cancelled.
+    """
+    await service_available_match.release_hold(
+        session, court_name, business_public_id, date, hold_id
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
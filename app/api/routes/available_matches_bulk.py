@@ -0,0 +1,81 @@
+import uuid
+from typing import Any
+
+from fastapi import APIRouter, BackgroundTasks, Request, status
+from fastapi.responses import JSONResponse
+
+from app.models.available_match_bulk import (
+    AvailableMatchesBulkCreate,
+    AvailableMatchesBulkJobPublic,
+    AvailableMatchesBulkJobStatus,
+)
+from app.services.available_match_bulk_service import AvailableMatchBulkService
+from app.utilities.dependencies import SessionDep
+from app.utilities.messages import (
+    AVAILABLE_DATE_BULK_GET_RESPONSES,
+    AVAILABLE_DATE_BULK_POST_RESPONSES,
+)
+
+router = APIRouter()
+
+service_available_match_bulk = AvailableMatchBulkService()
+
+
+@router.post(
+    "/",
+    response_model=AvailableMatchesBulkJobPublic,
+    status_code=status.HTTP_201_CREATED,
+    responses={**AVAILABLE_DATE_BULK_POST_RESPONSES},  # type: ignore[dict-item]
+)
+async def add_available_matches_bulk(
+    *,
+    request: Request,
+    session: SessionDep,
+    background_tasks: BackgroundTasks,
+    owner_id: uuid.UUID,
+    business_public_id: uuid.UUID,
+    bulk_in: AvailableMatchesBulkCreate,
+) -> Any:
+    """
+    Create the available matches of every court x date x hours of the request,
+    verifying the owner once. Hours already available are skipped.
+    Large requests are created in the background: responds 202 with the job,
+    whose progress is at the URL of the Location header. If the creation
+    fails in the request, responds 500 with the failed job.
+    """
+    job = await service_available_match_bulk.create_available_matches_bulk(
+        session, owner_id, business_public_id, bulk_in, background_tasks
+    )
+    public = AvailableMatchesBulkJobPublic.model_validate(job)
+    if public.status == AvailableMatchesBulkJobStatus.DONE:
+        return public
+    if public.status == AvailableMatchesBulkJobStatus.FAILED:
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content=public.model_dump(mode="json"),
+        )
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=public.model_dump(mode="json"),
+        headers={"Location": f"{request.url.path.rstrip('/')}/{job.job_public_id}"},
+    )
+
+
+@router.get(
+    "/{job_public_id}",
+    response_model=AvailableMatchesBulkJobPublic,
+    status_code=status.HTTP_200_OK,
+    responses={**AVAILABLE_DATE_BULK_GET_RESPONSES},  # type: ignore[dict-item]
+)
+async def get_available_matches_bulk_job(
+    *,
+    session: SessionDep,
+    business_public_id: uuid.UUID,
+    job_public_id: uuid.UUID,
+) -> Any:
+    """
+    Get the progress of a bulk creation: done_days out of total_days.
+    """
+    return await service_available_match_bulk.get_job(
+        session, business_public_id, job_public_id
+    )
@@ -0,0 +1,65 @@
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.models.available_match import (
+    AvailableMatchesSearchFilter,
+    AvailableMatchesSearchPublic,
+)
+from app.services.availability_event_service import AvailabilityEventService
+from app.services.available_match_public_service import AvailableMatchServicePublic
+from app.utilities.dependencies import SessionDep
+from app.utilities.http_cache import (
+    AVAILABILITY_CACHE_CONTROL,
+    AVAILABILITY_EVENTS_HEADERS,
+    cached_json_response,
+)
+from app.utilities.messages import AVAILABLE_DATE_SEARCH_RESPONSES
+
+router = APIRouter()
+
+service_available_match_public = AvailableMatchServicePublic()
+service_availability_event = AvailabilityEventService()
+
+
+@router.get(
+    "/",
+    response_model=AvailableMatchesSearchPublic,
+    status_code=status.HTTP_200_OK,
+    responses={**AVAILABLE_DATE_SEARCH_RESPONSES},  # type: ignore[dict-item]
+)
+async def search_available_matches(
+    *,
+    request: Request,
+    session: SessionDep,
+    search_filter: AvailableMatchesSearchFilter = Depends(),
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+) -> Response:
+    """
+    Search free available matches across every court, optionally filtered by
+    business_public_id or by an area (min/max latitude and longitude).
+    With keyset pagination: pass the returned next_cursor to get the next page.
+    Answers 304 Not Modified when If-None-Match matches the ETag of the page.
+    """
+    available_matches = await service_available_match_public.search_available_matches(
+        session, search_filter, cursor, limit
+    )
+    return cached_json_response(request, available_matches, AVAILABILITY_CACHE_CONTROL)
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def stream_available_matches_events(
+    *, business_public_id: uuid.UUID
+) -> StreamingResponse:
+    """
+    Stream of server-sent events with the available matches created, reserved or
+    deleted in every court of the business.
+    """
+    return StreamingResponse(
+        service_availability_event.stream(business_public_id),
+        media_type="text/event-stream",
+        headers=AVAILABILITY_EVENTS_HEADERS,
+    )
@@ -1,17 +1,22 @@
 import uuid
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
 from app.models.business import (
     BusinessCreate,
     BusinessesFilters,
+    BusinessesNearbyPublic,
     BusinessesPublic,
     BusinessPublic,
     BusinessUpdate,
+    NearbyFilter,
 )
 from app.services.business_service import BusinessService
 from app.utilities.dependencies import SessionDep
+from app.utilities.http_cache import LISTING_CACHE_CONTROL, cached_json_response
 from app.utilities.messages import BUSINESS_CREATE, BUSINESS_UPDATE
+from app.utilities.pagination import CountMode
 
 router = APIRouter()
 
@@ -37,16 +42,39 @@ async def create_business(
 @router.get("/", response_model=BusinessesPublic)
 async def read_businesses(
     *,
+    request: Request,
     session: SessionDep,
     businesses_filters: BusinessesFilters = Depends(),
-    skip: int = 0,
-    limit: int = 100,
-) -> BusinessesPublic:
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
+) -> Response:
     """
     Get all businesses, optionally filtered by owner_id and/or by business_public_id.
-    With pagination using skip and limit parameters.
+    With pagination using skip and limit parameters, or using the next_cursor
+    of the previous page as cursor.
+    The total count is exact, estimated from the planner statistics or not computed
+    (null) according to the count parameter.
+    Answers 304 Not Modified when If-None-Match matches the ETag of the page.
     """
-    return await service.get_businesses(session, businesses_filters, skip, limit)
+    businesses = await service.get_businesses(
+        session, businesses_filters, skip, limit, cursor, count
+    )
+    return cached_json_response(request, businesses, LISTING_CACHE_CONTROL)
+
+
+@router.get("/nearby", response_model=BusinessesNearbyPublic)
+async def read_businesses_nearby(
+    *,
+    session: SessionDep,
+    nearby_filter: NearbyFilter = Depends(),
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+) -> BusinessesNearbyPublic:
+    """
+    Get the businesses within radius_km of (lat, lng), closest first.
+    """
+    return await service.get_businesses_nearby(session, nearby_filter, limit)
 
 
 @router.patch(
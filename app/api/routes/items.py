@@ -1,13 +1,14 @@
 import uuid
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.models.item import ItemCreate, ItemPublic, ItemsPublic, ItemUpdate
 from app.models.message import Message
 from app.repository.items_repository import ItemsRepository
 from app.utilities.dependencies import SessionDep, get_user_id_param
 from app.utilities.messages import ITEM_RESPONSES, NOT_ENOUGH_PERMISSIONS
+from app.utilities.pagination import CountMode
 
 router = APIRouter()
 
@@ -20,14 +21,18 @@ router = APIRouter()
     dependencies=[Depends(get_user_id_param)],
 )
 async def read_items(
-    session: SessionDep, user_id: uuid.UUID, skip: int = 0, limit: int = 100
+    session: SessionDep,
+    user_id: uuid.UUID,
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
 ) -> Any:
     """
     Retrieve items.
     """
     repo = ItemsRepository(session)
-    items, count = await repo.get_items(user_id, skip, limit)
-    return ItemsPublic(data=items, count=count)
+    return await repo.get_items(user_id, skip, limit, cursor, count)
 
 
 @router.get(
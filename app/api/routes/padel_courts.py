@@ -1,7 +1,17 @@
 import uuid
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 
+from app.models.business import NearbyFilter
 from app.models.padel_court import (
     PadelCourtCreate,
     PadelCourtFilter,
@@ -20,7 +30,9 @@ from app.utilities.exceptions import (
     NotEnoughPermissionsException,
     UnauthorizedPadelCourtOperationException,
 )
+from app.utilities.http_cache import LISTING_CACHE_CONTROL, cached_json_response
 from app.utilities.messages import BUSINESS_RESPONSES, COURT_EXTENDED_GET, COURT_UPDATE
+from app.utilities.pagination import CountMode
 
 router = APIRouter()
 
@@ -63,15 +75,22 @@ async def create_padel_court(
 )
 async def read_padel_courts(
     *,
+    request: Request,
     session: SessionDep,
     owner_id: uuid.UUID = None,
-    skip: int = 0,
-    limit: int = 100,
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: str | None = None,
+    count: CountMode | None = None,
     court_filters: PadelCourtFilter = Depends(),
-) -> PadelCourtsPublicExtended:
+) -> Response:
     """
     Get all padel courts, optionally filtered by business_public_id.
-    With pagination using skip and limit parameters.
+    With pagination using skip and limit parameters, or using the next_cursor
+    of the previous page as cursor.
+    Without the count parameter count is the number of courts in the page; with it,
+    the total count is exact, estimated or not computed (null).
+    Answers 304 Not Modified when If-None-Match matches the ETag of the page.
     """
     if court_filters.is_valid_filter_for_business_public_id(owner_id):
         raise HTTPException(
@@ -79,11 +98,25 @@ async def read_padel_courts(
             detail="Both business_public_id and owner_id must be provided together or both omitted.",
         )
 
-    public_courts = await service.get_padel_courts(
-        session, owner_id, skip, limit, court_filters
+    padel_courts = await PadelCourtExtendedService().get_public_courts_extended(
+        session, owner_id, skip, limit, court_filters, cursor, count
     )
-    return await PadelCourtExtendedService().get_public_courts_extended(
-        session, public_courts
+    return cached_json_response(request, padel_courts, LISTING_CACHE_CONTROL)
+
+
+@router.get("/nearby", response_model=PadelCourtsPublicExtended)
+async def read_padel_courts_nearby(
+    *,
+    session: SessionDep,
+    nearby_filter: NearbyFilter = Depends(),
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+) -> PadelCourtsPublicExtended:
+    """
+    Get the padel courts whose business is within radius_km of (lat, lng),
+    closest first.
+    """
+    return await PadelCourtExtendedService().get_public_courts_nearby(
+        session, nearby_filter, limit
     )
 
 
@@ -21,8 +21,47 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     POSTGRES_DB_TESTING: str
+    POSTGRES_POOL_SIZE: int = 10
+    POSTGRES_MAX_OVERFLOW: int = 20
+    POSTGRES_POOL_TIMEOUT: int = 30
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = True
     API_KEY: str
 
+    # Available matches
+    # Storage of the available matches: "rows" keeps one row per match, "bitmap"
+    # one row per court and date with a bit per hour (see AvailabilityDay).
+    AVAILABILITY_STORAGE: Literal["rows", "bitmap"] = "rows"
+    AVAILABLE_MATCHES_MAX_RANGE_DAYS: int = 31
+    # Weekly templates are materialized on the first read of a date (lazy) and
+    # by a scheduler in every worker, WEEKS_AHEAD weeks ahead every INTERVAL
+    # seconds.
+    AVAILABILITY_TEMPLATES_LAZY: bool = True
+    AVAILABILITY_TEMPLATES_SCHEDULER: bool = True
+    AVAILABILITY_TEMPLATES_WEEKS_AHEAD: int = 2
+    AVAILABILITY_TEMPLATES_INTERVAL: int = 60 * 60
+    # Bulk creation: longest date range, and number of court dates created in
+    # the request itself. Larger ones run as a background job, in batches.
+    AVAILABLE_MATCHES_BULK_MAX_DAYS: int = 366
+    AVAILABLE_MATCHES_BULK_SYNC_MAX_DAYS: int = 500
+    AVAILABLE_MATCHES_BULK_BATCH_DAYS: int = 1000
+    # Checkout holds last HOLD_TTL seconds. The sweeper releases the expired
+    # ones every SWEEP_INTERVAL seconds, SWEEP_BATCH per statement.
+    AVAILABLE_MATCHES_HOLD_TTL: int = 5 * 60
+    AVAILABLE_MATCHES_HOLDS_SWEEPER: bool = True
+    AVAILABLE_MATCHES_HOLDS_SWEEP_INTERVAL: int = 60
+    AVAILABLE_MATCHES_HOLDS_SWEEP_BATCH: int = 1000
+
+    # Nearby search
+    NEARBY_MAX_RADIUS_KM: float = 50.0
+
+    # Outbound HTTP clients, shared per upstream host
+    HTTP_CLIENT_TIMEOUT: float = 5.0
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 5.0
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0
+
     # Services
     ITEMS_SERVICE_HOST: str
     ITEMS_SERVICE_PORT: int | None = None
@@ -30,6 +69,25 @@ class Settings(BaseSettings):
 
     # Google
     GOOGLE_API_KEY: str
+    GEOCODING_CACHE_MAX_SIZE: int = 10000
+    GEOCODING_CACHE_TTL: int = 30 * 24 * 60 * 60
+    GEOCODING_CACHE_NEGATIVE_TTL: int = 24 * 60 * 60
+    GEOCODING_CACHE_PERSISTENT: bool = True
+
+    # Business and court read cache. "redis" is shared by every worker (needs the
+    # redis extra and REDIS_URL). "memory" is per worker: writes only invalidate
+    # the worker that served them, so use it only with a single worker. Unset, it
+    # is "redis" if REDIS_URL is set and "none" otherwise.
+    ENTITY_CACHE_BACKEND: Literal["memory", "redis", "none"] | None = None
+    ENTITY_CACHE_MAX_SIZE: int = 10000
+    ENTITY_CACHE_TTL: int = 5 * 60
+    REDIS_URL: str | None = None
+
+    # Availability event stream. "memory" only reaches the subscribers of the
+    # same worker, "postgres" reaches every worker through LISTEN/NOTIFY.
+    AVAILABILITY_EVENTS_BACKEND: Literal["memory", "postgres"] = "memory"
+    AVAILABILITY_EVENTS_QUEUE_SIZE: int = 100
+    AVAILABILITY_EVENTS_HEARTBEAT: float = 15
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,24 +1,75 @@
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlmodel import SQLModel
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
-from app.models import AvailableMatch, Business, Item, PadelCourt  # noqa: F401
+from app.models import (  # noqa: F401
+    AvailabilityDay,
+    AvailabilityTemplate,
+    AvailabilityTemplateDate,
+    AvailableMatch,
+    AvailableMatchesBulkJob,
+    Business,
+    GeocodedAddress,
+    Item,
+    PadelCourt,
+)
+
+_engine: AsyncEngine | None = None
+_session_maker: async_sessionmaker[AsyncSession] | None = None
 
 
 def get_async_engine(
     engine_url: str = str(settings.SQLALCHEMY_DATABASE_URI),
 ) -> AsyncEngine:
-    return create_async_engine(engine_url)
+    return create_async_engine(
+        engine_url,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+    )
 
 
-async def init_db(engine_url: str = str(settings.SQLALCHEMY_DATABASE_URI)) -> None:
-    engine = get_async_engine(engine_url)
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+def open_engine(
+    engine_url: str = str(settings.SQLALCHEMY_DATABASE_URI),
+) -> AsyncEngine:
+    """Create the process-wide engine and session factory if not created yet."""
+    global _engine, _session_maker
+    if _engine is None:
+        _engine = get_async_engine(engine_url)
+        _session_maker = async_sessionmaker(
+            bind=_engine, class_=AsyncSession, expire_on_commit=False
+        )
+    return _engine
+
+
+def get_engine() -> AsyncEngine:
+    """Return the process-wide engine, opening it on first use."""
+    if _engine is None:
+        return open_engine()
+    return _engine
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Return the process-wide session factory, opening the engine on first use."""
+    if _session_maker is None:
+        open_engine()
+    assert _session_maker is not None
+    return _session_maker
+
+
+async def close_engine() -> None:
+    """Dispose the process-wide engine, closing every pooled connection."""
+    global _engine, _session_maker
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_maker = None
 
 
-async def restart_db(engine_url: str = str(settings.SQLALCHEMY_DATABASE_URI)) -> None:
-    engine = get_async_engine(engine_url)
+async def restart_db(engine: AsyncEngine | None = None) -> None:
+    engine = engine or get_engine()
     async with engine.begin() as conn:
         await conn.exec_driver_sql("DROP SCHEMA public CASCADE;")
         await conn.exec_driver_sql("CREATE SCHEMA public;")
@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import Depends, FastAPI
 from fastapi.routing import APIRoute
@@ -6,8 +7,15 @@ from fastapi.routing import APIRoute
 from app.api.main import api_router
 from app.api.middlewares.main import HeaderToQueryMiddleware
 from app.core.config import settings
-from app.core.db import init_db
+from app.core.db import close_engine, open_engine
+from app.migrations import check_schema_version
+from app.services.availability_template_service import materialize_templates_job
+from app.services.available_match_service import release_expired_holds_job
+from app.services.base_service import close_http_clients
 from app.utilities.dependencies import get_token_header
+from app.utilities.entity_cache import close_entity_cache
+from app.utilities.events import close_event_broker
+from app.utilities.scheduler import run_periodically
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -16,9 +24,36 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):  # type:ignore[no-untyped-def]
-    # await restart_db()
-    await init_db()
+    # The schema is migrated before the workers start (python -m app.migrations
+    # upgrade), each worker only checks it is up to date.
+    await check_schema_version(open_engine())
+    periodic_tasks = []
+    if settings.AVAILABILITY_TEMPLATES_SCHEDULER:
+        periodic_tasks.append(
+            asyncio.create_task(
+                run_periodically(
+                    materialize_templates_job, settings.AVAILABILITY_TEMPLATES_INTERVAL
+                )
+            )
+        )
+    if settings.AVAILABLE_MATCHES_HOLDS_SWEEPER:
+        periodic_tasks.append(
+            asyncio.create_task(
+                run_periodically(
+                    release_expired_holds_job,
+                    settings.AVAILABLE_MATCHES_HOLDS_SWEEP_INTERVAL,
+                )
+            )
+        )
     yield
+    for task in periodic_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await close_http_clients()
+    await close_entity_cache()
+    await close_event_broker()
+    await close_engine()
 
 
 app = FastAPI(
@@ -0,0 +1,19 @@
+from app.migrations.migration import Migration
+from app.migrations.runner import (
+    SchemaVersionError,
+    check_schema_version,
+    get_latest_version,
+    render_sql,
+    upgrade,
+)
+from app.migrations.versions import MIGRATIONS
+
+__all__ = [
+    "MIGRATIONS",
+    "Migration",
+    "SchemaVersionError",
+    "check_schema_version",
+    "get_latest_version",
+    "render_sql",
+    "upgrade",
+]
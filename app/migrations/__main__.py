@@ -0,0 +1,64 @@
+"""Schema migrations CLI, run it once before starting the workers.
+
+python -m app.migrations upgrade [--target VERSION]
+python -m app.migrations current
+python -m app.migrations check
+python -m app.migrations sql [--from VERSION] [--target VERSION]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from app.core.db import close_engine, open_engine
+from app.migrations.runner import (
+    SchemaVersionError,
+    check_schema_version,
+    get_current_version,
+    render_sql,
+    upgrade,
+)
+
+
+async def run(args: argparse.Namespace) -> int:
+    engine = open_engine()
+    try:
+        if args.command == "upgrade":
+            applied = await upgrade(engine, args.target)
+            print(f"Applied migrations: {applied or 'none'}")
+        elif args.command == "current":
+            async with engine.connect() as conn:
+                print(await get_current_version(conn))
+        elif args.command == "check":
+            try:
+                print(await check_schema_version(engine))
+            except SchemaVersionError as e:
+                print(e, file=sys.stderr)
+                return 1
+    finally:
+        await close_engine()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.migrations")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    upgrade_parser = subparsers.add_parser("upgrade", help="apply pending migrations")
+    upgrade_parser.add_argument("--target", type=int, default=None)
+    subparsers.add_parser("current", help="print the applied version")
+    subparsers.add_parser("check", help="fail if there are pending migrations")
+    sql_parser = subparsers.add_parser("sql", help="print the migrations as SQL")
+    sql_parser.add_argument("--from", dest="from_version", type=int, default=0)
+    sql_parser.add_argument("--target", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.command == "sql":
+        print(render_sql(args.from_version, args.target), end="")
+        return 0
+    logging.basicConfig(level=logging.INFO)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
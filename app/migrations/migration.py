@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A versioned schema change, as plain SQL so it can also be run offline.
+
+    Statements of a transactional migration run in a single transaction. The
+    ones that cannot run inside a transaction (CREATE INDEX CONCURRENTLY) go in
+    a non-transactional migration, which runs each statement on its own, so
+    they must be idempotent (IF NOT EXISTS) to be retried safely.
+    """
+
+    version: int
+    description: str
+    statements: tuple[str, ...]
+    transactional: bool = True
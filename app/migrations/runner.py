@@ -0,0 +1,137 @@
+import logging
+import textwrap
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.migrations.migration import Migration
+from app.migrations.versions import MIGRATIONS
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_MIGRATIONS_TABLE_NAME = "schema_migrations"
+# Any constant works, it only has to be the same for every runner.
+MIGRATIONS_LOCK_ID = 7_310_214
+
+CREATE_SCHEMA_MIGRATIONS_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {SCHEMA_MIGRATIONS_TABLE_NAME} (
+    version INTEGER NOT NULL PRIMARY KEY,
+    description VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+)
+"""
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+def get_latest_version(migrations: list[Migration] = MIGRATIONS) -> int:
+    return max((migration.version for migration in migrations), default=0)
+
+
+def _record_version_sql(migration: Migration) -> str:
+    description = migration.description.replace("'", "''")
+    return (
+        f"INSERT INTO {SCHEMA_MIGRATIONS_TABLE_NAME} (version, description) "
+        f"VALUES ({migration.version}, '{description}')"
+    )
+
+
+async def get_current_version(conn: AsyncConnection) -> int:
+    """Last applied version, 0 for a database without migrations."""
+    result = await conn.exec_driver_sql(
+        f"SELECT to_regclass('{SCHEMA_MIGRATIONS_TABLE_NAME}') IS NOT NULL"
+    )
+    if not result.scalar_one():
+        return 0
+    result = await conn.exec_driver_sql(
+        f"SELECT coalesce(max(version), 0) FROM {SCHEMA_MIGRATIONS_TABLE_NAME}"
+    )
+    return int(result.scalar_one())
+
+
+async def _apply(engine: AsyncEngine, migration: Migration) -> None:
+    if migration.transactional:
+        async with engine.begin() as conn:
+            for statement in migration.statements:
+                await conn.exec_driver_sql(statement)
+            await conn.exec_driver_sql(_record_version_sql(migration))
+        return
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for statement in migration.statements:
+            await conn.exec_driver_sql(statement)
+        await conn.exec_driver_sql(_record_version_sql(migration))
+
+
+async def upgrade(
+    engine: AsyncEngine,
+    target: int | None = None,
+    migrations: list[Migration] = MIGRATIONS,
+) -> list[int]:
+    """Apply the pending migrations up to target (the latest by default).
+
+    Runners are serialized with an advisory lock, so running it from several
+    places at once is safe. Returns the applied versions.
+    """
+    target = get_latest_version(migrations) if target is None else target
+    applied = []
+    async with engine.connect() as lock_conn:
+        lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+        await lock_conn.exec_driver_sql(
+            f"SELECT pg_advisory_lock({MIGRATIONS_LOCK_ID})"
+        )
+        try:
+            await lock_conn.exec_driver_sql(CREATE_SCHEMA_MIGRATIONS_TABLE)
+            current = await get_current_version(lock_conn)
+            for migration in migrations:
+                if current < migration.version <= target:
+                    logger.info(
+                        "Applying migration %s: %s",
+                        migration.version,
+                        migration.description,
+                    )
+                    await _apply(engine, migration)
+                    applied.append(migration.version)
+        finally:
+            await lock_conn.exec_driver_sql(
+                f"SELECT pg_advisory_unlock({MIGRATIONS_LOCK_ID})"
+            )
+    return applied
+
+
+async def check_schema_version(
+    engine: AsyncEngine, migrations: list[Migration] = MIGRATIONS
+) -> int:
+    """Fail if the database is behind the migrations of this code."""
+    async with engine.connect() as conn:
+        current = await get_current_version(conn)
+    latest = get_latest_version(migrations)
+    if current < latest:
+        raise SchemaVersionError(
+            f"Database schema is at version {current} but version {latest} is "
+            "required, run `python -m app.migrations upgrade` first."
+        )
+    return current
+
+
+def render_sql(
+    from_version: int = 0,
+    target: int | None = None,
+    migrations: list[Migration] = MIGRATIONS,
+) -> str:
+    """SQL script of the migrations after from_version, to run it offline."""
+    target = get_latest_version(migrations) if target is None else target
+    lines = [textwrap.dedent(CREATE_SCHEMA_MIGRATIONS_TABLE).strip() + ";"]
+    for migration in migrations:
+        if not from_version < migration.version <= target:
+            continue
+        lines.append(f"\n-- {migration.version}: {migration.description}")
+        if migration.transactional:
+            lines.append("BEGIN;")
+        for statement in migration.statements:
+            lines.append(textwrap.dedent(statement).strip() + ";")
+        lines.append(_record_version_sql(migration) + ";")
+        if migration.transactional:
+            lines.append("COMMIT;")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,19 @@
+from app.migrations.migration import Migration
+from app.migrations.versions import (
+    v0001_initial_schema,
+    v0002_lookup_indexes,
+    v0003_availability_days,
+    v0004_availability_templates,
+    v0005_available_matches_bulk_jobs,
+    v0006_available_match_holds,
+)
+
+# Every migration, in the order they are applied. Append new ones at the end.
+MIGRATIONS: list[Migration] = [
+    v0001_initial_schema.MIGRATION,
+    v0002_lookup_indexes.MIGRATION,
+    v0003_availability_days.MIGRATION,
+    v0004_availability_templates.MIGRATION,
+    v0005_available_matches_bulk_jobs.MIGRATION,
+    v0006_available_match_holds.MIGRATION,
+]
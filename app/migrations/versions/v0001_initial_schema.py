@@ -0,0 +1,70 @@
+from app.migrations.migration import Migration
+
+# Schema created by SQLModel.metadata.create_all before migrations existed,
+# with IF NOT EXISTS so databases created that way are adopted as they are.
+MIGRATION = Migration(
+    version=1,
+    description="initial schema",
+    statements=(
+        """
+        CREATE TABLE IF NOT EXISTS businesses (
+            business_public_id UUID NOT NULL,
+            owner_id UUID NOT NULL,
+            latitude FLOAT NOT NULL,
+            longitude FLOAT NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            location VARCHAR(255) NOT NULL,
+            id SERIAL NOT NULL,
+            PRIMARY KEY (id),
+            UNIQUE (business_public_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS padel_courts (
+            court_public_id UUID NOT NULL,
+            business_public_id UUID NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            price_per_hour NUMERIC NOT NULL,
+            id SERIAL NOT NULL,
+            PRIMARY KEY (id),
+            CONSTRAINT uq_padel_court UNIQUE (name, business_public_id, court_public_id),
+            UNIQUE (court_public_id),
+            FOREIGN KEY (business_public_id) REFERENCES businesses (business_public_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS padel_court_available_matches (
+            court_name VARCHAR(255) NOT NULL,
+            court_public_id UUID NOT NULL,
+            business_public_id UUID NOT NULL,
+            date DATE NOT NULL,
+            initial_hour INTEGER NOT NULL,
+            reserve BOOLEAN NOT NULL,
+            id SERIAL NOT NULL,
+            PRIMARY KEY (id),
+            CONSTRAINT uq_available_match
+                UNIQUE (court_name, business_public_id, initial_hour, date)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS items (
+            description VARCHAR(255),
+            id UUID NOT NULL,
+            title VARCHAR(255) NOT NULL,
+            owner_id UUID NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_items_owner_id ON items (owner_id)",
+        """
+        CREATE TABLE IF NOT EXISTS geocoding_cache (
+            address_key VARCHAR(255) NOT NULL,
+            longitude FLOAT,
+            latitude FLOAT,
+            is_valid BOOLEAN NOT NULL,
+            expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (address_key)
+        )
+        """,
+    ),
+)
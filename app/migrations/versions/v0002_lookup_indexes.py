@@ -0,0 +1,36 @@
+from app.migrations.migration import Migration
+
+# Built concurrently so tables stay writable while the indexes are created. If
+# a statement fails midway it leaves an INVALID index behind, which IF NOT
+# EXISTS would skip: drop it before running the migration again.
+MIGRATION = Migration(
+    version=2,
+    description="lookup indexes",
+    transactional=False,
+    statements=(
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_businesses_latitude_longitude
+        ON businesses (latitude, longitude)
+        """,
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_businesses_owner_id_id
+        ON businesses (owner_id, id)
+        """,
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_padel_courts_business_public_id_name
+        ON padel_courts (business_public_id, name)
+        """,
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS
+        ix_padel_court_available_matches_business_court_date_hour
+        ON padel_court_available_matches
+        (business_public_id, court_name, date, initial_hour)
+        """,
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS
+        ix_padel_court_available_matches_unreserved
+        ON padel_court_available_matches (date, initial_hour, id)
+        WHERE NOT reserve
+        """,
+    ),
+)
@@ -0,0 +1,41 @@
+from app.migrations.migration import Migration
+
+# Bitmap storage of the available matches (AVAILABILITY_STORAGE=bitmap), filled
+# with the matches that exist when it is created.
+MIGRATION = Migration(
+    version=3,
+    description="availability days",
+    statements=(
+        """
+        CREATE TABLE IF NOT EXISTS padel_court_availability_days (
+            court_name VARCHAR(255) NOT NULL,
+            court_public_id UUID NOT NULL,
+            business_public_id UUID NOT NULL,
+            date DATE NOT NULL,
+            offered_mask INTEGER NOT NULL,
+            reserved_mask INTEGER NOT NULL,
+            id SERIAL NOT NULL,
+            PRIMARY KEY (id),
+            CONSTRAINT uq_availability_day
+                UNIQUE (business_public_id, court_name, date)
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_padel_court_availability_days_free
+        ON padel_court_availability_days (date, id)
+        WHERE offered_mask <> reserved_mask
+        """,
+        """
+        INSERT INTO padel_court_availability_days (
+            court_name, court_public_id, business_public_id, date,
+            offered_mask, reserved_mask
+        )
+        SELECT court_name, court_public_id, business_public_id, date,
+            bit_or(1 << initial_hour),
+            bit_or(CASE WHEN reserve THEN 1 << initial_hour ELSE 0 END)
+        FROM padel_court_available_matches
+        GROUP BY business_public_id, court_name, court_public_id, date
+        ON CONFLICT ON CONSTRAINT uq_availability_day DO NOTHING
+        """,
+    ),
+)
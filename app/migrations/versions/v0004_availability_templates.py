@@ -0,0 +1,34 @@
+from app.migrations.migration import Migration
+
+# Weekly availability templates and the dates already materialized from them.
+MIGRATION = Migration(
+    version=4,
+    description="availability templates",
+    statements=(
+        """
+        CREATE TABLE IF NOT EXISTS padel_court_availability_templates (
+            court_name VARCHAR(255) NOT NULL,
+            court_public_id UUID NOT NULL,
+            business_public_id UUID NOT NULL,
+            weekday INTEGER NOT NULL,
+            hours_mask INTEGER NOT NULL,
+            id SERIAL NOT NULL,
+            PRIMARY KEY (id),
+            CONSTRAINT uq_availability_template
+                UNIQUE (business_public_id, court_name, weekday)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS padel_court_availability_template_dates (
+            court_name VARCHAR(255) NOT NULL,
+            business_public_id UUID NOT NULL,
+            date DATE NOT NULL,
+            skipped BOOLEAN NOT NULL,
+            id SERIAL NOT NULL,
+            PRIMARY KEY (id),
+            CONSTRAINT uq_availability_template_date
+                UNIQUE (business_public_id, court_name, date)
+        )
+        """,
+    ),
+)
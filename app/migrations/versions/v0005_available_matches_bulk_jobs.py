@@ -0,0 +1,23 @@
+from app.migrations.migration import Migration
+
+# Progress of the bulk creations of available matches.
+MIGRATION = Migration(
+    version=5,
+    description="available matches bulk jobs",
+    statements=(
+        """
+        CREATE TABLE IF NOT EXISTS available_matches_bulk_jobs (
+            job_public_id UUID NOT NULL,
+            business_public_id UUID NOT NULL,
+            status VARCHAR(16) NOT NULL,
+            total_days INTEGER NOT NULL,
+            done_days INTEGER NOT NULL,
+            error VARCHAR(255),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            id SERIAL NOT NULL,
+            PRIMARY KEY (id),
+            UNIQUE (job_public_id)
+        )
+        """,
+    ),
+)
@@ -0,0 +1,23 @@
+from app.migrations.migration import Migration
+
+# Checkout holds of the available matches. The columns are nullable without
+# default, so adding them does not rewrite the table; the index of the sweeper
+# is built concurrently.
+MIGRATION = Migration(
+    version=6,
+    description="available match holds",
+    transactional=False,
+    statements=(
+        """
+        ALTER TABLE padel_court_available_matches
+        ADD COLUMN IF NOT EXISTS hold_id UUID,
+        ADD COLUMN IF NOT EXISTS hold_expires_at TIMESTAMP WITH TIME ZONE
+        """,
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS
+        ix_padel_court_available_matches_hold_expires_at
+        ON padel_court_available_matches (hold_expires_at)
+        WHERE hold_expires_at IS NOT NULL
+        """,
+    ),
+)
@@ -1,6 +1,23 @@
+from app.models.availability_day import AvailabilityDay
+from app.models.availability_template import (
+    AvailabilityTemplate,
+    AvailabilityTemplateDate,
+)
 from app.models.available_match import AvailableMatch
+from app.models.available_match_bulk import AvailableMatchesBulkJob
 from app.models.business import Business
+from app.models.geocoding import GeocodedAddress
 from app.models.item import Item
 from app.models.padel_court import PadelCourt
 
-__all__ = ["AvailableMatch", "Business", "Item", "PadelCourt"]
+__all__ = [
+    "AvailabilityDay",
+    "AvailabilityTemplate",
+    "AvailabilityTemplateDate",
+    "AvailableMatch",
+    "AvailableMatchesBulkJob",
+    "Business",
+    "GeocodedAddress",
+    "Item",
+    "PadelCourt",
+]
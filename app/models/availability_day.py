@@ -0,0 +1,69 @@
+import datetime
+import uuid
+
+from sqlalchemy import Index, UniqueConstraint, text
+from sqlmodel import Field, SQLModel
+
+from app.models.available_match import AvailableMatch
+
+AVAILABILITY_DAY_TABLE_NAME = "padel_court_availability_days"
+HOURS_IN_DAY = 24
+
+
+def hours_to_mask(hours: list[int]) -> int:
+    mask = 0
+    for hour in hours:
+        mask |= 1 << hour
+    return mask
+
+
+def mask_to_hours(mask: int) -> list[int]:
+    return [hour for hour in range(HOURS_IN_DAY) if mask & (1 << hour)]
+
+
+# Available matches of a court in a date, one bit per hour: bit h of
+# offered_mask is the match starting at h, the same bit of reserved_mask
+# whether it is reserved. Compact alternative to one AvailableMatch per hour.
+class AvailabilityDay(SQLModel, table=True):
+    __tablename__ = AVAILABILITY_DAY_TABLE_NAME
+    id: int = Field(primary_key=True)
+    court_name: str = Field(min_length=1, max_length=255, nullable=False)
+    court_public_id: uuid.UUID = Field(nullable=False)
+    business_public_id: uuid.UUID = Field(nullable=False)
+    date: datetime.date = Field()
+    offered_mask: int = Field(default=0)
+    reserved_mask: int = Field(default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "business_public_id", "court_name", "date", name="uq_availability_day"
+        ),
+        # Cross-court search, only the days with some free match.
+        Index(
+            f"ix_{AVAILABILITY_DAY_TABLE_NAME}_free",
+            "date",
+            "id",
+            postgresql_where=text("offered_mask <> reserved_mask"),
+        ),
+    )
+
+    def match_id(self, hour: int) -> int:
+        """Stable id of the match of the hour, as AvailableMatch.id."""
+        return self.id * HOURS_IN_DAY + hour
+
+    def to_available_match(self, hour: int) -> AvailableMatch:
+        # Values come from a stored row, validating them again is pure overhead
+        return AvailableMatch.model_construct(
+            id=self.match_id(hour),
+            court_name=self.court_name,
+            court_public_id=self.court_public_id,
+            business_public_id=self.business_public_id,
+            date=self.date,
+            initial_hour=hour,
+            reserve=bool(self.reserved_mask & (1 << hour)),
+        )
+
+    def to_available_matches(self, mask: int | None = None) -> list[AvailableMatch]:
+        """Matches of the offered hours, only those also in mask if given."""
+        offered_mask = self.offered_mask if mask is None else self.offered_mask & mask
+        return [self.to_available_match(hour) for hour in mask_to_hours(offered_mask)]
@@ -0,0 +1,101 @@
+import datetime
+import uuid
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+from app.models.availability_day import hours_to_mask, mask_to_hours
+from app.models.available_match import AvailableMatchesHours
+
+AVAILABILITY_TEMPLATE_TABLE_NAME = "padel_court_availability_templates"
+AVAILABILITY_TEMPLATE_DATE_TABLE_NAME = "padel_court_availability_template_dates"
+
+
+# Matches offered every week in a weekday (0 is monday, as date.weekday())
+class AvailabilityTemplateDayCreate(AvailableMatchesHours):
+    weekday: int = Field(ge=0, le=6)
+
+
+class AvailabilityTemplateCreate(SQLModel):
+    days: list[AvailabilityTemplateDayCreate]
+
+    def get_masks(self) -> dict[int, int]:
+        """Offered hours of each weekday, as AvailabilityDay.offered_mask."""
+        masks: dict[int, int] = {}
+        for day in self.days:
+            masks[day.weekday] = masks.get(day.weekday, 0) | hours_to_mask(
+                day.get_hours()
+            )
+        return masks
+
+
+# Database model, one row per court and weekday with the offered hours
+class AvailabilityTemplate(SQLModel, table=True):
+    __tablename__ = AVAILABILITY_TEMPLATE_TABLE_NAME
+    id: int = Field(primary_key=True)
+    court_name: str = Field(min_length=1, max_length=255, nullable=False)
+    court_public_id: uuid.UUID = Field(nullable=False)
+    business_public_id: uuid.UUID = Field(nullable=False)
+    weekday: int = Field(ge=0, le=6)
+    hours_mask: int = Field(default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "business_public_id",
+            "court_name",
+            "weekday",
+            name="uq_availability_template",
+        ),
+    )
+
+    def to_days(self) -> list[AvailabilityTemplateDayCreate]:
+        """The offered hours as runs of consecutive matches."""
+        days: list[AvailabilityTemplateDayCreate] = []
+        for hour in mask_to_hours(self.hours_mask):
+            last_day = days[-1] if days else None
+            if last_day and last_day.initial_hour + last_day.n_matches == hour:
+                last_day.n_matches += 1
+            else:
+                days.append(
+                    AvailabilityTemplateDayCreate(
+                        weekday=self.weekday, initial_hour=hour, n_matches=1
+                    )
+                )
+        return days
+
+
+# Dates of a court already handled: materialized from the template, or skipped
+# if they are an exception. Each date is materialized at most once, so matches
+# deleted by the owner are not created again.
+class AvailabilityTemplateDate(SQLModel, table=True):
+    __tablename__ = AVAILABILITY_TEMPLATE_DATE_TABLE_NAME
+    id: int = Field(primary_key=True)
+    court_name: str = Field(min_length=1, max_length=255, nullable=False)
+    business_public_id: uuid.UUID = Field(nullable=False)
+    date: datetime.date = Field()
+    skipped: bool = Field(default=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "business_public_id",
+            "court_name",
+            "date",
+            name="uq_availability_template_date",
+        ),
+    )
+
+
+class AvailabilityTemplatePublic(SQLModel):
+    days: list[AvailabilityTemplateDayCreate]
+    exceptions: list[datetime.date]
+
+    @classmethod
+    def from_private(
+        cls, templates: list[AvailabilityTemplate], exceptions: list[datetime.date]
+    ) -> "AvailabilityTemplatePublic":
+        days = [
+            day
+            for template in sorted(templates, key=lambda template: template.weekday)
+            for day in template.to_days()
+        ]
+        return cls(days=days, exceptions=exceptions)
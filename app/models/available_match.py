@@ -1,10 +1,20 @@
 import datetime
 import uuid
+from enum import Enum
 from typing import ClassVar
 
-from sqlalchemy import ForeignKeyConstraint, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKeyConstraint,
+    Index,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.schema import SchemaItem
 from sqlmodel import Field, SQLModel
 
+from app.core.config import settings
 from app.utilities.exceptions import NotAcceptableException
 
 AVAILABILITY_TABLE_NAME = "padel_court_available_matches"
@@ -22,7 +32,7 @@ class AvailableMatchBase(SQLModel):
     date: datetime.date = Field()
     initial_hour: int = Field(default=0, ge=TIME_LIMIT_MIN, le=TIME_LIMIT_MAX)
 
-    __table_args__ = (
+    __table_args__: ClassVar[tuple[SchemaItem, ...]] = (
         ForeignKeyConstraint(
             [
                 "business_public_id",
@@ -39,19 +49,31 @@ class AvailableMatchBase(SQLModel):
     )
 
 
-# Properties to receive on item creation
-class AvailableMatchCreate(AvailableMatchBase):
+# Consecutive matches of a date, from initial_hour
+class AvailableMatchesHours(SQLModel):
+    initial_hour: int = Field(
+        default=AvailableMatchBase.TIME_LIMIT_MIN,
+        ge=AvailableMatchBase.TIME_LIMIT_MIN,
+        le=AvailableMatchBase.TIME_LIMIT_MAX,
+    )
     n_matches: int = Field(default=1)
 
-    def validate_create(self) -> None:
+    def get_hours(self) -> list[int]:
         if self.n_matches <= 0:
             raise NotAcceptableException("n_matches no puede ser menor a 0")
-        if (
-            self.n_matches * self.TIME_OF_MATCH
-        ) + self.initial_hour > self.TIME_LIMIT_MAX + 1:
+        time_of_match = AvailableMatchBase.TIME_OF_MATCH
+        end_hour = self.initial_hour + self.n_matches * time_of_match
+        if end_hour > AvailableMatchBase.TIME_LIMIT_MAX + 1:
             raise NotAcceptableException(
                 "n_matches no puede exceder el horario de un día"
             )
+        return list(range(self.initial_hour, end_hour, time_of_match))
+
+
+# Properties to receive on item creation
+class AvailableMatchCreate(AvailableMatchBase, AvailableMatchesHours):
+    def validate_create(self) -> None:
+        self.get_hours()
 
 
 # Database model, database table inferred from class name
@@ -59,6 +81,13 @@ class AvailableMatch(AvailableMatchBase, table=True):
     __tablename__ = AVAILABILITY_TABLE_NAME
     reserve: bool = Field(default=False)
     id: int = Field(primary_key=True)
+    # Temporary hold during a checkout: the match is not free until it expires,
+    # only the holder (hold_id) can reserve it. Expired holds count as free even
+    # before the sweeper clears them.
+    hold_id: uuid.UUID | None = Field(default=None)
+    hold_expires_at: datetime.datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
 
     __table_args__ = (
         UniqueConstraint(
@@ -68,6 +97,28 @@ class AvailableMatch(AvailableMatchBase, table=True):
             "date",
             name="uq_available_match",
         ),
+        # Every per-court lookup filters by court, then date and hour.
+        Index(
+            f"ix_{AVAILABILITY_TABLE_NAME}_business_court_date_hour",
+            "business_public_id",
+            "court_name",
+            "date",
+            "initial_hour",
+        ),
+        # Cross-court search of free matches, in its (date, hour, id) order.
+        Index(
+            f"ix_{AVAILABILITY_TABLE_NAME}_unreserved",
+            "date",
+            "initial_hour",
+            "id",
+            postgresql_where=text("NOT reserve"),
+        ),
+        # Sweeper of the expired holds, only the matches on hold.
+        Index(
+            f"ix_{AVAILABILITY_TABLE_NAME}_hold_expires_at",
+            "hold_expires_at",
+            postgresql_where=text("hold_expires_at IS NOT NULL"),
+        ),
     )
 
     @classmethod
@@ -87,10 +138,18 @@ class AvailableMatch(AvailableMatchBase, table=True):
     def is_reserved(self) -> bool:
         return self.reserve
 
+    def is_held(self, now: datetime.datetime) -> bool:
+        return (
+            not self.reserve
+            and self.hold_expires_at is not None
+            and self.hold_expires_at > now
+        )
+
 
 # Properties to return via API, id is always required
 class AvailableMatchPublic(AvailableMatchBase):
     reserve: bool = Field(default=False)
+    held: bool = Field(default=False)
     latitude: float = Field(nullable=False)
     longitude: float = Field(nullable=False)
 
@@ -98,7 +157,10 @@ class AvailableMatchPublic(AvailableMatchBase):
     def from_private(
         cls, available_match: AvailableMatch, coordinates: tuple[float, float]
     ) -> "AvailableMatchPublic":
-        data = available_match.model_dump()
+        data = available_match.model_dump(exclude={"hold_id", "hold_expires_at"})
+        data["held"] = available_match.is_held(
+            datetime.datetime.now(datetime.timezone.utc)
+        )
         data["latitude"] = coordinates[0]
         data["longitude"] = coordinates[1]
         return cls(**data)
@@ -119,3 +181,179 @@ class AvailableMatchesPublic(SQLModel):
             data.append(AvailableMatchPublic.from_private(available_match, coordinates))
         count = len(available_matches_list)
         return cls(data=data, count=count)
+
+
+class AvailableMatchesHoldPublic(AvailableMatchesPublic):
+    hold_id: uuid.UUID
+    expires_at: datetime.datetime
+
+    @classmethod
+    def from_held(
+        cls,
+        available_matches_list: list[AvailableMatch],
+        coordinates: tuple[float, float],
+    ) -> "AvailableMatchesHoldPublic":
+        public = AvailableMatchesPublic.from_private(
+            available_matches_list, coordinates
+        )
+        held_match = available_matches_list[0]
+        return cls(
+            data=public.data,
+            count=public.count,
+            hold_id=held_match.hold_id,
+            expires_at=held_match.hold_expires_at,
+        )
+
+
+class AvailableMatchesDeletedPublic(SQLModel):
+    count: int
+
+
+class AvailableMatchesCreatedPublic(AvailableMatchesPublic):
+    existing_hours: list[int] = []
+
+    @classmethod
+    def from_created(
+        cls,
+        available_matches_list: list[AvailableMatch],
+        coordinates: tuple[float, float],
+        requested_hours: list[int],
+    ) -> "AvailableMatchesCreatedPublic":
+        public = AvailableMatchesPublic.from_private(
+            available_matches_list, coordinates
+        )
+        created_hours = {match.initial_hour for match in available_matches_list}
+        existing_hours = [hour for hour in requested_hours if hour not in created_hours]
+        return cls(data=public.data, count=public.count, existing_hours=existing_hours)
+
+
+class AvailableMatchesRangeBase(SQLModel):
+    date_from: datetime.date
+    date_to: datetime.date | None = None
+    initial_hour_from: int = Field(
+        default=AvailableMatchBase.TIME_LIMIT_MIN,
+        ge=AvailableMatchBase.TIME_LIMIT_MIN,
+        le=AvailableMatchBase.TIME_LIMIT_MAX,
+    )
+    initial_hour_to: int = Field(
+        default=AvailableMatchBase.TIME_LIMIT_MAX,
+        ge=AvailableMatchBase.TIME_LIMIT_MIN,
+        le=AvailableMatchBase.TIME_LIMIT_MAX,
+    )
+
+    def get_date_to(self) -> datetime.date:
+        return self.date_to if self.date_to is not None else self.date_from
+
+    def validate_range(self) -> None:
+        date_to = self.get_date_to()
+        if date_to < self.date_from:
+            raise NotAcceptableException("date_to no puede ser anterior a date_from")
+        n_days = (date_to - self.date_from).days + 1
+        if n_days > settings.AVAILABLE_MATCHES_MAX_RANGE_DAYS:
+            raise NotAcceptableException(
+                f"el rango no puede exceder {settings.AVAILABLE_MATCHES_MAX_RANGE_DAYS} días"
+            )
+        if self.initial_hour_to < self.initial_hour_from:
+            raise NotAcceptableException(
+                "initial_hour_to no puede ser anterior a initial_hour_from"
+            )
+
+
+class AvailableMatchesRangeFilter(AvailableMatchesRangeBase):
+    reserve: bool | None = None
+
+
+class AvailableMatchesSearchFilter(AvailableMatchesRangeBase):
+    business_public_id: uuid.UUID | None = None
+    min_latitude: float | None = Field(default=None, ge=-90, le=90)
+    max_latitude: float | None = Field(default=None, ge=-90, le=90)
+    min_longitude: float | None = Field(default=None, ge=-180, le=180)
+    max_longitude: float | None = Field(default=None, ge=-180, le=180)
+
+    def get_bounding_box(self) -> tuple[float, float, float, float] | None:
+        bounding_box = (
+            self.min_latitude,
+            self.max_latitude,
+            self.min_longitude,
+            self.max_longitude,
+        )
+        if all(value is None for value in bounding_box):
+            return None
+        if any(value is None for value in bounding_box):
+            raise NotAcceptableException(
+                "el área debe indicar latitud y longitud mínimas y máximas"
+            )
+        return bounding_box  # type: ignore[return-value]
+
+    def validate_search(self) -> None:
+        self.validate_range()
+        bounding_box = self.get_bounding_box()
+        if bounding_box is None:
+            return
+        min_latitude, max_latitude, min_longitude, max_longitude = bounding_box
+        if min_latitude > max_latitude or min_longitude > max_longitude:
+            raise NotAcceptableException("los mínimos del área superan a los máximos")
+
+
+class AvailableMatchesInDatePublic(SQLModel):
+    date: datetime.date
+    data: list[AvailableMatchPublic]
+    count: int
+
+
+class AvailableMatchesInRangePublic(SQLModel):
+    data: list[AvailableMatchesInDatePublic]
+    count: int
+
+    @classmethod
+    def from_private(
+        cls,
+        available_matches_list: list[AvailableMatch],
+        coordinates: tuple[float, float],
+    ) -> "AvailableMatchesInRangePublic":
+        matches_by_date: dict[datetime.date, list[AvailableMatchPublic]] = {}
+        for available_match in available_matches_list:
+            matches_by_date.setdefault(available_match.date, []).append(
+                AvailableMatchPublic.from_private(available_match, coordinates)
+            )
+        data = [
+            AvailableMatchesInDatePublic(date=date, data=matches, count=len(matches))
+            for date, matches in sorted(matches_by_date.items())
+        ]
+        return cls(data=data, count=len(available_matches_list))
+
+
+class AvailableMatchesSearchPublic(SQLModel):
+    data: list[AvailableMatchPublic]
+    count: int
+    next_cursor: str | None = None
+
+
+class AvailabilityEventType(str, Enum):
+    CREATED = "created"
+    RESERVED = "reserved"
+    DELETED = "deleted"
+    HELD = "held"
+    RELEASED = "released"
+
+
+# Change of the available matches of a court in a date, sent to the streams.
+# A deleted event means every match of the date was deleted.
+class AvailabilityEvent(SQLModel):
+    type: AvailabilityEventType
+    business_public_id: uuid.UUID
+    court_name: str
+    date: datetime.date
+    hours: list[int] = []
+
+    def matches(
+        self,
+        business_public_id: uuid.UUID,
+        court_name: str | None = None,
+        date: datetime.date | None = None,
+    ) -> bool:
+        return (
+            self.business_public_id == business_public_id
+            and (court_name is None or self.court_name == court_name)
+            and (date is None or self.date == date)
+        )
@@ -0,0 +1,86 @@
+import datetime
+import uuid
+from enum import Enum
+
+from sqlalchemy import Column, DateTime
+from sqlmodel import Field, SQLModel
+
+from app.core.config import settings
+from app.models.availability_day import hours_to_mask
+from app.models.available_match import AvailableMatchesHours
+from app.utilities.exceptions import NotAcceptableException
+
+AVAILABLE_MATCHES_BULK_JOB_TABLE_NAME = "available_matches_bulk_jobs"
+
+
+# Consecutive matches offered in every date
+class AvailableMatchesBulkHours(AvailableMatchesHours):
+    pass
+
+
+# Matches to create in every court x date x hours of the business. Without
+# court_names every court of the business is used, without weekdays every date
+# of the range (0 is monday, as date.weekday()).
+class AvailableMatchesBulkCreate(SQLModel):
+    court_names: list[str] | None = None
+    date_from: datetime.date
+    date_to: datetime.date
+    weekdays: list[int] | None = None
+    hours: list[AvailableMatchesBulkHours] = Field(min_length=1)
+
+    def get_dates(self) -> list[datetime.date]:
+        if self.date_to < self.date_from:
+            raise NotAcceptableException("date_to no puede ser anterior a date_from")
+        n_days = (self.date_to - self.date_from).days + 1
+        if n_days > settings.AVAILABLE_MATCHES_BULK_MAX_DAYS:
+            raise NotAcceptableException(
+                f"el rango no puede exceder {settings.AVAILABLE_MATCHES_BULK_MAX_DAYS} días"
+            )
+        dates = [
+            self.date_from + datetime.timedelta(days=number) for number in range(n_days)
+        ]
+        if self.weekdays is None:
+            return dates
+        return [date for date in dates if date.weekday() in self.weekdays]
+
+    def get_mask(self) -> int:
+        """Requested hours of every date, as AvailabilityDay.offered_mask."""
+        return hours_to_mask(
+            [hour for hours in self.hours for hour in hours.get_hours()]
+        )
+
+
+class AvailableMatchesBulkJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+# Database model, progress of a bulk creation. done_days counts the court
+# dates already written, out of total_days.
+class AvailableMatchesBulkJob(SQLModel, table=True):
+    __tablename__ = AVAILABLE_MATCHES_BULK_JOB_TABLE_NAME
+    id: int = Field(default=None, primary_key=True)
+    job_public_id: uuid.UUID = Field(default_factory=uuid.uuid4, unique=True)
+    business_public_id: uuid.UUID = Field(nullable=False)
+    status: str = Field(
+        default=AvailableMatchesBulkJobStatus.PENDING.value, max_length=16
+    )
+    total_days: int = Field(default=0)
+    done_days: int = Field(default=0)
+    error: str | None = Field(default=None, max_length=255)
+    created_at: datetime.datetime = Field(
+        default_factory=lambda: datetime.datetime.now(datetime.timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+
+class AvailableMatchesBulkJobPublic(SQLModel):
+    job_public_id: uuid.UUID
+    business_public_id: uuid.UUID
+    status: AvailableMatchesBulkJobStatus
+    total_days: int
+    done_days: int
+    error: str | None = None
+    created_at: datetime.datetime
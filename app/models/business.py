@@ -1,7 +1,10 @@
 import uuid
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
+from app.core.config import settings
+
 BUSINESS_TABLE_NAME = "businesses"
 
 
@@ -35,6 +38,12 @@ class Business(BusinessBase, BusinessImmutable, table=True):
     __tablename__ = BUSINESS_TABLE_NAME
     id: int = Field(default=None, primary_key=True)
 
+    __table_args__ = (
+        Index("ix_businesses_latitude_longitude", "latitude", "longitude"),
+        # Owner listings, in the id order of the (keyset) pagination.
+        Index("ix_businesses_owner_id_id", "owner_id", "id"),
+    )
+
     def is_owned(self, user_id: uuid.UUID) -> bool:
         return self.owner_id == user_id
 
@@ -49,9 +58,25 @@ class BusinessPublic(BusinessBase, BusinessImmutable):
 
 class BusinessesPublic(SQLModel):
     data: list[BusinessPublic]
-    count: int
+    count: int | None
+    next_cursor: str | None = None
 
 
 class BusinessesFilters(SQLModel):
     business_public_id: uuid.UUID | None = None
     owner_id: uuid.UUID | None = None
+
+
+class BusinessNearbyPublic(BusinessPublic):
+    distance_km: float
+
+
+class BusinessesNearbyPublic(SQLModel):
+    data: list[BusinessNearbyPublic]
+    count: int
+
+
+class NearbyFilter(SQLModel):
+    lat: float = Field(ge=-90, le=90)
+    lng: float = Field(ge=-180, le=180)
+    radius_km: float = Field(gt=0, le=settings.NEARBY_MAX_RADIUS_KM)
@@ -0,0 +1,26 @@
+import datetime
+
+from sqlalchemy import Column, DateTime
+from sqlmodel import Field, SQLModel
+
+GEOCODING_CACHE_TABLE_NAME = "geocoding_cache"
+
+
+# Database model, shared by every worker as a persistent geocoding cache
+class GeocodedAddress(SQLModel, table=True):
+    __tablename__ = GEOCODING_CACHE_TABLE_NAME
+    address_key: str = Field(primary_key=True, max_length=255)
+    longitude: float | None = Field(default=None)
+    latitude: float | None = Field(default=None)
+    is_valid: bool = Field(default=True)
+    expires_at: datetime.datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+
+    def get_coordinates(self) -> tuple[float, float] | None:
+        if not self.is_valid or self.longitude is None or self.latitude is None:
+            return None
+        return self.longitude, self.latitude
+
+    def is_expired(self, now: datetime.datetime) -> bool:
+        return self.expires_at <= now
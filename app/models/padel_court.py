@@ -2,7 +2,7 @@ import uuid
 from decimal import Decimal
 
 from pydantic import field_validator
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, SQLModel
 
 from app.models.business import BUSINESS_TABLE_NAME
@@ -50,6 +50,7 @@ class PadelCourt(PadelCourtBase, PadelCourtImmutable, table=True):
             "court_public_id",
             name="uq_padel_court",
         ),
+        Index("ix_padel_courts_business_public_id_name", "business_public_id", "name"),
     )
 
 
@@ -63,7 +64,8 @@ class PadelCourtPublic(PadelCourtBase, PadelCourtImmutable):
 
 class PadelCourtsPublic(SQLModel):
     data: list[PadelCourtPublic]
-    count: int
+    count: int | None
+    next_cursor: str | None = None
 
     def get_padel_courts_for_business(self) -> dict[uuid.UUID, list[PadelCourtPublic]]:
         result = {}
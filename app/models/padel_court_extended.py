@@ -12,7 +12,8 @@ class PadelCourtPublicExtended(PadelCourtPublic, BusinessImmutable):
 
 class PadelCourtsPublicExtended(SQLModel):
     data: list[PadelCourtPublicExtended] = []
-    count: int = 0
+    count: int | None = 0
+    next_cursor: str | None = None
 
     def add_court(self, court: PadelCourtPublic, business: Business) -> None:
         data_business = business.model_dump()
@@ -24,4 +25,4 @@ class PadelCourtsPublicExtended(SQLModel):
         data.update(court.model_dump())
         new_court = PadelCourtPublicExtended(**data)
         self.data.append(new_court)
-        self.count += 1
+        self.count = (self.count or 0) + 1
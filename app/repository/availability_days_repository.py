@@ -0,0 +1,483 @@
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import ColumnElement, delete, func, literal, text, true, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import and_, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.availability_day import (
+    AVAILABILITY_DAY_TABLE_NAME,
+    HOURS_IN_DAY,
+    AvailabilityDay,
+    hours_to_mask,
+)
+from app.models.available_match import (
+    AVAILABILITY_TABLE_NAME,
+    AvailableMatch,
+    AvailableMatchCreate,
+    AvailableMatchesRangeFilter,
+    AvailableMatchesSearchFilter,
+)
+from app.models.business import Business
+from app.models.padel_court import PadelCourt
+from app.utilities.exceptions import (
+    NotAcceptableException,
+    NotFoundException,
+    NotUniqueException,
+)
+
+HOLDS_NOT_SUPPORTED = "las retenciones requieren AVAILABILITY_STORAGE=rows"
+
+
+def hour_window_mask(hour_from: int, hour_to: int) -> int:
+    """Mask with the bits of every hour between hour_from and hour_to, included."""
+    return ((1 << (hour_to + 1)) - 1) & ~((1 << hour_from) - 1)
+
+
+class AvailabilityDaysRepository:
+    """AvailableMatchesRepository over one AvailabilityDay row per court and date.
+
+    Same methods and results: the AvailableMatch objects are built from the
+    masks and are not persisted, their ids are AvailabilityDay.match_id.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    def _day_filter(
+        self, court_name: str, business_public_id: uuid.UUID
+    ) -> list[ColumnElement[bool]]:
+        return [
+            col(AvailabilityDay.business_public_id) == business_public_id,
+            col(AvailabilityDay.court_name) == court_name,
+        ]
+
+    async def _get_day(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        for_update: bool = False,
+    ) -> AvailabilityDay | None:
+        query = select(AvailabilityDay).where(
+            and_(
+                *self._day_filter(court_name, business_public_id),
+                AvailabilityDay.date == date,
+            )
+        )
+        if for_update:
+            query = query.with_for_update()
+        result = await self.session.exec(query)
+        return result.first()
+
+    async def create_available_matches_in_date(
+        self,
+        create_available_date: AvailableMatchCreate,
+        ignore_existing: bool = False,
+    ) -> list[AvailableMatch]:
+        """Add the hours of the range to the offered mask of the day.
+
+        Without ignore_existing nothing is added if any hour already exists.
+        """
+        requested_mask = hours_to_mask(create_available_date.get_hours())
+        insert_query = (
+            insert(AvailabilityDay)
+            .values(
+                court_name=create_available_date.court_name,
+                court_public_id=create_available_date.court_public_id,
+                business_public_id=create_available_date.business_public_id,
+                date=create_available_date.date,
+                offered_mask=requested_mask,
+                reserved_mask=0,
+            )
+            .on_conflict_do_nothing(constraint="uq_availability_day")
+            .returning(AvailabilityDay)
+        )
+        result = await self.session.exec(insert_query)  # type: ignore[call-overload]
+        day: AvailabilityDay | None = result.scalars().first()
+        if day is not None:
+            await self.session.commit()
+            return day.to_available_matches()
+
+        # The day exists: lock it so concurrent creations see each other's hours
+        day = await self._get_day(
+            create_available_date.court_name,
+            create_available_date.business_public_id,
+            create_available_date.date,
+            for_update=True,
+        )
+        assert day is not None
+        created_mask = requested_mask & ~day.offered_mask
+        if created_mask != requested_mask and not ignore_existing:
+            await self.session.rollback()
+            raise NotUniqueException("Disponibilidad")
+        day.offered_mask |= created_mask
+        self.session.add(day)
+        await self.session.commit()
+        return day.to_available_matches(created_mask)
+
+    async def add_available_days(
+        self, available_days: list[AvailabilityDay], batch_size: int = 5000
+    ) -> list[AvailabilityDay]:
+        """Add the offered hours of every day to the existing ones.
+
+        Returns the days with some added hour, with only those in offered_mask.
+        """
+        created_days: list[AvailabilityDay] = []
+        for start in range(0, len(available_days), batch_size):
+            batch = available_days[start : start + batch_size]
+            # Lock the existing days so the hours they already offer are known
+            existing_query = (
+                select(
+                    col(AvailabilityDay.business_public_id),
+                    col(AvailabilityDay.court_name),
+                    col(AvailabilityDay.date),
+                    col(AvailabilityDay.offered_mask),
+                )
+                .where(
+                    tuple_(
+                        col(AvailabilityDay.business_public_id),
+                        col(AvailabilityDay.court_name),
+                        col(AvailabilityDay.date),
+                    ).in_(
+                        [
+                            (day.business_public_id, day.court_name, day.date)
+                            for day in batch
+                        ]
+                    )
+                )
+                .order_by(col(AvailabilityDay.id))
+                .with_for_update()
+            )
+            existing = await self.session.exec(existing_query)
+            existing_masks = {
+                (business_public_id, court_name, date): offered_mask
+                for business_public_id, court_name, date, offered_mask in existing.all()
+            }
+            query = insert(AvailabilityDay).values(
+                [
+                    {
+                        "court_name": day.court_name,
+                        "court_public_id": day.court_public_id,
+                        "business_public_id": day.business_public_id,
+                        "date": day.date,
+                        "offered_mask": day.offered_mask,
+                        "reserved_mask": 0,
+                    }
+                    for day in batch
+                ]
+            )
+            query = query.on_conflict_do_update(
+                constraint="uq_availability_day",
+                set_={
+                    "offered_mask": col(AvailabilityDay.offered_mask).op("|")(
+                        query.excluded.offered_mask
+                    )
+                },
+            )
+            await self.session.exec(query)  # type: ignore[call-overload]
+            for day in batch:
+                existing_mask = existing_masks.get(
+                    (day.business_public_id, day.court_name, day.date), 0
+                )
+                created_mask = day.offered_mask & ~existing_mask
+                if created_mask:
+                    created_days.append(
+                        AvailabilityDay.model_construct(
+                            court_name=day.court_name,
+                            court_public_id=day.court_public_id,
+                            business_public_id=day.business_public_id,
+                            date=day.date,
+                            offered_mask=created_mask,
+                            reserved_mask=0,
+                        )
+                    )
+        await self.session.commit()
+        return created_days
+
+    async def get_available_matches_in_date(
+        self, court_name: str, business_public_id: uuid.UUID, date: date
+    ) -> list[AvailableMatch]:
+        day = await self._get_day(court_name, business_public_id, date)
+        if day is None:
+            return []
+        return day.to_available_matches()
+
+    async def get_available_matches_in_range(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        range_filter: AvailableMatchesRangeFilter,
+    ) -> list[AvailableMatch]:
+        query = (
+            select(AvailabilityDay)
+            .where(
+                and_(
+                    *self._day_filter(court_name, business_public_id),
+                    col(AvailabilityDay.date).between(
+                        range_filter.date_from, range_filter.get_date_to()
+                    ),
+                )
+            )
+            .order_by(col(AvailabilityDay.date))
+        )
+        result = await self.session.exec(query)
+        window_mask = hour_window_mask(
+            range_filter.initial_hour_from, range_filter.initial_hour_to
+        )
+        available_matches = []
+        for day in result.all():
+            mask = window_mask
+            if range_filter.reserve is True:
+                mask &= day.reserved_mask
+            elif range_filter.reserve is False:
+                mask &= ~day.reserved_mask
+            available_matches.extend(day.to_available_matches(mask))
+        return available_matches
+
+    async def search_available_matches(
+        self,
+        search_filter: AvailableMatchesSearchFilter,
+        after: tuple[date, int, int] | None = None,
+        limit: int = 100,
+    ) -> list[tuple[AvailableMatch, float, float]]:
+        """Free matches of every court matching the filter, with their coordinates.
+
+        Only matches of existing courts are returned, they are not linked by a
+        foreign key.
+
+        The days are expanded into one row per free hour in the query, sorted by
+        (date, initial_hour, id); after is the key of the last row of the
+        previous page.
+        """
+        hours = (
+            func.generate_series(
+                search_filter.initial_hour_from, search_filter.initial_hour_to
+            )
+            .table_valued("hour")
+            .render_derived(name="hours")
+        )
+        hour = hours.c.hour
+        hour_bit = literal(1).op("<<")(hour)
+        # Reserved hours are always offered, XOR leaves the free ones.
+        free_mask = col(AvailabilityDay.offered_mask).op("#")(
+            col(AvailabilityDay.reserved_mask)
+        )
+        match_id = col(AvailabilityDay.id) * HOURS_IN_DAY + hour
+        query = (
+            select(AvailabilityDay, hour, Business.latitude, Business.longitude)
+            .join(
+                PadelCourt,
+                and_(
+                    col(PadelCourt.business_public_id)
+                    == AvailabilityDay.business_public_id,
+                    col(PadelCourt.name) == AvailabilityDay.court_name,
+                ),
+            )
+            .join(
+                Business,
+                col(AvailabilityDay.business_public_id) == Business.business_public_id,
+            )
+            .join(hours, true())
+            .where(
+                and_(
+                    # Same predicate as the partial index, for the planner to use it.
+                    col(AvailabilityDay.offered_mask)
+                    != col(AvailabilityDay.reserved_mask),
+                    col(AvailabilityDay.date).between(
+                        search_filter.date_from, search_filter.get_date_to()
+                    ),
+                    free_mask.op("&")(hour_bit) != 0,
+                )
+            )
+        )
+        if search_filter.business_public_id is not None:
+            query = query.where(
+                AvailabilityDay.business_public_id == search_filter.business_public_id
+            )
+        bounding_box = search_filter.get_bounding_box()
+        if bounding_box is not None:
+            min_latitude, max_latitude, min_longitude, max_longitude = bounding_box
+            query = query.where(
+                and_(
+                    col(Business.latitude).between(min_latitude, max_latitude),
+                    col(Business.longitude).between(min_longitude, max_longitude),
+                )
+            )
+        if after is not None:
+            query = query.where(
+                tuple_(col(AvailabilityDay.date), hour, match_id)
+                > tuple_(*(literal(value) for value in after))
+            )
+        query = query.order_by(col(AvailabilityDay.date), hour, match_id).limit(limit)
+        result = await self.session.exec(query)
+        return [
+            (day.to_available_match(day_hour), latitude, longitude)
+            for day, day_hour, latitude, longitude in result.all()
+        ]
+
+    async def delete_available_matches_in_date(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        force: bool = True,
+    ) -> list[int]:
+        """Delete the day in one statement, returning the ids of its matches.
+
+        Without force nothing is deleted if any match of the date is reserved.
+        """
+        query = delete(AvailabilityDay).where(
+            and_(
+                *self._day_filter(court_name, business_public_id),
+                AvailabilityDay.date == date,
+            )
+        )
+        if not force:
+            query = query.where(col(AvailabilityDay.reserved_mask) == 0)
+        result = await self.session.exec(query.returning(AvailabilityDay))  # type: ignore[call-overload]
+        day: AvailabilityDay | None = result.scalars().first()
+        await self.session.commit()
+        if day is None:
+            return []
+        return [available_match.id for available_match in day.to_available_matches()]
+
+    async def has_reserved_matches_in_date(
+        self, court_name: str, business_public_id: uuid.UUID, date: date
+    ) -> bool:
+        day = await self._get_day(court_name, business_public_id, date)
+        return day is not None and day.reserved_mask != 0
+
+    async def get_available_match(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hour: int,
+    ) -> AvailableMatch:
+        day = await self._get_day(court_name, business_public_id, date)
+        if day is None or not day.offered_mask & (1 << hour):
+            raise NotFoundException("Disponibilidad para el match")
+        return day.to_available_match(hour)
+
+    async def reserve_available_match(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hour: int,
+        hold_id: uuid.UUID | None = None,
+    ) -> AvailableMatch | None:
+        """Reserve the match setting its bit in one conditional UPDATE.
+
+        Returns None when the match does not exist or is already reserved.
+        """
+        hour_bit = 1 << hour
+        query = (
+            update(AvailabilityDay)
+            .where(
+                and_(
+                    *self._day_filter(court_name, business_public_id),
+                    AvailabilityDay.date == date,
+                    col(AvailabilityDay.offered_mask).op("&")(hour_bit) != 0,
+                    col(AvailabilityDay.reserved_mask).op("&")(hour_bit) == 0,
+                )
+            )
+            .values(reserved_mask=col(AvailabilityDay.reserved_mask).op("|")(hour_bit))
+            .returning(AvailabilityDay)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.exec(query)  # type: ignore[call-overload]
+        day: AvailabilityDay | None = result.scalars().first()
+        await self.session.commit()
+        if day is None:
+            return None
+        return day.to_available_match(hour)
+
+    async def reserve_available_matches(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hours: list[int],
+        hold_id: uuid.UUID | None = None,
+    ) -> list[AvailableMatch]:
+        """Reserve the matches of every hour setting their bits, all or none.
+
+        Returns an empty list when any of them does not exist or is reserved.
+        """
+        hours_mask = hours_to_mask(hours)
+        query = (
+            update(AvailabilityDay)
+            .where(
+                and_(
+                    *self._day_filter(court_name, business_public_id),
+                    AvailabilityDay.date == date,
+                    col(AvailabilityDay.offered_mask).op("&")(hours_mask) == hours_mask,
+                    col(AvailabilityDay.reserved_mask).op("&")(hours_mask) == 0,
+                )
+            )
+            .values(
+                reserved_mask=col(AvailabilityDay.reserved_mask).op("|")(hours_mask)
+            )
+            .returning(AvailabilityDay)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.exec(query)  # type: ignore[call-overload]
+        day: AvailabilityDay | None = result.scalars().first()
+        await self.session.commit()
+        if day is None:
+            return []
+        return day.to_available_matches(hours_mask)
+
+    # A day row has no room for an expiry per hour, holds need the rows storage
+    async def hold_available_matches(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hours: list[int],
+        hold_id: uuid.UUID,
+        ttl: timedelta,
+    ) -> list[AvailableMatch]:
+        raise NotAcceptableException(HOLDS_NOT_SUPPORTED)
+
+    async def release_hold(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hold_id: uuid.UUID,
+    ) -> list[AvailableMatch]:
+        raise NotAcceptableException(HOLDS_NOT_SUPPORTED)
+
+    async def release_expired_holds(self, batch_size: int) -> list[AvailableMatch]:
+        return []
+
+    async def copy_from_available_matches(self) -> int:
+        """Overwrite the days that have matches in the rows storage with them.
+
+        Run it right before switching AVAILABILITY_STORAGE to bitmap, returns the
+        number of days written.
+        """
+        result = await self.session.exec(  # type: ignore[call-overload]
+            text(
+                f"""
+                INSERT INTO {AVAILABILITY_DAY_TABLE_NAME} (
+                    court_name, court_public_id, business_public_id, date,
+                    offered_mask, reserved_mask
+                )
+                SELECT court_name, court_public_id, business_public_id, date,
+                    bit_or(1 << initial_hour),
+                    bit_or(CASE WHEN reserve THEN 1 << initial_hour ELSE 0 END)
+                FROM {AVAILABILITY_TABLE_NAME}
+                GROUP BY business_public_id, court_name, court_public_id, date
+                ON CONFLICT ON CONSTRAINT uq_availability_day DO UPDATE
+                SET offered_mask = EXCLUDED.offered_mask,
+                    reserved_mask = EXCLUDED.reserved_mask
+                """
+            )
+        )
+        await self.session.commit()
+        return int(result.rowcount)
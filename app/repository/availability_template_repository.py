@@ -0,0 +1,182 @@
+import uuid
+from datetime import date
+
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import and_, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.availability_day import AvailabilityDay
+from app.models.availability_template import (
+    AVAILABILITY_TEMPLATE_DATE_TABLE_NAME,
+    AVAILABILITY_TEMPLATE_TABLE_NAME,
+    AvailabilityTemplate,
+    AvailabilityTemplateDate,
+)
+
+# Marks the dates of the templates in [date_from, date_to] as materialized,
+# skipping those already handled, and returns the offered hours of each one.
+CLAIM_TEMPLATE_DATES_SQL = f"""
+WITH claimed AS (
+    INSERT INTO {AVAILABILITY_TEMPLATE_DATE_TABLE_NAME}
+        (business_public_id, court_name, date, skipped)
+    SELECT template.business_public_id, template.court_name, day::date, false
+    FROM {AVAILABILITY_TEMPLATE_TABLE_NAME} AS template
+    JOIN generate_series(
+        CAST(:date_from AS date), CAST(:date_to AS date), interval '1 day'
+    ) AS day ON EXTRACT(ISODOW FROM day) - 1 = template.weekday
+    WHERE (CAST(:business_public_id AS uuid) IS NULL
+        OR template.business_public_id = CAST(:business_public_id AS uuid))
+    AND (CAST(:court_name AS varchar) IS NULL
+        OR template.court_name = CAST(:court_name AS varchar))
+    ON CONFLICT ON CONSTRAINT uq_availability_template_date DO NOTHING
+    RETURNING business_public_id, court_name, date
+)
+SELECT template.court_name, template.court_public_id, template.business_public_id,
+    claimed.date, template.hours_mask
+FROM claimed
+JOIN {AVAILABILITY_TEMPLATE_TABLE_NAME} AS template
+    ON template.business_public_id = claimed.business_public_id
+    AND template.court_name = claimed.court_name
+    AND template.weekday = EXTRACT(ISODOW FROM claimed.date) - 1
+"""
+
+
+class AvailabilityTemplateRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def replace_templates(
+        self,
+        business_public_id: uuid.UUID,
+        court_name: str,
+        court_public_id: uuid.UUID,
+        hours_masks: dict[int, int],
+    ) -> list[AvailabilityTemplate]:
+        """Replace the weekly template of the court in one transaction."""
+        await self.session.exec(  # type: ignore[call-overload]
+            delete(AvailabilityTemplate).where(
+                and_(
+                    AvailabilityTemplate.business_public_id == business_public_id,
+                    AvailabilityTemplate.court_name == court_name,
+                )
+            )
+        )
+        templates = [
+            AvailabilityTemplate(
+                court_name=court_name,
+                court_public_id=court_public_id,
+                business_public_id=business_public_id,
+                weekday=weekday,
+                hours_mask=hours_mask,
+            )
+            for weekday, hours_mask in sorted(hours_masks.items())
+            if hours_mask
+        ]
+        self.session.add_all(templates)
+        await self.session.commit()
+        return templates
+
+    async def get_templates(
+        self, business_public_id: uuid.UUID, court_name: str
+    ) -> list[AvailabilityTemplate]:
+        query = select(AvailabilityTemplate).where(
+            and_(
+                AvailabilityTemplate.business_public_id == business_public_id,
+                AvailabilityTemplate.court_name == court_name,
+            )
+        )
+        result = await self.session.exec(query)
+        return list(result.all())
+
+    async def get_exceptions(
+        self, business_public_id: uuid.UUID, court_name: str, date_from: date
+    ) -> list[date]:
+        query = (
+            select(col(AvailabilityTemplateDate.date))
+            .where(
+                and_(
+                    AvailabilityTemplateDate.business_public_id == business_public_id,
+                    AvailabilityTemplateDate.court_name == court_name,
+                    col(AvailabilityTemplateDate.skipped).is_(True),
+                    AvailabilityTemplateDate.date >= date_from,
+                )
+            )
+            .order_by(col(AvailabilityTemplateDate.date))
+        )
+        result = await self.session.exec(query)
+        return list(result.all())
+
+    async def add_exception(
+        self, business_public_id: uuid.UUID, court_name: str, date: date
+    ) -> None:
+        """Skip the date. If it was already materialized its matches are kept."""
+        query = (
+            insert(AvailabilityTemplateDate)
+            .values(
+                business_public_id=business_public_id,
+                court_name=court_name,
+                date=date,
+                skipped=True,
+            )
+            .on_conflict_do_update(
+                constraint="uq_availability_template_date", set_={"skipped": True}
+            )
+        )
+        await self.session.exec(query)  # type: ignore[call-overload]
+        await self.session.commit()
+
+    async def delete_exception(
+        self, business_public_id: uuid.UUID, court_name: str, date: date
+    ) -> None:
+        """Stop skipping the date, it is materialized again on demand."""
+        query = delete(AvailabilityTemplateDate).where(
+            and_(
+                AvailabilityTemplateDate.business_public_id == business_public_id,
+                AvailabilityTemplateDate.court_name == court_name,
+                AvailabilityTemplateDate.date == date,
+                col(AvailabilityTemplateDate.skipped).is_(True),
+            )
+        )
+        await self.session.exec(query)  # type: ignore[call-overload]
+        await self.session.commit()
+
+    async def claim_template_dates(
+        self,
+        date_from: date,
+        date_to: date,
+        business_public_id: uuid.UUID | None = None,
+        court_name: str | None = None,
+    ) -> list[AvailabilityDay]:
+        """Claim the dates still to materialize, without committing.
+
+        Returns the days to add to the available matches; add them in the same
+        transaction so a date is never claimed without its matches.
+        """
+        result = await self.session.exec(  # type: ignore[call-overload]
+            text(CLAIM_TEMPLATE_DATES_SQL),
+            params={
+                "date_from": date_from,
+                "date_to": date_to,
+                "business_public_id": business_public_id,
+                "court_name": court_name,
+            },
+        )
+        return [
+            AvailabilityDay(
+                court_name=row.court_name,
+                court_public_id=row.court_public_id,
+                business_public_id=row.business_public_id,
+                date=row.date,
+                offered_mask=row.hours_mask,
+            )
+            for row in result.all()
+        ]
+
+    async def try_lock_materialization(self) -> bool:
+        """Transaction-level advisory lock so only one worker runs the scheduler."""
+        result = await self.session.exec(  # type: ignore[call-overload]
+            text("SELECT pg_try_advisory_xact_lock(hashtext(:name))"),
+            params={"name": AVAILABILITY_TEMPLATE_DATE_TABLE_NAME},
+        )
+        return bool(result.scalar())
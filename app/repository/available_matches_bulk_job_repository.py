@@ -0,0 +1,61 @@
+import uuid
+from typing import Any
+
+from sqlalchemy import update
+from sqlmodel import and_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.available_match_bulk import AvailableMatchesBulkJob
+from app.utilities.exceptions import NotFoundException
+
+
+class AvailableMatchesBulkJobRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def create_job(
+        self, business_public_id: uuid.UUID, total_days: int
+    ) -> AvailableMatchesBulkJob:
+        job = AvailableMatchesBulkJob(
+            business_public_id=business_public_id, total_days=total_days
+        )
+        self.session.add(job)
+        # Every column but id has a client-side default, no refresh needed
+        await self.session.commit()
+        return job
+
+    async def get_job(
+        self, business_public_id: uuid.UUID, job_public_id: uuid.UUID
+    ) -> AvailableMatchesBulkJob:
+        # The job is updated by other sessions, always read the stored progress
+        query = (
+            select(AvailableMatchesBulkJob)
+            .where(
+                and_(
+                    AvailableMatchesBulkJob.business_public_id == business_public_id,
+                    AvailableMatchesBulkJob.job_public_id == job_public_id,
+                )
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.exec(query)
+        job = result.first()
+        if not job:
+            raise NotFoundException("trabajo")
+        return job
+
+    async def update_job(
+        self, job_public_id: uuid.UUID, **values: Any
+    ) -> AvailableMatchesBulkJob:
+        """Update the job in one statement and commit, returning it."""
+        query = (
+            update(AvailableMatchesBulkJob)
+            .where(AvailableMatchesBulkJob.job_public_id == job_public_id)  # type: ignore[arg-type]
+            .values(**values)
+            .returning(AvailableMatchesBulkJob)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.exec(query)  # type: ignore[call-overload]
+        job: AvailableMatchesBulkJob = result.scalars().one()
+        await self.session.commit()
+        return job
@@ -1,10 +1,24 @@
 import uuid
-from datetime import date
+from datetime import date, timedelta
+from typing import Any
 
-from sqlmodel import and_, select
+from sqlalchemy import delete, exists, func, literal, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
+from sqlmodel import and_, col, not_, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.available_match import AvailableMatch, AvailableMatchCreate
+from app.core.config import settings
+from app.models.availability_day import AvailabilityDay, mask_to_hours
+from app.models.available_match import (
+    AvailableMatch,
+    AvailableMatchCreate,
+    AvailableMatchesRangeFilter,
+    AvailableMatchesSearchFilter,
+)
+from app.models.business import Business
+from app.models.padel_court import PadelCourt
+from app.repository.availability_days_repository import AvailabilityDaysRepository
 from app.utilities.exceptions import NotFoundException
 
 
@@ -13,15 +27,83 @@ class AvailableMatchesRepository:
         self.session = session
 
     async def create_available_matches_in_date(
-        self, create_available_date: AvailableMatchCreate
+        self,
+        create_available_date: AvailableMatchCreate,
+        ignore_existing: bool = False,
     ) -> list[AvailableMatch]:
+        """Insert every match of the range in a single INSERT ... RETURNING.
+
+        With ignore_existing, hours that already exist are skipped instead of
+        raising IntegrityError, and only the inserted matches are returned.
+        """
         available_matches_list = AvailableMatch.from_create(create_available_date)
-        for available_match in available_matches_list:
-            self.session.add(available_match)
+        values = [
+            available_match.model_dump(exclude={"id"})
+            for available_match in available_matches_list
+        ]
+        query = insert(AvailableMatch).values(values)
+        if ignore_existing:
+            query = query.on_conflict_do_nothing(constraint="uq_available_match")
+        result = await self.session.exec(query.returning(AvailableMatch))  # type: ignore[call-overload]
+        created_matches: list[AvailableMatch] = list(result.scalars().all())
         await self.session.commit()
-        for available_match in available_matches_list:
-            await self.session.refresh(available_match)
-        return available_matches_list
+        return sorted(created_matches, key=lambda match: match.initial_hour)
+
+    async def add_available_days(
+        self, available_days: list[AvailabilityDay], batch_size: int = 5000
+    ) -> list[AvailabilityDay]:
+        """Insert the offered hours of every day, skipping the existing ones.
+
+        Returns the days with some inserted hour, with only those in offered_mask.
+        """
+        values = [
+            {
+                "court_name": day.court_name,
+                "court_public_id": day.court_public_id,
+                "business_public_id": day.business_public_id,
+                "date": day.date,
+                "initial_hour": hour,
+                "reserve": False,
+            }
+            for day in available_days
+            for hour in mask_to_hours(day.offered_mask)
+        ]
+        created_masks: dict[tuple[uuid.UUID, str, uuid.UUID, date], int] = {}
+        for start in range(0, len(values), batch_size):
+            query = (
+                insert(AvailableMatch)
+                .values(values[start : start + batch_size])
+                .on_conflict_do_nothing(constraint="uq_available_match")
+                .returning(
+                    col(AvailableMatch.business_public_id),
+                    col(AvailableMatch.court_name),
+                    col(AvailableMatch.court_public_id),
+                    col(AvailableMatch.date),
+                    col(AvailableMatch.initial_hour),
+                )
+            )
+            result = await self.session.exec(query)  # type: ignore[call-overload]
+            for *key, initial_hour in result.all():
+                key = tuple(key)
+                created_masks[key] = created_masks.get(key, 0) | (1 << initial_hour)
+        await self.session.commit()
+        return [
+            # Values come from the inserted rows
+            AvailabilityDay.model_construct(
+                court_name=court_name,
+                court_public_id=court_public_id,
+                business_public_id=business_public_id,
+                date=date,
+                offered_mask=offered_mask,
+                reserved_mask=0,
+            )
+            for (
+                business_public_id,
+                court_name,
+                court_public_id,
+                date,
+            ), offered_mask in created_masks.items()
+        ]
 
     async def get_available_matches_in_date(
         self, court_name: str, business_public_id: uuid.UUID, date: date
@@ -38,24 +120,155 @@ class AvailableMatchesRepository:
             return []
         return list(available_matches.all())
 
-    async def delete_available_matches_in_date(
-        self, court_name: str, business_public_id: uuid.UUID, date: date
-    ) -> None:
+    async def get_available_matches_in_range(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        range_filter: AvailableMatchesRangeFilter,
+    ) -> list[AvailableMatch]:
         query = select(AvailableMatch).where(
+            and_(
+                AvailableMatch.business_public_id == business_public_id,
+                AvailableMatch.court_name == court_name,
+                col(AvailableMatch.date).between(
+                    range_filter.date_from, range_filter.get_date_to()
+                ),
+                col(AvailableMatch.initial_hour).between(
+                    range_filter.initial_hour_from, range_filter.initial_hour_to
+                ),
+            )
+        )
+        if range_filter.reserve is not None:
+            query = query.where(AvailableMatch.reserve == range_filter.reserve)
+        if range_filter.reserve is False:
+            # Matches on an active hold are not free, as in the search
+            query = query.where(self._not_held())
+        query = query.order_by(
+            col(AvailableMatch.date), col(AvailableMatch.initial_hour)
+        )
+        result = await self.session.exec(query)
+        return list(result.all())
+
+    async def search_available_matches(
+        self,
+        search_filter: AvailableMatchesSearchFilter,
+        after: tuple[date, int, int] | None = None,
+        limit: int = 100,
+    ) -> list[tuple[AvailableMatch, float, float]]:
+        """Free matches of every court matching the filter, with their coordinates.
+
+        Only matches of existing courts are returned, they are not linked by a
+        foreign key.
+
+        Rows are sorted by (date, initial_hour, id); after is the key of the last
+        row of the previous page.
+        """
+        query = (
+            select(AvailableMatch, Business.latitude, Business.longitude)
+            .join(
+                PadelCourt,
+                and_(
+                    col(PadelCourt.business_public_id)
+                    == AvailableMatch.business_public_id,
+                    col(PadelCourt.name) == AvailableMatch.court_name,
+                ),
+            )
+            .join(
+                Business,
+                col(AvailableMatch.business_public_id) == Business.business_public_id,
+            )
+            .where(
+                and_(
+                    # NOT reserve, as the partial index, for the planner to use it.
+                    not_(AvailableMatch.reserve),
+                    self._not_held(),
+                    col(AvailableMatch.date).between(
+                        search_filter.date_from, search_filter.get_date_to()
+                    ),
+                    col(AvailableMatch.initial_hour).between(
+                        search_filter.initial_hour_from, search_filter.initial_hour_to
+                    ),
+                )
+            )
+        )
+        if search_filter.business_public_id is not None:
+            query = query.where(
+                AvailableMatch.business_public_id == search_filter.business_public_id
+            )
+        bounding_box = search_filter.get_bounding_box()
+        if bounding_box is not None:
+            min_latitude, max_latitude, min_longitude, max_longitude = bounding_box
+            query = query.where(
+                and_(
+                    col(Business.latitude).between(min_latitude, max_latitude),
+                    col(Business.longitude).between(min_longitude, max_longitude),
+                )
+            )
+        if after is not None:
+            query = query.where(
+                tuple_(
+                    col(AvailableMatch.date),
+                    col(AvailableMatch.initial_hour),
+                    col(AvailableMatch.id),
+                )
+                > tuple_(*(literal(value) for value in after))
+            )
+        query = query.order_by(
+            col(AvailableMatch.date),
+            col(AvailableMatch.initial_hour),
+            col(AvailableMatch.id),
+        ).limit(limit)
+        result = await self.session.exec(query)
+        return list(result.all())
+
+    async def delete_available_matches_in_date(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        force: bool = True,
+    ) -> list[int]:
+        """Delete the matches of the date in one statement, returning their ids.
+
+        Without force nothing is deleted if any match of the date is reserved.
+        """
+        query = delete(AvailableMatch).where(
             and_(
                 AvailableMatch.date == date,
                 AvailableMatch.court_name == court_name,
                 AvailableMatch.business_public_id == business_public_id,
             )
         )
-        available_matches = await self.session.exec(query)
-        if available_matches is None:
-            return
-        for available_match in available_matches:
-            await self.session.delete(available_match)
+        if not force:
+            reserved_match = aliased(AvailableMatch)
+            query = query.where(
+                ~exists().where(
+                    and_(
+                        reserved_match.date == date,
+                        reserved_match.court_name == court_name,
+                        reserved_match.business_public_id == business_public_id,
+                        col(reserved_match.reserve).is_(True),
+                    )
+                )
+            )
+        result = await self.session.exec(query.returning(col(AvailableMatch.id)))  # type: ignore[call-overload]
+        deleted_ids: list[int] = list(result.scalars().all())
         await self.session.commit()
-        for available_match in available_matches:
-            await self.session.refresh(available_match)
+        return deleted_ids
+
+    async def has_reserved_matches_in_date(
+        self, court_name: str, business_public_id: uuid.UUID, date: date
+    ) -> bool:
+        query = select(AvailableMatch.id).where(
+            and_(
+                AvailableMatch.date == date,
+                AvailableMatch.court_name == court_name,
+                AvailableMatch.business_public_id == business_public_id,
+                col(AvailableMatch.reserve).is_(True),
+            )
+        )
+        result = await self.session.exec(query.limit(1))
+        return result.first() is not None
 
     async def get_available_match(
         self,
@@ -87,3 +300,198 @@ class AvailableMatchesRepository:
         await self.session.commit()
         await self.session.refresh(available_match)
         return available_match
+
+    def _not_held(self, hold_id: uuid.UUID | None = None) -> Any:
+        """The match has no active hold, or it is held by hold_id."""
+        conditions = [
+            col(AvailableMatch.hold_expires_at).is_(None),
+            col(AvailableMatch.hold_expires_at) <= func.now(),
+        ]
+        if hold_id is not None:
+            conditions.append(col(AvailableMatch.hold_id) == hold_id)
+        return or_(*conditions)
+
+    async def reserve_available_match(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hour: int,
+        hold_id: uuid.UUID | None = None,
+    ) -> AvailableMatch | None:
+        """Reserve the match in one conditional UPDATE, releasing its hold.
+
+        Returns None when the match does not exist, is already reserved or is
+        on an active hold other than hold_id.
+        """
+        query = (
+            update(AvailableMatch)
+            .where(
+                and_(
+                    AvailableMatch.date == date,
+                    AvailableMatch.court_name == court_name,
+                    AvailableMatch.business_public_id == business_public_id,
+                    AvailableMatch.initial_hour == hour,
+                    col(AvailableMatch.reserve).is_(False),
+                    self._not_held(hold_id),
+                )
+            )
+            .values(reserve=True, hold_id=None, hold_expires_at=None)
+            .returning(AvailableMatch)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.exec(query)  # type: ignore[call-overload]
+        available_match: AvailableMatch | None = result.scalars().first()
+        await self.session.commit()
+        return available_match
+
+    async def _update_all_or_none(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hours: list[int],
+        hold_id: uuid.UUID | None,
+        values: dict[str, Any],
+    ) -> list[AvailableMatch]:
+        """Update the free matches of every hour in one statement, all or none.
+
+        The free matches are locked in hour order, so overlapping updates wait
+        for each other instead of deadlocking, and only updated if all of them
+        are free. Returns an empty list when nothing was updated.
+        """
+        locked = (
+            select(AvailableMatch.id)
+            .where(
+                and_(
+                    AvailableMatch.date == date,
+                    AvailableMatch.court_name == court_name,
+                    AvailableMatch.business_public_id == business_public_id,
+                    col(AvailableMatch.initial_hour).in_(hours),
+                    col(AvailableMatch.reserve).is_(False),
+                    self._not_held(hold_id),
+                )
+            )
+            .order_by(col(AvailableMatch.initial_hour))
+            .with_for_update()
+            .cte("locked")
+        )
+        n_locked = select(func.count()).select_from(locked).scalar_subquery()
+        query = (
+            update(AvailableMatch)
+            .where(
+                and_(
+                    col(AvailableMatch.id).in_(select(locked.c.id)),
+                    n_locked == len(hours),
+                )
+            )
+            .values(values)
+            .returning(AvailableMatch)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.exec(query)  # type: ignore[call-overload]
+        available_matches: list[AvailableMatch] = list(result.scalars().all())
+        await self.session.commit()
+        return sorted(available_matches, key=lambda match: match.initial_hour)
+
+    async def reserve_available_matches(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hours: list[int],
+        hold_id: uuid.UUID | None = None,
+    ) -> list[AvailableMatch]:
+        """Reserve the matches of every hour, all or none, releasing their hold."""
+        return await self._update_all_or_none(
+            court_name,
+            business_public_id,
+            date,
+            hours,
+            hold_id,
+            {"reserve": True, "hold_id": None, "hold_expires_at": None},
+        )
+
+    async def hold_available_matches(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hours: list[int],
+        hold_id: uuid.UUID,
+        ttl: timedelta,
+    ) -> list[AvailableMatch]:
+        """Hold the matches of every hour for ttl, all or none.
+
+        Matches already held by hold_id are held again, extending the hold.
+        """
+        return await self._update_all_or_none(
+            court_name,
+            business_public_id,
+            date,
+            hours,
+            hold_id,
+            {"hold_id": hold_id, "hold_expires_at": func.now() + ttl},
+        )
+
+    async def release_hold(
+        self,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: date,
+        hold_id: uuid.UUID,
+    ) -> list[AvailableMatch]:
+        """Release the matches held by hold_id, returning them."""
+        query = (
+            update(AvailableMatch)
+            .where(
+                and_(
+                    AvailableMatch.date == date,
+                    AvailableMatch.court_name == court_name,
+                    AvailableMatch.business_public_id == business_public_id,
+                    AvailableMatch.hold_id == hold_id,
+                )
+            )
+            .values(hold_id=None, hold_expires_at=None)
+            .returning(AvailableMatch)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.exec(query)  # type: ignore[call-overload]
+        available_matches: list[AvailableMatch] = list(result.scalars().all())
+        await self.session.commit()
+        return available_matches
+
+    async def release_expired_holds(self, batch_size: int) -> list[AvailableMatch]:
+        """Release up to batch_size expired holds, the oldest first.
+
+        Uses the partial index of the holds; matches locked by another worker
+        are skipped, so several sweepers can run at once.
+        """
+        expired = (
+            select(AvailableMatch.id)
+            .where(col(AvailableMatch.hold_expires_at) <= func.now())
+            .order_by(col(AvailableMatch.hold_expires_at))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .cte("expired")
+        )
+        query = (
+            update(AvailableMatch)
+            .where(col(AvailableMatch.id).in_(select(expired.c.id)))
+            .values(hold_id=None, hold_expires_at=None)
+            .returning(AvailableMatch)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.exec(query)  # type: ignore[call-overload]
+        available_matches: list[AvailableMatch] = list(result.scalars().all())
+        await self.session.commit()
+        return available_matches
+
+
+def get_available_matches_repository(
+    session: AsyncSession,
+) -> AvailableMatchesRepository | AvailabilityDaysRepository:
+    """Repository of the storage chosen in AVAILABILITY_STORAGE."""
+    if settings.AVAILABILITY_STORAGE == "bitmap":
+        return AvailabilityDaysRepository(session)
+    return AvailableMatchesRepository(session)
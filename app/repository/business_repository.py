@@ -1,16 +1,21 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import func
-from sqlmodel import select
+from sqlmodel import and_, col, select
 
 from app.models.business import (
+    BUSINESS_TABLE_NAME,
     Business,
     BusinessCreate,
     BusinessesPublic,
     BusinessUpdate,
+    NearbyFilter,
 )
+from app.utilities.cursor import decode_int_id_cursor, encode_id_cursor
+from app.utilities.entity_cache import business_cache_key, get_entity_cache
 from app.utilities.exceptions import BusinessNotFoundException
+from app.utilities.geo import get_bounding_box, haversine_distance_km
+from app.utilities.pagination import CountMode, fetch_page
 
 
 class BusinessRepository:
@@ -34,33 +39,89 @@ class BusinessRepository:
         return new_business
 
     async def get_business(self, id: uuid.UUID) -> Business:
+        """Business by public id, read through the entity cache."""
+        entity_cache = get_entity_cache()
+        key = business_cache_key(id)
+        business = await entity_cache.get(self.session, Business, key)
+        if business is not None:
+            return business
         query = select(Business).where(Business.business_public_id == id)
         result = await self.session.exec(query)
         business = result.first()
         if not business:
             raise BusinessNotFoundException()
+        await entity_cache.set(key, business)
         return business
 
     async def get_businesses(
         self,
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
+        count_mode: CountMode | None = None,
         **filters: Any,
     ) -> BusinessesPublic:
+        """Page of businesses sorted by id.
+
+        With a cursor (the next_cursor of the previous page) skip is ignored and
+        the page starts right after the last business of the previous page.
+        count_mode chooses how the total count is computed, see CountMode; by
+        default it is exact. filters are column values to match.
+        """
         query = select(Business)
         # Filters
         for key, value in filters.items():
             attr = getattr(Business, key)
             query = query.where(attr == value)
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self.session.exec(count_query)
-        total_count = count_result.one()
 
-        query = query.offset(skip).limit(limit)
-        result = await self.session.exec(query)
-        businesses = result.all()
+        page_query = query
+        if cursor is not None:
+            page_query = page_query.where(Business.id > decode_int_id_cursor(cursor))
+        else:
+            page_query = page_query.offset(skip)
+        page_query = page_query.order_by(col(Business.id)).limit(limit + 1)
+        businesses, total_count = await fetch_page(
+            self.session,
+            page_query,
+            query,
+            count_mode or CountMode.EXACT,
+            keyset=cursor is not None,
+            offset=skip > 0,
+            table_name=None if filters else BUSINESS_TABLE_NAME,
+        )
+
+        next_cursor = None
+        if len(businesses) > limit:
+            businesses = businesses[:limit]
+            next_cursor = encode_id_cursor(businesses[-1].id)
+        return BusinessesPublic(
+            data=businesses, count=total_count, next_cursor=next_cursor
+        )
 
-        return BusinessesPublic(data=businesses, count=total_count)
+    async def get_businesses_nearby(
+        self, nearby_filter: NearbyFilter, limit: int = 100
+    ) -> list[tuple[Business, float]]:
+        """Businesses within radius_km of the point, closest first."""
+        min_latitude, max_latitude, min_longitude, max_longitude = get_bounding_box(
+            nearby_filter.lat, nearby_filter.lng, nearby_filter.radius_km
+        )
+        distance_km = haversine_distance_km(
+            Business.latitude, Business.longitude, nearby_filter.lat, nearby_filter.lng
+        )
+        query = (
+            select(Business, distance_km)
+            .where(
+                and_(
+                    col(Business.latitude).between(min_latitude, max_latitude),
+                    col(Business.longitude).between(min_longitude, max_longitude),
+                    distance_km <= nearby_filter.radius_km,
+                )
+            )
+            .order_by(distance_km)
+            .limit(limit)
+        )
+        result = await self.session.exec(query)
+        return list(result.all())
 
     async def update_business(
         self, business_public_id: uuid.UUID, business_in: BusinessUpdate
@@ -71,4 +132,5 @@ class BusinessRepository:
         self.session.add(business)
         await self.session.commit()
         await self.session.refresh(business)
+        await get_entity_cache().delete(business_cache_key(business_public_id))
         return business
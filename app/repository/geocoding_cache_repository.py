@@ -0,0 +1,34 @@
+import datetime
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import and_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.geocoding import GeocodedAddress
+
+
+class GeocodingCacheRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_geocoded_address(
+        self, address_key: str, now: datetime.datetime
+    ) -> GeocodedAddress | None:
+        query = select(GeocodedAddress).where(
+            and_(
+                GeocodedAddress.address_key == address_key,
+                GeocodedAddress.expires_at > now,
+            )
+        )
+        result = await self.session.exec(query)
+        return result.first()
+
+    async def save_geocoded_address(self, geocoded_address: GeocodedAddress) -> None:
+        values = geocoded_address.model_dump()
+        query = insert(GeocodedAddress).values(**values)
+        query = query.on_conflict_do_update(
+            index_elements=[GeocodedAddress.address_key],
+            set_={key: value for key, value in values.items() if key != "address_key"},
+        )
+        await self.session.exec(query)  # type: ignore[call-overload]
+        await self.session.commit()
@@ -1,9 +1,11 @@
 import uuid
 
-from sqlmodel import func, select
+from sqlmodel import col, select
 
-from app.models.item import Item, ItemCreate, ItemUpdate
+from app.models.item import Item, ItemCreate, ItemsPublic, ItemUpdate
+from app.utilities.cursor import decode_uuid_id_cursor, encode_id_cursor
 from app.utilities.exceptions import NotEnoughPermissionsException, NotFoundException
+from app.utilities.pagination import CountMode, fetch_page
 
 
 class ItemsRepository:
@@ -11,17 +13,34 @@ class ItemsRepository:
         self.session = session
 
     async def get_items(
-        self, user_id: uuid.UUID, skip: int = 0, limit: int = 100
-    ) -> list[Item]:
-        count_statement = (
-            select(func.count()).select_from(Item).where(Item.owner_id == user_id)
+        self,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> ItemsPublic:
+        query = select(Item).where(Item.owner_id == user_id)
+        statement = query
+        if cursor is not None:
+            statement = statement.where(Item.id > decode_uuid_id_cursor(cursor))
+        else:
+            statement = statement.offset(skip)
+        statement = statement.order_by(col(Item.id)).limit(limit + 1)
+        items, count = await fetch_page(
+            self.session,
+            statement,
+            query,
+            count_mode,
+            keyset=cursor is not None,
+            offset=skip > 0,
         )
-        count = (await self.session.exec(count_statement)).one()
-        statement = (
-            select(Item).where(Item.owner_id == user_id).offset(skip).limit(limit)
-        )
-        items = (await self.session.exec(statement)).all()
-        return items, count
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_id_cursor(items[-1].id)
+        return ItemsPublic(data=items, count=count, next_cursor=next_cursor)
 
     async def get_item(self, user_id: uuid.UUID, id: uuid.UUID) -> Item:
         item = await self.session.get(Item, id)
@@ -1,22 +1,28 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import func
-from sqlmodel import and_, select
+from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.business import Business
+from app.models.business import Business, NearbyFilter
 from app.models.padel_court import (
+    PADEL_COURT_TABLE_NAME,
     PadelCourt,
     PadelCourtCreate,
+    PadelCourtPublic,
     PadelCourtsPublic,
     PadelCourtUpdate,
 )
+from app.models.padel_court_extended import PadelCourtsPublicExtended
+from app.utilities.cursor import decode_int_id_cursor, encode_id_cursor
+from app.utilities.entity_cache import get_entity_cache, padel_court_cache_key
 from app.utilities.exceptions import (
     BusinessNotFoundException,
     NotFoundException,
     UnauthorizedPadelCourtOperationException,
 )
+from app.utilities.geo import get_bounding_box, haversine_distance_km
+from app.utilities.pagination import CountMode, fetch_page
 
 
 class PadelCourtRepository:
@@ -49,6 +55,12 @@ class PadelCourtRepository:
     async def get_padel_court(
         self, court_name: str, business_public_id: uuid.UUID
     ) -> PadelCourt:
+        """Court by name within the business, read through the entity cache."""
+        entity_cache = get_entity_cache()
+        key = padel_court_cache_key(business_public_id, court_name)
+        padel_court = await entity_cache.get(self.session, PadelCourt, key)
+        if padel_court is not None:
+            return padel_court
         query = select(PadelCourt).where(
             and_(
                 PadelCourt.name == court_name,
@@ -59,6 +71,7 @@ class PadelCourtRepository:
         padel_court = result.first()
         if not padel_court:
             raise NotFoundException("cancha")
+        await entity_cache.set(key, padel_court)
         return padel_court
 
     async def get_padel_court_without_name(
@@ -73,20 +86,69 @@ class PadelCourtRepository:
             raise NotFoundException("cancha")
         return court
 
-    async def get_padel_courts(
+    async def get_padel_court_with_business(
         self,
-        business_public_id: uuid.UUID = None,
-        user_id: uuid.UUID = None,
-        skip: int = 0,
-        limit: int = 100,
-        **filters: Any,
-    ) -> PadelCourtsPublic:
-        query = select(PadelCourt)
+        business_public_id: uuid.UUID,
+        court_name: str | None = None,
+        court_public_id: uuid.UUID | None = None,
+    ) -> tuple[Business, PadelCourt | None]:
+        """The business and its court, by name or public id, in one query.
 
+        The court is None when the business has no such court.
+        """
+        court_condition = (
+            col(PadelCourt.business_public_id) == Business.business_public_id
+        )
+        if court_name is not None:
+            court_condition = and_(court_condition, col(PadelCourt.name) == court_name)
+        if court_public_id is not None:
+            court_condition = and_(
+                court_condition, col(PadelCourt.court_public_id) == court_public_id
+            )
+        query = (
+            select(Business, PadelCourt)
+            .outerjoin(PadelCourt, court_condition)
+            .where(Business.business_public_id == business_public_id)
+        )
+        result = await self.session.exec(query)
+        row = result.first()
+        if not row:
+            raise BusinessNotFoundException()
+        return row[0], row[1]
+
+    async def get_padel_courts_with_business(
+        self, business_public_id: uuid.UUID, court_names: list[str] | None = None
+    ) -> tuple[Business, list[PadelCourt]]:
+        """The business and its courts, all of them or those named, in one query."""
+        court_condition = (
+            col(PadelCourt.business_public_id) == Business.business_public_id
+        )
+        if court_names is not None:
+            court_condition = and_(
+                court_condition, col(PadelCourt.name).in_(court_names)
+            )
+        query = (
+            select(Business, PadelCourt)
+            .outerjoin(PadelCourt, court_condition)
+            .where(Business.business_public_id == business_public_id)
+            .order_by(col(PadelCourt.id))
+        )
+        result = await self.session.exec(query)
+        rows = result.all()
+        if not rows:
+            raise BusinessNotFoundException()
+        courts = [court for _, court in rows if court is not None]
+        return rows[0][0], courts
+
+    def _filter_padel_courts(
+        self,
+        query: Any,
+        business_public_id: uuid.UUID | None = None,
+        user_id: uuid.UUID | None = None,
+        **filters: Any,
+    ) -> Any:
         if business_public_id and user_id:
-            query = query.join(
-                Business, PadelCourt.business_public_id == Business.business_public_id
-            ).where(
+            query = query.where(
                 and_(
                     PadelCourt.business_public_id == business_public_id,
                     Business.owner_id == user_id,
@@ -95,25 +157,152 @@ class PadelCourtRepository:
         for key, value in filters.items():
             attr = getattr(PadelCourt, key)
             query = query.where(attr == value)
+        return query
+
+    def _paginate_padel_courts(
+        self, query: Any, skip: int, limit: int, cursor: str | None
+    ) -> Any:
+        """Sort by id and fetch one extra row, to know if there is a next page.
+
+        With a cursor skip is ignored and the page starts after the cursor id.
+        """
+        if cursor is not None:
+            query = query.where(PadelCourt.id > decode_int_id_cursor(cursor))
+        else:
+            query = query.offset(skip)
+        return query.order_by(col(PadelCourt.id)).limit(limit + 1)
+
+    async def get_padel_courts(
+        self,
+        business_public_id: uuid.UUID | None = None,
+        user_id: uuid.UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        count_mode: CountMode | None = None,
+        **filters: Any,
+    ) -> PadelCourtsPublic:
+        query = select(PadelCourt)
+
+        filtered = bool(filters)
+        if business_public_id and user_id:
+            filtered = True
+            query = query.join(
+                Business,
+                col(PadelCourt.business_public_id) == Business.business_public_id,
+            )
+        query = self._filter_padel_courts(query, business_public_id, user_id, **filters)
 
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self.session.exec(count_query)
-        total_count = count_result.one()
+        page_query = self._paginate_padel_courts(query, skip, limit, cursor)
+        padel_courts, total_count = await fetch_page(
+            self.session,
+            page_query,
+            query,
+            count_mode or CountMode.EXACT,
+            keyset=cursor is not None,
+            offset=skip > 0,
+            table_name=None if filtered else PADEL_COURT_TABLE_NAME,
+        )
+
+        next_cursor = None
+        if len(padel_courts) > limit:
+            padel_courts = padel_courts[:limit]
+            next_cursor = encode_id_cursor(padel_courts[-1].id)
+        return PadelCourtsPublic(
+            data=padel_courts, count=total_count, next_cursor=next_cursor
+        )
+
+    async def get_padel_courts_extended(
+        self,
+        business_public_id: uuid.UUID | None = None,
+        user_id: uuid.UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        count_mode: CountMode | None = None,
+        **filters: Any,
+    ) -> PadelCourtsPublicExtended:
+        """Page of courts with their business, sorted by court id.
 
-        query = query.offset(skip).limit(limit)
+        Without count_mode count is the number of courts in the page, as it
+        always was for this listing; with it, the total count of the listing.
+        """
+        query = select(PadelCourt, Business).join(
+            Business, col(PadelCourt.business_public_id) == Business.business_public_id
+        )
+        filtered = bool(filters) or bool(business_public_id and user_id)
+        query = self._filter_padel_courts(query, business_public_id, user_id, **filters)
+        page_query = self._paginate_padel_courts(query, skip, limit, cursor)
+        rows, total_count = await fetch_page(
+            self.session,
+            page_query,
+            query,
+            count_mode or CountMode.NONE,
+            keyset=cursor is not None,
+            offset=skip > 0,
+            table_name=None if filtered else PADEL_COURT_TABLE_NAME,
+        )
+
+        courts_extended = PadelCourtsPublicExtended()
+        for padel_court, business in rows[:limit]:
+            courts_extended.add_court(
+                PadelCourtPublic.from_private(padel_court), business
+            )
+        if count_mode is not None:
+            courts_extended.count = total_count
+        if len(rows) > limit:
+            courts_extended.next_cursor = encode_id_cursor(rows[limit - 1][0].id)
+        return courts_extended
+
+    async def get_padel_courts_nearby(
+        self, nearby_filter: NearbyFilter, limit: int = 100
+    ) -> PadelCourtsPublicExtended:
+        """Courts whose business is within radius_km of the point, closest first."""
+        min_latitude, max_latitude, min_longitude, max_longitude = get_bounding_box(
+            nearby_filter.lat, nearby_filter.lng, nearby_filter.radius_km
+        )
+        distance_km = haversine_distance_km(
+            Business.latitude, Business.longitude, nearby_filter.lat, nearby_filter.lng
+        )
+        query = (
+            select(PadelCourt, Business)
+            .join(
+                Business,
+                col(PadelCourt.business_public_id) == Business.business_public_id,
+            )
+            .where(
+                and_(
+                    col(Business.latitude).between(min_latitude, max_latitude),
+                    col(Business.longitude).between(min_longitude, max_longitude),
+                    distance_km <= nearby_filter.radius_km,
+                )
+            )
+            .order_by(distance_km, col(PadelCourt.id))
+            .limit(limit)
+        )
         result = await self.session.exec(query)
-        padel_courts = result.all()
 
-        return PadelCourtsPublic(data=padel_courts, count=total_count)
+        courts_extended = PadelCourtsPublicExtended()
+        for padel_court, business in result.all():
+            courts_extended.add_court(
+                PadelCourtPublic.from_private(padel_court), business
+            )
+        return courts_extended
 
     async def update_padel_court(
         self, court_public_id: uuid.UUID, court_in: PadelCourtUpdate
     ) -> PadelCourt:
         court = await self.get_padel_court_without_name(court_public_id)
+        previous_name = court.name
 
         update_dict = court_in.model_dump(exclude_none=True)
         court.sqlmodel_update(update_dict)
         self.session.add(court)
         await self.session.commit()
         await self.session.refresh(court)
+        # Stale entries go away under the old name too, in case it was renamed
+        await get_entity_cache().delete(
+            padel_court_cache_key(court.business_public_id, previous_name),
+            padel_court_cache_key(court.business_public_id, court.name),
+        )
         return court
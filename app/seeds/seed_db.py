@@ -3,6 +3,7 @@ import asyncio
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 import app.core.db as db
+from app.migrations import upgrade
 from app.seeds.seed_config import RECORDS
 
 
@@ -11,13 +12,13 @@ async def seed_db() -> None:
     await db.restart_db()
     print("Ok")
 
-    print("Initing DB ...", end=" ")
-    await db.init_db()
+    print("Migrating DB ...", end=" ")
+    await upgrade(db.get_engine())
     print("Ok")
 
     print("Loading Seed ...", end=" ")
     if RECORDS:
-        engine = db.get_async_engine()
+        engine = db.get_engine()
         async with AsyncSession(engine, expire_on_commit=True) as _session:
             _session.add_all(RECORDS)
             await _session.commit()
@@ -25,6 +26,8 @@ async def seed_db() -> None:
     else:
         print("Empty")
 
+    await db.close_engine()
+
 
 if __name__ == "__main__":
     asyncio.run(seed_db())
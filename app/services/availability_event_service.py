@@ -0,0 +1,66 @@
+import asyncio
+import datetime
+import uuid
+from collections.abc import AsyncGenerator
+
+from app.core.config import settings
+from app.models.availability_day import AvailabilityDay, mask_to_hours
+from app.models.available_match import AvailabilityEvent, AvailabilityEventType
+from app.utilities.events import get_event_broker
+
+
+class AvailabilityEventService:
+    async def publish(
+        self,
+        type: AvailabilityEventType,
+        business_public_id: uuid.UUID,
+        court_name: str,
+        date: datetime.date,
+        hours: list[int] | None = None,
+    ) -> None:
+        event = AvailabilityEvent(
+            type=type,
+            business_public_id=business_public_id,
+            court_name=court_name,
+            date=date,
+            hours=hours or [],
+        )
+        await get_event_broker().publish(event.model_dump_json())
+
+    async def publish_days(
+        self, type: AvailabilityEventType, available_days: list[AvailabilityDay]
+    ) -> None:
+        """Publish an event per day with the hours of its offered mask."""
+        for day in available_days:
+            await self.publish(
+                type,
+                day.business_public_id,
+                day.court_name,
+                day.date,
+                mask_to_hours(day.offered_mask),
+            )
+
+    async def stream(
+        self,
+        business_public_id: uuid.UUID,
+        court_name: str | None = None,
+        date: datetime.date | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Server-sent events of the availability changes matching the filter.
+
+        A comment is sent when subscribed and then every heartbeat seconds
+        without events, so proxies keep the connection open.
+        """
+        async with get_event_broker().subscribe() as queue:
+            yield ": subscribed\n\n"
+            while True:
+                try:
+                    payload = await asyncio.wait_for(
+                        queue.get(), settings.AVAILABILITY_EVENTS_HEARTBEAT
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                event = AvailabilityEvent.model_validate_json(payload)
+                if event.matches(business_public_id, court_name, date):
+                    yield f"event: {event.type.value}\ndata: {payload}\n\n"
@@ -0,0 +1,163 @@
+import datetime
+import logging
+import uuid
+
+from app.core.config import settings
+from app.core.db import get_session_maker
+from app.models.availability_day import AvailabilityDay
+from app.models.availability_template import (
+    AvailabilityTemplate,
+    AvailabilityTemplateCreate,
+    AvailabilityTemplatePublic,
+)
+from app.models.available_match import AvailabilityEventType
+from app.repository.availability_template_repository import (
+    AvailabilityTemplateRepository,
+)
+from app.repository.available_matches_repository import (
+    get_available_matches_repository,
+)
+from app.services.availability_event_service import AvailabilityEventService
+from app.services.court_owner_verification_service import (
+    CourtOwnerVerificationService,
+)
+from app.services.padel_court_service import PadelCourtService
+from app.utilities.dependencies import SessionDep
+
+logger = logging.getLogger(__name__)
+
+
+class AvailabilityTemplateService:
+    def __init__(self) -> None:
+        self.event_service = AvailabilityEventService()
+
+    async def _to_public(
+        self,
+        session: SessionDep,
+        business_public_id: uuid.UUID,
+        court_name: str,
+        templates: list[AvailabilityTemplate],
+    ) -> AvailabilityTemplatePublic:
+        repo = AvailabilityTemplateRepository(session)
+        exceptions = await repo.get_exceptions(
+            business_public_id, court_name, datetime.date.today()
+        )
+        return AvailabilityTemplatePublic.from_private(templates, exceptions)
+
+    async def set_template(
+        self,
+        session: SessionDep,
+        user_id: uuid.UUID,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        template_in: AvailabilityTemplateCreate,
+    ) -> AvailabilityTemplatePublic:
+        await CourtOwnerVerificationService().verification_of_court_owner(
+            session, user_id, court_name, business_public_id
+        )
+        hours_masks = template_in.get_masks()
+        court = await PadelCourtService().get_padel_court(
+            session, court_name, business_public_id
+        )
+        repo = AvailabilityTemplateRepository(session)
+        templates = await repo.replace_templates(
+            business_public_id, court_name, court.court_public_id, hours_masks
+        )
+        return await self._to_public(session, business_public_id, court_name, templates)
+
+    async def get_template(
+        self, session: SessionDep, court_name: str, business_public_id: uuid.UUID
+    ) -> AvailabilityTemplatePublic:
+        await PadelCourtService().get_padel_court(
+            session, court_name, business_public_id
+        )
+        repo = AvailabilityTemplateRepository(session)
+        templates = await repo.get_templates(business_public_id, court_name)
+        return await self._to_public(session, business_public_id, court_name, templates)
+
+    async def add_exception(
+        self,
+        session: SessionDep,
+        user_id: uuid.UUID,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: datetime.date,
+    ) -> AvailabilityTemplatePublic:
+        await CourtOwnerVerificationService().verification_of_court_owner(
+            session, user_id, court_name, business_public_id
+        )
+        repo = AvailabilityTemplateRepository(session)
+        await repo.add_exception(business_public_id, court_name, date)
+        templates = await repo.get_templates(business_public_id, court_name)
+        return await self._to_public(session, business_public_id, court_name, templates)
+
+    async def delete_exception(
+        self,
+        session: SessionDep,
+        user_id: uuid.UUID,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: datetime.date,
+    ) -> None:
+        await CourtOwnerVerificationService().verification_of_court_owner(
+            session, user_id, court_name, business_public_id
+        )
+        repo = AvailabilityTemplateRepository(session)
+        await repo.delete_exception(business_public_id, court_name, date)
+
+    async def _add_available_days(
+        self, session: SessionDep, available_days: list[AvailabilityDay]
+    ) -> None:
+        repo = get_available_matches_repository(session)
+        created_days = await repo.add_available_days(available_days)
+        await self.event_service.publish_days(
+            AvailabilityEventType.CREATED, created_days
+        )
+
+    async def materialize(
+        self,
+        session: SessionDep,
+        court_name: str | None,
+        business_public_id: uuid.UUID | None,
+        date_from: datetime.date,
+        date_to: datetime.date,
+    ) -> int:
+        """Create the matches of the templates in the dates not handled yet.
+
+        Only the court's template, or those of the business, if given. Past
+        dates are never materialized. Returns the number of dates created.
+        """
+        date_from = max(date_from, datetime.date.today())
+        if date_to < date_from:
+            return 0
+        repo = AvailabilityTemplateRepository(session)
+        available_days = await repo.claim_template_dates(
+            date_from, date_to, business_public_id, court_name
+        )
+        if available_days:
+            await self._add_available_days(session, available_days)
+        return len(available_days)
+
+    async def materialize_ahead(self, session: SessionDep, weeks: int) -> int:
+        """Create the matches of every template for the next weeks, in bulk.
+
+        Only one worker at a time does it, the others return 0 right away.
+        """
+        repo = AvailabilityTemplateRepository(session)
+        if not await repo.try_lock_materialization():
+            await session.rollback()
+            return 0
+        today = datetime.date.today()
+        date_to = today + datetime.timedelta(weeks=weeks, days=-1)
+        available_days = await repo.claim_template_dates(today, date_to)
+        # Committing also releases the lock
+        await self._add_available_days(session, available_days)
+        return len(available_days)
+
+
+async def materialize_templates_job() -> None:
+    async with get_session_maker()() as session:
+        n_days = await AvailabilityTemplateService().materialize_ahead(
+            session, settings.AVAILABILITY_TEMPLATES_WEEKS_AHEAD
+        )
+    logger.info(f"Materialized {n_days} days of availability templates")
@@ -0,0 +1,140 @@
+import logging
+import uuid
+
+from fastapi import BackgroundTasks
+
+from app.core.config import settings
+from app.core.db import get_session_maker
+from app.models.availability_day import AvailabilityDay
+from app.models.available_match import AvailabilityEventType
+from app.models.available_match_bulk import (
+    AvailableMatchesBulkCreate,
+    AvailableMatchesBulkJob,
+    AvailableMatchesBulkJobStatus,
+)
+from app.repository.available_matches_bulk_job_repository import (
+    AvailableMatchesBulkJobRepository,
+)
+from app.repository.available_matches_repository import (
+    get_available_matches_repository,
+)
+from app.services.availability_event_service import AvailabilityEventService
+from app.services.court_owner_verification_service import (
+    CourtOwnerVerificationService,
+)
+from app.utilities.dependencies import SessionDep
+
+logger = logging.getLogger(__name__)
+
+# The cause is only logged, database errors are not shown to clients
+BULK_JOB_FAILED = "no se pudieron crear las disponibilidades"
+
+
+class AvailableMatchBulkService:
+    def __init__(self) -> None:
+        self.event_service = AvailabilityEventService()
+
+    async def create_available_matches_bulk(
+        self,
+        session: SessionDep,
+        user_id: uuid.UUID,
+        business_public_id: uuid.UUID,
+        bulk_in: AvailableMatchesBulkCreate,
+        background_tasks: BackgroundTasks,
+    ) -> AvailableMatchesBulkJob:
+        """Create the matches of every court x date x hours of the request.
+
+        Up to AVAILABLE_MATCHES_BULK_SYNC_MAX_DAYS court dates are created in
+        the request and the job is returned done; larger ones are left to a
+        background task and the job is returned pending. Hours that already
+        exist are skipped.
+        """
+        dates = bulk_in.get_dates()
+        offered_mask = bulk_in.get_mask()
+        courts = await CourtOwnerVerificationService().verification_of_courts_owner(
+            session, user_id, business_public_id, bulk_in.court_names
+        )
+        available_days = [
+            # Values come from the database and the validated request
+            AvailabilityDay.model_construct(
+                court_name=court.name,
+                court_public_id=court.court_public_id,
+                business_public_id=business_public_id,
+                date=date,
+                offered_mask=offered_mask,
+                reserved_mask=0,
+            )
+            for court in courts
+            for date in dates
+        ]
+        repo = AvailableMatchesBulkJobRepository(session)
+        job = await repo.create_job(business_public_id, len(available_days))
+        if len(available_days) <= settings.AVAILABLE_MATCHES_BULK_SYNC_MAX_DAYS:
+            return await self.run_job(session, job.job_public_id, available_days)
+        background_tasks.add_task(
+            run_available_matches_bulk_job, job.job_public_id, available_days
+        )
+        return job
+
+    async def get_job(
+        self,
+        session: SessionDep,
+        business_public_id: uuid.UUID,
+        job_public_id: uuid.UUID,
+    ) -> AvailableMatchesBulkJob:
+        repo = AvailableMatchesBulkJobRepository(session)
+        return await repo.get_job(business_public_id, job_public_id)
+
+    async def run_job(
+        self,
+        session: SessionDep,
+        job_public_id: uuid.UUID,
+        available_days: list[AvailabilityDay],
+    ) -> AvailableMatchesBulkJob:
+        """Add the days in batches, recording the progress after each one.
+
+        Any failure marks the job failed; the batches before it are kept.
+        """
+        repo = get_available_matches_repository(session)
+        job_repo = AvailableMatchesBulkJobRepository(session)
+        batch_size = settings.AVAILABLE_MATCHES_BULK_BATCH_DAYS
+        done_days = 0
+        job = None
+        try:
+            for start in range(0, len(available_days), batch_size):
+                batch = available_days[start : start + batch_size]
+                created_days = await repo.add_available_days(batch)
+                done_days += len(batch)
+                status = (
+                    AvailableMatchesBulkJobStatus.DONE
+                    if done_days == len(available_days)
+                    else AvailableMatchesBulkJobStatus.RUNNING
+                )
+                await self.event_service.publish_days(
+                    AvailabilityEventType.CREATED, created_days
+                )
+                job = await job_repo.update_job(
+                    job_public_id, status=status.value, done_days=done_days
+                )
+            if job is None:
+                job = await job_repo.update_job(
+                    job_public_id, status=AvailableMatchesBulkJobStatus.DONE.value
+                )
+        except Exception:
+            await session.rollback()
+            logger.exception(f"Bulk job {job_public_id} failed")
+            return await job_repo.update_job(
+                job_public_id,
+                status=AvailableMatchesBulkJobStatus.FAILED.value,
+                error=BULK_JOB_FAILED,
+            )
+        return job
+
+
+async def run_available_matches_bulk_job(
+    job_public_id: uuid.UUID, available_days: list[AvailabilityDay]
+) -> None:
+    async with get_session_maker()() as session:
+        await AvailableMatchBulkService().run_job(
+            session, job_public_id, available_days
+        )
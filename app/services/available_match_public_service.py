@@ -3,12 +3,21 @@ import uuid
 
 from app.models.available_match import (
     AvailableMatchCreate,
+    AvailableMatchesCreatedPublic,
+    AvailableMatchesHoldPublic,
+    AvailableMatchesHours,
+    AvailableMatchesInRangePublic,
     AvailableMatchesPublic,
+    AvailableMatchesRangeFilter,
+    AvailableMatchesSearchFilter,
+    AvailableMatchesSearchPublic,
     AvailableMatchPublic,
 )
 from app.services.available_match_service import AvailableMatchService
 from app.services.business_service import BusinessService
+from app.utilities.cursor import decode_cursor, encode_cursor
 from app.utilities.dependencies import SessionDep
+from app.utilities.exceptions import NotAcceptableException
 
 
 class AvailableMatchServicePublic:
@@ -23,15 +32,23 @@ class AvailableMatchServicePublic:
         court_name: str,
         business_public_id: uuid.UUID,
         available_match_in: AvailableMatchCreate,
-    ) -> AvailableMatchesPublic:
+        ignore_existing: bool = False,
+    ) -> AvailableMatchesCreatedPublic:
         available_matches = (
             await self.service_available_match.create_available_matches_in_date(
-                session, user_id, court_name, business_public_id, available_match_in
+                session,
+                user_id,
+                court_name,
+                business_public_id,
+                available_match_in,
+                ignore_existing,
             )
         )
         business = await self.business_service.get_business(session, business_public_id)
-        return AvailableMatchesPublic.from_private(
-            available_matches, business.get_coordinates()
+        return AvailableMatchesCreatedPublic.from_created(
+            available_matches,
+            business.get_coordinates(),
+            available_match_in.get_hours(),
         )
 
     async def get_available_matches_in_date(
@@ -51,6 +68,23 @@ class AvailableMatchServicePublic:
             available_matches, business.get_coordinates()
         )
 
+    async def get_available_matches_in_range(
+        self,
+        session: SessionDep,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        range_filter: AvailableMatchesRangeFilter,
+    ) -> AvailableMatchesInRangePublic:
+        available_matches = (
+            await self.service_available_match.get_available_matches_in_range(
+                session, court_name, business_public_id, range_filter
+            )
+        )
+        business = await self.business_service.get_business(session, business_public_id)
+        return AvailableMatchesInRangePublic.from_private(
+            available_matches, business.get_coordinates()
+        )
+
     async def reserve_available_match(
         self,
         session: SessionDep,
@@ -58,11 +92,82 @@ class AvailableMatchServicePublic:
         business_public_id: uuid.UUID,
         date: datetime.date,
         hour: int,
+        hold_id: uuid.UUID | None = None,
     ) -> AvailableMatchPublic:
         available_match = await self.service_available_match.reserve_available_match(
-            session, court_name, business_public_id, date, hour
+            session, court_name, business_public_id, date, hour, hold_id
         )
         business = await self.business_service.get_business(session, business_public_id)
         return AvailableMatchPublic.from_private(
             available_match, business.get_coordinates()
         )
+
+    async def reserve_available_matches(
+        self,
+        session: SessionDep,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: datetime.date,
+        matches_in: AvailableMatchesHours,
+        hold_id: uuid.UUID | None = None,
+    ) -> AvailableMatchesPublic:
+        available_matches = (
+            await self.service_available_match.reserve_available_matches(
+                session, court_name, business_public_id, date, matches_in, hold_id
+            )
+        )
+        business = await self.business_service.get_business(session, business_public_id)
+        return AvailableMatchesPublic.from_private(
+            available_matches, business.get_coordinates()
+        )
+
+    async def hold_available_matches(
+        self,
+        session: SessionDep,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: datetime.date,
+        matches_in: AvailableMatchesHours,
+        hold_id: uuid.UUID | None = None,
+    ) -> AvailableMatchesHoldPublic:
+        available_matches = await self.service_available_match.hold_available_matches(
+            session, court_name, business_public_id, date, matches_in, hold_id
+        )
+        business = await self.business_service.get_business(session, business_public_id)
+        return AvailableMatchesHoldPublic.from_held(
+            available_matches, business.get_coordinates()
+        )
+
+    async def search_available_matches(
+        self,
+        session: SessionDep,
+        search_filter: AvailableMatchesSearchFilter,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> AvailableMatchesSearchPublic:
+        search_filter.validate_search()
+        after = self._decode_search_cursor(cursor) if cursor else None
+        rows = await self.service_available_match.search_available_matches(
+            session, search_filter, after, limit + 1
+        )
+
+        data = [
+            AvailableMatchPublic.from_private(available_match, (latitude, longitude))
+            for available_match, latitude, longitude in rows[:limit]
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            last_match = rows[limit - 1][0]
+            next_cursor = encode_cursor(
+                [last_match.date, last_match.initial_hour, last_match.id]
+            )
+        return AvailableMatchesSearchPublic(
+            data=data, count=len(data), next_cursor=next_cursor
+        )
+
+    def _decode_search_cursor(self, cursor: str) -> tuple[datetime.date, int, int]:
+        date, hour, id = decode_cursor(cursor, 3)
+        try:
+            return datetime.date.fromisoformat(date), int(hour), int(id)
+        except (TypeError, ValueError):
+            raise NotAcceptableException("cursor inválido")
@@ -1,18 +1,55 @@
 import datetime
+import logging
 import uuid
 
 from sqlalchemy.exc import IntegrityError
 
-from app.models.available_match import AvailableMatch, AvailableMatchCreate
-from app.repository.available_matches_repository import AvailableMatchesRepository
+from app.core.config import settings
+from app.core.db import get_session_maker
+from app.models.available_match import (
+    AvailabilityEventType,
+    AvailableMatch,
+    AvailableMatchCreate,
+    AvailableMatchesHours,
+    AvailableMatchesRangeFilter,
+    AvailableMatchesSearchFilter,
+)
+from app.repository.available_matches_repository import (
+    get_available_matches_repository,
+)
+from app.services.availability_event_service import AvailabilityEventService
+from app.services.availability_template_service import AvailabilityTemplateService
 from app.services.court_owner_verification_service import (
     CourtOwnerVerificationService,
 )
 from app.utilities.dependencies import SessionDep
-from app.utilities.exceptions import CourtAlreadyReservedException, NotUniqueException
+from app.utilities.exceptions import (
+    CourtAlreadyReservedException,
+    NotFoundException,
+    NotUniqueException,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class AvailableMatchService:
+    def __init__(self) -> None:
+        self.event_service = AvailabilityEventService()
+        self.template_service = AvailabilityTemplateService()
+
+    async def _materialize_templates(
+        self,
+        session: SessionDep,
+        court_name: str | None,
+        business_public_id: uuid.UUID | None,
+        date_from: datetime.date,
+        date_to: datetime.date,
+    ) -> None:
+        if settings.AVAILABILITY_TEMPLATES_LAZY:
+            await self.template_service.materialize(
+                session, court_name, business_public_id, date_from, date_to
+            )
+
     async def create_available_matches_in_date(
         self,
         session: SessionDep,
@@ -20,6 +57,7 @@ class AvailableMatchService:
         court_name: str,
         business_public_id: uuid.UUID,
         available_matches_in: AvailableMatchCreate,
+        ignore_existing: bool = False,
     ) -> list[AvailableMatch]:
         service_aux = CourtOwnerVerificationService()
         await service_aux.verification_of_court_owner(
@@ -27,15 +65,25 @@ class AvailableMatchService:
         )
 
         available_matches_in.validate_create()
-        repo = AvailableMatchesRepository(session)
+        repo = get_available_matches_repository(session)
         try:
-            result = await repo.create_available_matches_in_date(available_matches_in)
-            return result
+            result = await repo.create_available_matches_in_date(
+                available_matches_in, ignore_existing
+            )
         except IntegrityError:
             await session.rollback()
             raise NotUniqueException("Disponibilidad")
         except Exception as e:
             raise e
+        if result:
+            await self.event_service.publish(
+                AvailabilityEventType.CREATED,
+                business_public_id,
+                court_name,
+                available_matches_in.date,
+                [available_match.initial_hour for available_match in result],
+            )
+        return result
 
     async def get_available_matches_in_date(
         self,
@@ -44,12 +92,58 @@ class AvailableMatchService:
         business_public_id: uuid.UUID,
         date: datetime.date,
     ) -> list[AvailableMatch]:
-        repo = AvailableMatchesRepository(session)
+        await self._materialize_templates(
+            session, court_name, business_public_id, date, date
+        )
+        repo = get_available_matches_repository(session)
         available_matches = await repo.get_available_matches_in_date(
             court_name, business_public_id, date
         )
         return available_matches
 
+    async def get_available_matches_in_range(
+        self,
+        session: SessionDep,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        range_filter: AvailableMatchesRangeFilter,
+    ) -> list[AvailableMatch]:
+        range_filter.validate_range()
+        await self._materialize_templates(
+            session,
+            court_name,
+            business_public_id,
+            range_filter.date_from,
+            range_filter.get_date_to(),
+        )
+        repo = get_available_matches_repository(session)
+        return await repo.get_available_matches_in_range(
+            court_name, business_public_id, range_filter
+        )
+
+    async def search_available_matches(
+        self,
+        session: SessionDep,
+        search_filter: AvailableMatchesSearchFilter,
+        after: tuple[datetime.date, int, int] | None = None,
+        limit: int = 100,
+    ) -> list[tuple[AvailableMatch, float, float]]:
+        """Free matches of every court, with the location of their business.
+
+        Only the templates of the filtered business are materialized here, the
+        search across businesses relies on materialize_ahead.
+        """
+        if search_filter.business_public_id is not None:
+            await self._materialize_templates(
+                session,
+                None,
+                search_filter.business_public_id,
+                search_filter.date_from,
+                search_filter.get_date_to(),
+            )
+        repo = get_available_matches_repository(session)
+        return await repo.search_available_matches(search_filter, after, limit)
+
     async def reserve_available_match(
         self,
         session: SessionDep,
@@ -57,15 +151,152 @@ class AvailableMatchService:
         business_public_id: uuid.UUID,
         date: datetime.date,
         hour: int,
+        hold_id: uuid.UUID | None = None,
     ) -> AvailableMatch:
-        repo = AvailableMatchesRepository(session)
-        available_match = await repo.get_available_match(
-            court_name, business_public_id, date, hour
+        """Reserve the match; a match on hold can only be reserved with its hold_id."""
+        await self._materialize_templates(
+            session, court_name, business_public_id, date, date
+        )
+        repo = get_available_matches_repository(session)
+        available_match = await repo.reserve_available_match(
+            court_name, business_public_id, date, hour, hold_id
         )
-        if available_match.is_reserved():
+        if available_match is None:
+            # Nothing was updated: raises NotFoundException if the match is missing
+            await repo.get_available_match(court_name, business_public_id, date, hour)
             raise CourtAlreadyReservedException(court_name)
-        available_match.set_reserve()
-        return await repo.update_available_match(available_match)
+        await self.event_service.publish(
+            AvailabilityEventType.RESERVED, business_public_id, court_name, date, [hour]
+        )
+        return available_match
+
+    async def reserve_available_matches(
+        self,
+        session: SessionDep,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: datetime.date,
+        matches_in: AvailableMatchesHours,
+        hold_id: uuid.UUID | None = None,
+    ) -> list[AvailableMatch]:
+        """Reserve n_matches consecutive matches from initial_hour, all or none."""
+        hours = matches_in.get_hours()
+        await self._materialize_templates(
+            session, court_name, business_public_id, date, date
+        )
+        repo = get_available_matches_repository(session)
+        available_matches = await repo.reserve_available_matches(
+            court_name, business_public_id, date, hours, hold_id
+        )
+        if not available_matches:
+            await self._raise_not_updated(
+                session, court_name, business_public_id, date, hours
+            )
+        await self.event_service.publish(
+            AvailabilityEventType.RESERVED, business_public_id, court_name, date, hours
+        )
+        return available_matches
+
+    async def _raise_not_updated(
+        self,
+        session: SessionDep,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: datetime.date,
+        hours: list[int],
+    ) -> None:
+        """Nothing was updated: find out whether a match is missing or taken."""
+        repo = get_available_matches_repository(session)
+        existing = await repo.get_available_matches_in_date(
+            court_name, business_public_id, date
+        )
+        existing_hours = {match.initial_hour for match in existing}
+        if not existing_hours.issuperset(hours):
+            raise NotFoundException("Disponibilidad para el match")
+        raise CourtAlreadyReservedException(court_name)
+
+    async def hold_available_matches(
+        self,
+        session: SessionDep,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: datetime.date,
+        matches_in: AvailableMatchesHours,
+        hold_id: uuid.UUID | None = None,
+    ) -> list[AvailableMatch]:
+        """Hold consecutive matches for AVAILABLE_MATCHES_HOLD_TTL, all or none.
+
+        Reserving them needs the hold_id of the returned matches until the hold
+        expires. Holding again with the same hold_id extends it.
+        """
+        hours = matches_in.get_hours()
+        await self._materialize_templates(
+            session, court_name, business_public_id, date, date
+        )
+        repo = get_available_matches_repository(session)
+        available_matches = await repo.hold_available_matches(
+            court_name,
+            business_public_id,
+            date,
+            hours,
+            hold_id or uuid.uuid4(),
+            datetime.timedelta(seconds=settings.AVAILABLE_MATCHES_HOLD_TTL),
+        )
+        if not available_matches:
+            await self._raise_not_updated(
+                session, court_name, business_public_id, date, hours
+            )
+        await self.event_service.publish(
+            AvailabilityEventType.HELD, business_public_id, court_name, date, hours
+        )
+        return available_matches
+
+    async def release_hold(
+        self,
+        session: SessionDep,
+        court_name: str,
+        business_public_id: uuid.UUID,
+        date: datetime.date,
+        hold_id: uuid.UUID,
+    ) -> None:
+        repo = get_available_matches_repository(session)
+        released = await repo.release_hold(
+            court_name, business_public_id, date, hold_id
+        )
+        await self._publish_released(released)
+
+    async def release_expired_holds(self, session: SessionDep) -> int:
+        """Release every expired hold in batches, returning how many were released.
+
+        Reads already treat expired holds as free, this only clears them.
+        """
+        repo = get_available_matches_repository(session)
+        batch_size = settings.AVAILABLE_MATCHES_HOLDS_SWEEP_BATCH
+        n_released = 0
+        while True:
+            released = await repo.release_expired_holds(batch_size)
+            await self._publish_released(released)
+            n_released += len(released)
+            if len(released) < batch_size:
+                return n_released
+
+    async def _publish_released(self, available_matches: list[AvailableMatch]) -> None:
+        hours_by_day: dict[tuple[uuid.UUID, str, datetime.date], list[int]] = {}
+        for available_match in available_matches:
+            key = (
+                available_match.business_public_id,
+                available_match.court_name,
+                available_match.date,
+            )
+            hours_by_day.setdefault(key, []).append(available_match.initial_hour)
+        for (business_public_id, court_name, date), hours in hours_by_day.items():
+            await self.event_service.publish(
+                AvailabilityEventType.RELEASED,
+                business_public_id,
+                court_name,
+                date,
+                sorted(hours),
+            )
 
     async def delete_available_matches_in_date(
         self,
@@ -74,14 +305,31 @@ class AvailableMatchService:
         court_name: str,
         business_public_id: uuid.UUID,
         date: datetime.date,
-    ) -> None:
+        force: bool = True,
+    ) -> int:
         service_aux = CourtOwnerVerificationService()
         await service_aux.verification_of_court_owner(
             session, user_id, court_name, business_public_id
         )
 
-        repo = AvailableMatchesRepository(session)
-        await repo.delete_available_matches_in_date(
-            court_name, business_public_id, date
+        repo = get_available_matches_repository(session)
+        deleted_ids = await repo.delete_available_matches_in_date(
+            court_name, business_public_id, date, force
         )
-        return
+        if not deleted_ids and not force:
+            if await repo.has_reserved_matches_in_date(
+                court_name, business_public_id, date
+            ):
+                raise CourtAlreadyReservedException(court_name)
+        if deleted_ids:
+            await self.event_service.publish(
+                AvailabilityEventType.DELETED, business_public_id, court_name, date
+            )
+        return len(deleted_ids)
+
+
+async def release_expired_holds_job() -> None:
+    async with get_session_maker()() as session:
+        n_released = await AvailableMatchService().release_expired_holds(session)
+    if n_released:
+        logger.info(f"Released {n_released} expired holds of available matches")
@@ -1,19 +1,53 @@
 import logging
+from importlib.util import find_spec
 from typing import Any
 
 import httpx
 from httpx._types import QueryParamTypes, RequestData
 
+from app.core.config import settings
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+_http_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def get_http_client(base_url: str) -> httpx.AsyncClient:
+    """Return the shared client for an upstream host, creating it on first use."""
+    client = _http_clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(
+                settings.HTTP_CLIENT_TIMEOUT,
+                connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT,
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _http_clients[base_url] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every shared client and its pooled connections."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
 
 class BaseService:
     def __init__(self) -> None:
         """Init the service."""
         self.base_url = ""
         self.base_headers: dict[str, str] = {}
-        self.timeout = 5
         self._set_base_url("localhost", 8000)
 
     def _set_base_url(self, host: str = "localhost", port: int | None = None) -> None:
@@ -34,6 +68,10 @@ class BaseService:
         """Generate a full URL from an endpoint."""
         return f"{self.base_url}{endpoint}"
 
+    def get_client(self) -> httpx.AsyncClient:
+        """Get the shared client for the service host."""
+        return get_http_client(self.base_url)
+
     async def get(
         self,
         endpoint: str,
@@ -44,8 +82,7 @@ class BaseService:
         url = self.generate_url(endpoint)
         all_headers = {**self.base_headers, **(headers or {})}
         logger.info(f"GET request to {url}, params: {params}, headers: {all_headers}")
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, params=params, headers=all_headers)
+        response = await self.get_client().get(url, params=params, headers=all_headers)
         return await self._handle_response(response)
 
     async def post(
@@ -62,10 +99,13 @@ class BaseService:
         logger.info(
             f"POST request to {url}, data: {data}, json: {json}, headers: {all_headers}, params: {params}"
         )
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url, data=data, json=json, headers=all_headers, params=params
-            )
+        response = await self.get_client().post(
+            url,
+            data=data,
+            json=json,
+            headers=all_headers,
+            params=params,
+        )
         return await self._handle_response(response)
 
     async def patch(
@@ -81,10 +121,9 @@ class BaseService:
         logger.info(
             f"PATCH request to {url}, data: {data}, json: {json}, headers: {all_headers}"
         )
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.patch(
-                url, data=data, json=json, headers=all_headers
-            )
+        response = await self.get_client().patch(
+            url, data=data, json=json, headers=all_headers
+        )
         return await self._handle_response(response)
 
     async def put(
@@ -100,8 +139,9 @@ class BaseService:
         logger.info(
             f"PUT request to {url}, data: {data}, json: {json}, headers: {all_headers}"
         )
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.put(url, data=data, json=json, headers=all_headers)
+        response = await self.get_client().put(
+            url, data=data, json=json, headers=all_headers
+        )
         return await self._handle_response(response)
 
     async def delete(self, endpoint: str, headers: dict[str, str] | None = None) -> Any:
@@ -109,8 +149,7 @@ class BaseService:
         url = self.generate_url(endpoint)
         all_headers = {**self.base_headers, **(headers or {})}
         logger.info(f"DELETE request to {url}, headers: {all_headers}")
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.delete(url, headers=all_headers)
+        response = await self.get_client().delete(url, headers=all_headers)
         return await self._handle_response(response)
 
     async def _handle_response(self, response: httpx.Response) -> Any | None:
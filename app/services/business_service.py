@@ -4,30 +4,43 @@ from app.models.business import (
     Business,
     BusinessCreate,
     BusinessesFilters,
+    BusinessesNearbyPublic,
     BusinessesPublic,
+    BusinessNearbyPublic,
     BusinessUpdate,
+    NearbyFilter,
 )
 from app.repository.business_repository import BusinessRepository
-from app.services.google_service import GoogleService
+from app.services.geocoding_service import GeocodingService
 from app.utilities.dependencies import SessionDep
 from app.utilities.exceptions import (
     BusinessNotFoundException,
     BusinessNotFoundHTTPException,
     UnauthorizedUserException,
 )
+from app.utilities.pagination import CountMode
+from app.utilities.request_cache import business_key, get_request_cache
 
 
 class BusinessService:
-    async def _get_coordinates(self, location: str) -> tuple[float, float]:
-        google_service = GoogleService()
-        longitude, latitude = await google_service.get_coordinates(location)
+    async def _get_coordinates(
+        self, session: SessionDep, location: str
+    ) -> tuple[float, float]:
+        geocoding_service = GeocodingService()
+        longitude, latitude = await geocoding_service.get_coordinates(session, location)
         return float(longitude), float(latitude)
 
     async def get_business(
         self, session: SessionDep, business_public_id: uuid.UUID
     ) -> Business:
-        repo = BusinessRepository(session)
-        return await repo.get_business(business_public_id)
+        cache = get_request_cache(session)
+        key = business_key(business_public_id)
+        business: Business | None = cache.get(key)
+        if business is None:
+            repo = BusinessRepository(session)
+            business = await repo.get_business(business_public_id)
+            cache[key] = business
+        return business
 
     async def validate_user_is_owner(
         self, session: SessionDep, business_public_id: uuid.UUID, user_id: uuid.UUID
@@ -42,16 +55,33 @@ class BusinessService:
         business_filter: BusinessesFilters = BusinessesFilters(),
         skip: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
+        count_mode: CountMode | None = None,
     ) -> BusinessesPublic:
         repo = BusinessRepository(session)
         filters = business_filter.model_dump(exclude_unset=True, exclude_none=True)
-        return await repo.get_businesses(skip, limit, **filters)
+        return await repo.get_businesses(
+            skip, limit, cursor=cursor, count_mode=count_mode, **filters
+        )
+
+    async def get_businesses_nearby(
+        self, session: SessionDep, nearby_filter: NearbyFilter, limit: int = 100
+    ) -> BusinessesNearbyPublic:
+        repo = BusinessRepository(session)
+        rows = await repo.get_businesses_nearby(nearby_filter, limit)
+        data = [
+            BusinessNearbyPublic.model_validate(
+                business, update={"distance_km": distance_km}
+            )
+            for business, distance_km in rows
+        ]
+        return BusinessesNearbyPublic(data=data, count=len(data))
 
     async def create_business(
         self, session: SessionDep, owner_id: uuid.UUID, business_in: BusinessCreate
     ) -> Business:
         location = business_in.get_location()
-        longitude, latitude = await self._get_coordinates(location)
+        longitude, latitude = await self._get_coordinates(session, location)
         repo = BusinessRepository(session)
         business = await repo.create_business(
             owner_id, business_in, longitude, latitude
@@ -72,4 +102,6 @@ class BusinessService:
         except Exception as e:
             raise e
         repo = BusinessRepository(session)
-        return await repo.update_business(business_public_id, business_in)
+        business = await repo.update_business(business_public_id, business_in)
+        get_request_cache(session)[business_key(business_public_id)] = business
+        return business
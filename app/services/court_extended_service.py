@@ -1,18 +1,39 @@
-from app.models.padel_court import PadelCourtsPublic
+import uuid
+
+from app.models.business import NearbyFilter
+from app.models.padel_court import PadelCourtFilter
 from app.models.padel_court_extended import PadelCourtsPublicExtended
-from app.services.business_service import BusinessService
+from app.repository.padel_court_repository import PadelCourtRepository
 from app.utilities.dependencies import SessionDep
+from app.utilities.pagination import CountMode
 
 
 class PadelCourtExtendedService:
     async def get_public_courts_extended(
-        self, session: SessionDep, courts: PadelCourtsPublic
+        self,
+        session: SessionDep,
+        user_id: uuid.UUID | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        court_filters: PadelCourtFilter = PadelCourtFilter(),
+        cursor: str | None = None,
+        count_mode: CountMode | None = None,
+    ) -> PadelCourtsPublicExtended:
+        repo = PadelCourtRepository(session)
+        filters = court_filters.model_dump(exclude_unset=True, exclude_none=True)
+        business_public_id = filters.pop("business_public_id", None)
+        return await repo.get_padel_courts_extended(
+            business_public_id,
+            user_id,
+            skip,
+            limit,
+            cursor=cursor,
+            count_mode=count_mode,
+            **filters,
+        )
+
+    async def get_public_courts_nearby(
+        self, session: SessionDep, nearby_filter: NearbyFilter, limit: int = 100
     ) -> PadelCourtsPublicExtended:
-        courts_for_business = courts.get_padel_courts_for_business()
-        business_service = BusinessService()
-        result = PadelCourtsPublicExtended()
-        for busniness_public_id, public_courts in courts_for_business.items():
-            business = await business_service.get_business(session, busniness_public_id)
-            for public_court in public_courts:
-                result.add_court(public_court, business)
-        return result
+        repo = PadelCourtRepository(session)
+        return await repo.get_padel_courts_nearby(nearby_filter, limit)
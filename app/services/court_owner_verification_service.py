@@ -1,15 +1,51 @@
 import uuid
 
-from app.services.business_service import BusinessService
-from app.services.padel_court_service import PadelCourtService
+from app.models.business import Business
+from app.models.padel_court import PadelCourt
+from app.repository.padel_court_repository import PadelCourtRepository
 from app.utilities.dependencies import SessionDep
 from app.utilities.exceptions import (
     BusinessNotFoundException,
     BusinessNotFoundHTTPException,
+    NotFoundException,
+    UnauthorizedUserException,
+)
+from app.utilities.request_cache import (
+    business_key,
+    get_request_cache,
+    padel_court_key,
 )
 
 
 class CourtOwnerVerificationService:
+    async def _get_court_with_business(
+        self,
+        session: SessionDep,
+        business_public_id: uuid.UUID,
+        court_name: str | None = None,
+        court_public_id: uuid.UUID | None = None,
+    ) -> tuple[Business, PadelCourt | None]:
+        repo = PadelCourtRepository(session)
+        try:
+            business, court = await repo.get_padel_court_with_business(
+                business_public_id, court_name, court_public_id
+            )
+        except BusinessNotFoundException as e:
+            raise BusinessNotFoundHTTPException(str(e))
+        cache = get_request_cache(session)
+        cache[business_key(business_public_id)] = business
+        if court is not None:
+            cache[padel_court_key(business_public_id, court.name)] = court
+        return business, court
+
+    def _verify(
+        self, user_id: uuid.UUID, business: Business, court: PadelCourt | None
+    ) -> None:
+        if not business.is_owned(user_id):
+            raise UnauthorizedUserException()
+        if court is None:
+            raise NotFoundException("cancha")
+
     async def verification_of_court_owner(
         self,
         session: SessionDep,
@@ -17,17 +53,40 @@ class CourtOwnerVerificationService:
         court_name: str,
         business_public_id: uuid.UUID,
     ) -> None:
+        cache = get_request_cache(session)
+        business = cache.get(business_key(business_public_id))
+        court = cache.get(padel_court_key(business_public_id, court_name))
+        if business is None or court is None:
+            business, court = await self._get_court_with_business(
+                session, business_public_id, court_name=court_name
+            )
+        self._verify(user_id, business, court)
+
+    async def verification_of_courts_owner(
+        self,
+        session: SessionDep,
+        user_id: uuid.UUID,
+        business_public_id: uuid.UUID,
+        court_names: list[str] | None = None,
+    ) -> list[PadelCourt]:
+        """Verify the owner once for several courts of the business.
+
+        Returns the courts named, or every court of the business without names.
+        """
+        repo = PadelCourtRepository(session)
         try:
-            await BusinessService().validate_user_is_owner(
-                session, business_public_id, user_id
+            business, courts = await repo.get_padel_courts_with_business(
+                business_public_id, court_names
             )
         except BusinessNotFoundException as e:
             raise BusinessNotFoundHTTPException(str(e))
-        except Exception as e:
-            raise e
-        await PadelCourtService().get_padel_court(
-            session, court_name, business_public_id
-        )
+        if not business.is_owned(user_id):
+            raise UnauthorizedUserException()
+        if not courts or (
+            court_names is not None and len(courts) != len(set(court_names))
+        ):
+            raise NotFoundException("cancha")
+        return courts
 
     async def verification_of_court_owner_without_name(
         self,
@@ -36,14 +95,7 @@ class CourtOwnerVerificationService:
         business_public_id: uuid.UUID,
         court_public_id: uuid.UUID,
     ) -> None:
-        try:
-            await BusinessService().validate_user_is_owner(
-                session, business_public_id, user_id
-            )
-        except BusinessNotFoundException as e:
-            raise BusinessNotFoundHTTPException(str(e))
-        except Exception as e:
-            raise e
-        await PadelCourtService().get_padel_court_without_name(
-            session, court_public_id, business_public_id
+        business, court = await self._get_court_with_business(
+            session, business_public_id, court_public_id=court_public_id
         )
+        self._verify(user_id, business, court)
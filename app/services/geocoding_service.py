@@ -0,0 +1,110 @@
+import datetime
+import re
+import unicodedata
+from collections import Counter
+
+from app.core.config import settings
+from app.models.geocoding import GeocodedAddress
+from app.repository.geocoding_cache_repository import GeocodingCacheRepository
+from app.services.google_service import GoogleService
+from app.utilities.cache import TTLCache
+from app.utilities.dependencies import SessionDep
+from app.utilities.exceptions import ExternalServiceInvalidLocalizationException
+
+GOOGLE_SERVICE_NAME = "google-address"
+
+geocoding_cache: TTLCache[str, GeocodedAddress] = TTLCache(
+    max_size=settings.GEOCODING_CACHE_MAX_SIZE,
+    ttl=settings.GEOCODING_CACHE_TTL,
+)
+geocoding_stats: Counter[str] = Counter()
+
+
+def normalize_address(address: str) -> str:
+    """Build the cache key of an address, ignoring case, accents and punctuation."""
+    decomposed = unicodedata.normalize("NFKD", address.casefold())
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    without_punctuation = re.sub(r"[^\w\s]", " ", without_accents)
+    return " ".join(without_punctuation.split())[:255]
+
+
+def _utc_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class GeocodingService:
+    """Cache in front of GoogleService.get_coordinates.
+
+    Lookups go to the in-process LRU first, then to the table shared by every
+    worker (when GEOCODING_CACHE_PERSISTENT is set) and only then to Google.
+    Invalid addresses are cached as well, for GEOCODING_CACHE_NEGATIVE_TTL.
+    """
+
+    async def get_coordinates(
+        self, session: SessionDep, address: str
+    ) -> tuple[float, float]:
+        """Return (longitude, latitude) of the address."""
+        address_key = normalize_address(address)
+        if not address_key:
+            longitude, latitude = await GoogleService().get_coordinates(address)
+            return float(longitude), float(latitude)
+
+        geocoded_address = geocoding_cache.get(address_key)
+        if geocoded_address is not None:
+            geocoding_stats["memory_hits"] += 1
+        elif settings.GEOCODING_CACHE_PERSISTENT:
+            now = _utc_now()
+            repo = GeocodingCacheRepository(session)
+            geocoded_address = await repo.get_geocoded_address(address_key, now)
+            if geocoded_address is not None:
+                geocoding_stats["persistent_hits"] += 1
+                remaining_ttl = (geocoded_address.expires_at - now).total_seconds()
+                geocoding_cache.set(address_key, geocoded_address, ttl=remaining_ttl)
+        if geocoded_address is None:
+            geocoding_stats["misses"] += 1
+            geocoded_address = await self._geocode(session, address, address_key)
+
+        coordinates = geocoded_address.get_coordinates()
+        if coordinates is None:
+            raise ExternalServiceInvalidLocalizationException(
+                service_name=GOOGLE_SERVICE_NAME
+            )
+        return coordinates
+
+    async def _geocode(
+        self, session: SessionDep, address: str, address_key: str
+    ) -> GeocodedAddress:
+        geocoded_address = GeocodedAddress(
+            address_key=address_key, expires_at=_utc_now()
+        )
+        try:
+            longitude, latitude = await GoogleService().get_coordinates(address)
+            geocoded_address.longitude = float(longitude)
+            geocoded_address.latitude = float(latitude)
+        except ExternalServiceInvalidLocalizationException:
+            geocoded_address.is_valid = False
+
+        ttl = self._get_ttl(geocoded_address)
+        geocoded_address.expires_at += datetime.timedelta(seconds=ttl)
+        geocoding_cache.set(address_key, geocoded_address, ttl=ttl)
+        if settings.GEOCODING_CACHE_PERSISTENT:
+            repo = GeocodingCacheRepository(session)
+            await repo.save_geocoded_address(geocoded_address)
+        return geocoded_address
+
+    def _get_ttl(self, geocoded_address: GeocodedAddress) -> int:
+        if geocoded_address.is_valid:
+            return settings.GEOCODING_CACHE_TTL
+        return settings.GEOCODING_CACHE_NEGATIVE_TTL
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "memory_hits": geocoding_stats["memory_hits"],
+            "persistent_hits": geocoding_stats["persistent_hits"],
+            "misses": geocoding_stats["misses"],
+            "size": len(geocoding_cache),
+        }
+
+    def clear_cache(self) -> None:
+        geocoding_cache.clear()
+        geocoding_stats.clear()
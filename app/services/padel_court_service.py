@@ -8,14 +8,22 @@ from app.models.padel_court import (
 )
 from app.repository.padel_court_repository import PadelCourtRepository
 from app.utilities.dependencies import SessionDep
+from app.utilities.pagination import CountMode
+from app.utilities.request_cache import get_request_cache, padel_court_key
 
 
 class PadelCourtService:
     async def get_padel_court(
         self, session: SessionDep, court_name: str, business_public_id: uuid.UUID
     ) -> PadelCourt:
-        repo = PadelCourtRepository(session)
-        return await repo.get_padel_court(court_name, business_public_id)
+        cache = get_request_cache(session)
+        key = padel_court_key(business_public_id, court_name)
+        padel_court: PadelCourt | None = cache.get(key)
+        if padel_court is None:
+            repo = PadelCourtRepository(session)
+            padel_court = await repo.get_padel_court(court_name, business_public_id)
+            cache[key] = padel_court
+        return padel_court
 
     async def get_padel_court_without_name(
         self,
@@ -24,21 +32,32 @@ class PadelCourtService:
         business_public_id: uuid.UUID,
     ) -> PadelCourt:
         repo = PadelCourtRepository(session)
-        return await repo.get_padel_court_without_name(court_public_id)
+        court = await repo.get_padel_court_without_name(court_public_id)
+        cache = get_request_cache(session)
+        cache[padel_court_key(court.business_public_id, court.name)] = court
+        return court
 
     async def get_padel_courts(
         self,
         session: SessionDep,
-        user_id: uuid.UUID = None,
+        user_id: uuid.UUID | None = None,
         skip: int = 0,
         limit: int = 100,
         court_filters: PadelCourtFilter = PadelCourtFilter(),
+        cursor: str | None = None,
+        count_mode: CountMode | None = None,
     ) -> PadelCourtsPublic:
         repo = PadelCourtRepository(session)
         filters = court_filters.model_dump(exclude_unset=True, exclude_none=True)
         business_public_id = filters.pop("business_public_id", None)
         return await repo.get_padel_courts(
-            business_public_id, user_id, skip, limit, **filters
+            business_public_id,
+            user_id,
+            skip,
+            limit,
+            cursor=cursor,
+            count_mode=count_mode,
+            **filters,
         )
 
     async def update_padel_court(
@@ -49,4 +68,9 @@ class PadelCourtService:
     ) -> PadelCourt:
         repo = PadelCourtRepository(session)
         court = await repo.update_padel_court(court_public_id, court_in)
+        # The name may have changed, drop the entries under the old one
+        cache = get_request_cache(session)
+        for key in [key for key, value in cache.items() if value is court]:
+            del cache[key]
+        cache[padel_court_key(court.business_public_id, court.name)] = court
         return court
@@ -0,0 +1,82 @@
+import time
+from urllib.parse import parse_qs, urlencode
+
+from fastapi import Request
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.api.middlewares.main import HeaderToQueryMiddleware
+from app.tests.utils.utils import benchmark
+
+
+async def echo_query_string(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(request.scope["query_string"].decode())
+
+
+def make_client(middleware: type) -> AsyncClient:
+    app = Starlette(routes=[Route("/", echo_query_string)])
+    app.add_middleware(middleware)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+# Previous implementation, kept as the baseline of the benchmark
+class BaseHTTPHeaderToQueryMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):  # type: ignore[no-untyped-def]
+        scope = request.scope
+        headers = dict(scope["headers"])
+        query_params = parse_qs(scope["query_string"].decode())
+        x_user_id = headers.get(b"x-user-id")
+        if x_user_id and "owner_id" not in query_params:
+            query_params["owner_id"] = [x_user_id.decode()]
+        scope["query_string"] = urlencode(query_params, doseq=True).encode()
+        return await call_next(request)
+
+
+async def test_header_is_added_as_owner_id() -> None:
+    async with make_client(HeaderToQueryMiddleware) as client:
+        # test
+        response = await client.get(
+            "/", params={"skip": 5}, headers={"x-user-id": "user 1"}
+        )
+    # assert
+    assert response.text == "skip=5&owner_id=user%201"
+
+
+async def test_owner_id_in_query_is_kept() -> None:
+    async with make_client(HeaderToQueryMiddleware) as client:
+        # test
+        response = await client.get(
+            "/", params={"owner_id": "mine"}, headers={"x-user-id": "other"}
+        )
+    # assert
+    assert response.text == "owner_id=mine"
+
+
+async def test_query_string_without_header_is_untouched() -> None:
+    async with make_client(HeaderToQueryMiddleware) as client:
+        # test
+        response = await client.get("/?b=2&a=1&cursor=")
+    # assert
+    assert response.text == "b=2&a=1&cursor="
+
+
+@benchmark
+async def test_benchmark_against_base_http_middleware() -> None:
+    n_requests = 300
+    requests_per_second = {}
+    for middleware in (BaseHTTPHeaderToQueryMiddleware, HeaderToQueryMiddleware):
+        async with make_client(middleware) as client:
+            start = time.perf_counter()
+            for i in range(n_requests):
+                headers = {"x-user-id": "user"} if i % 2 else {}
+                await client.get("/", params={"skip": i}, headers=headers)
+            elapsed = time.perf_counter() - start
+        requests_per_second[middleware.__name__] = n_requests / elapsed
+    # assert
+    assert (
+        requests_per_second["HeaderToQueryMiddleware"]
+        > requests_per_second["BaseHTTPHeaderToQueryMiddleware"]
+    ), f"requests/sec: {requests_per_second}"
@@ -0,0 +1,79 @@
+import datetime
+import uuid
+
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette import status
+
+from app.core.config import settings
+from app.tests.utils.utils import create_business_and_padel_court
+
+
+async def test_put_and_get_availability_template(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    url = f"{settings.API_V1_STR}/businesses/{business.business_public_id}/padel-courts/{padel_court.name}/availability-template/"
+    template = {
+        "days": [
+            {"weekday": 0, "initial_hour": 18, "n_matches": 3},
+            {"weekday": 6, "initial_hour": 9, "n_matches": 2},
+        ]
+    }
+    # test
+    put_response = await async_client.put(
+        url,
+        headers=x_api_key_header,
+        params={"owner_id": str(owner_id)},
+        json=template,
+    )
+    get_response = await async_client.get(url, headers=x_api_key_header)
+    # assert
+    assert put_response.status_code == status.HTTP_200_OK
+    assert get_response.status_code == status.HTTP_200_OK
+    assert get_response.json() == {**template, "exceptions": []}
+
+
+async def test_put_availability_template_of_other_owner_is_unauthorized(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+) -> None:
+    business, padel_court = await create_business_and_padel_court(session, uuid.uuid4())
+    # test
+    response = await async_client.put(
+        f"{settings.API_V1_STR}/businesses/{business.business_public_id}/padel-courts/{padel_court.name}/availability-template/",
+        headers=x_api_key_header,
+        params={"owner_id": str(uuid.uuid4())},
+        json={"days": [{"weekday": 0, "initial_hour": 18, "n_matches": 3}]},
+    )
+    # assert
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_availability_template_exceptions(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    url = f"{settings.API_V1_STR}/businesses/{business.business_public_id}/padel-courts/{padel_court.name}/availability-template/"
+    date = (datetime.date.today() + datetime.timedelta(days=3)).isoformat()
+    params = {"owner_id": str(owner_id), "date": date}
+    # test
+    post_response = await async_client.post(
+        f"{url}exceptions", headers=x_api_key_header, params=params
+    )
+    delete_response = await async_client.delete(
+        f"{url}exceptions", headers=x_api_key_header, params=params
+    )
+    get_response = await async_client.get(url, headers=x_api_key_header)
+    # assert
+    assert post_response.status_code == status.HTTP_201_CREATED
+    assert post_response.json()["exceptions"] == [date]
+    assert delete_response.status_code == status.HTTP_204_NO_CONTENT
+    assert get_response.json()["exceptions"] == []
@@ -2,10 +2,13 @@ import uuid
 from typing import Any
 
 from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette import status
 
 from app.core.config import settings
 from app.tests.utils.utils import (
+    count_queries,
+    create_business_and_padel_court,
     create_business_for_routes,
     create_padel_court_for_routes,
 )
@@ -709,3 +712,396 @@ async def test_delete_available_matches_with_not_authorized_owner_owner_id_retur
     assert response_delete.status_code == status.HTTP_401_UNAUTHORIZED
     content = response_delete.json()
     assert content["detail"] == "No autorizado. Usuario no es el dueño"
+
+
+async def test_create_available_matches_ignoring_existing_reports_existing_hours(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
+) -> None:
+    owner_id = uuid.uuid4()
+
+    new_business = await create_business_for_routes(
+        async_client=async_client,
+        x_api_key=x_api_key_header,
+        name="Paloma SA",
+        location="Polaca 530",
+        parameters={"owner_id": str(owner_id)},
+        monkeypatch=monkeypatch,
+    )
+    court_name = "cancha 0"
+    new_padel_court = await create_padel_court_for_routes(
+        async_client=async_client,
+        x_api_key_header=x_api_key_header,
+        name=court_name,
+        price_per_hour="150000",
+        business_data=new_business,
+        owner_id=owner_id,
+    )
+    court_public_id = new_padel_court.get("court_public_id")
+    business_public_id = new_business.get("business_public_id")
+    url = f"{settings.API_V1_STR}/businesses/{business_public_id}/padel-courts/{court_name}/available-matches/"
+    data_available_match = {
+        "court_name": court_name,
+        "business_public_id": business_public_id,
+        "court_public_id": court_public_id,
+        "date": "2025-02-22",
+        "initial_hour": "5",
+        "n_matches": "2",
+    }
+    await async_client.post(
+        url,
+        headers=x_api_key_header,
+        json=data_available_match,
+        params={"owner_id": str(owner_id)},
+    )
+    data_available_match["initial_hour"] = "4"
+    data_available_match["n_matches"] = "4"
+    # test
+    response = await async_client.post(
+        url,
+        headers=x_api_key_header,
+        json=data_available_match,
+        params={"owner_id": str(owner_id), "ignore_existing": "true"},
+    )
+    # assert
+    assert response.status_code == status.HTTP_201_CREATED
+    result = response.json()
+    assert result.get("count") == 2
+    assert [match["initial_hour"] for match in result["data"]] == [4, 7]
+    assert result.get("existing_hours") == [5, 6]
+
+
+async def test_delete_available_matches_with_return_count(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
+) -> None:
+    owner_id = uuid.uuid4()
+
+    new_business = await create_business_for_routes(
+        async_client=async_client,
+        x_api_key=x_api_key_header,
+        name="Paloma SA",
+        location="Polaca 530",
+        parameters={"owner_id": str(owner_id)},
+        monkeypatch=monkeypatch,
+    )
+    court_name = "cancha 0"
+    new_padel_court = await create_padel_court_for_routes(
+        async_client=async_client,
+        x_api_key_header=x_api_key_header,
+        name=court_name,
+        price_per_hour="150000",
+        business_data=new_business,
+        owner_id=owner_id,
+    )
+    business_public_id = new_business.get("business_public_id")
+    url = f"{settings.API_V1_STR}/businesses/{business_public_id}/padel-courts/{court_name}/available-matches/"
+    data_available_match = {
+        "court_name": court_name,
+        "business_public_id": business_public_id,
+        "court_public_id": new_padel_court.get("court_public_id"),
+        "date": "2025-02-22",
+        "initial_hour": "5",
+        "n_matches": "3",
+    }
+    await async_client.post(
+        url,
+        headers=x_api_key_header,
+        json=data_available_match,
+        params={"owner_id": str(owner_id)},
+    )
+    await async_client.patch(
+        url,
+        headers=x_api_key_header,
+        params={"date": "2025-02-22", "hour": "6"},
+    )
+    params = {"owner_id": str(owner_id), "date": "2025-02-22", "return_count": "true"}
+    # test
+    refused = await async_client.delete(
+        url, headers=x_api_key_header, params={**params, "force": "false"}
+    )
+    response = await async_client.delete(url, headers=x_api_key_header, params=params)
+    # assert
+    assert refused.status_code == status.HTTP_409_CONFLICT
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"count": 3}
+
+
+async def test_get_available_matches_in_range_grouped_by_date(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
+) -> None:
+    owner_id = uuid.uuid4()
+
+    new_business = await create_business_for_routes(
+        async_client=async_client,
+        x_api_key=x_api_key_header,
+        name="Paloma SA",
+        location="Polaca 530",
+        parameters={"owner_id": str(owner_id)},
+        monkeypatch=monkeypatch,
+    )
+    court_name = "cancha 0"
+    new_padel_court = await create_padel_court_for_routes(
+        async_client=async_client,
+        x_api_key_header=x_api_key_header,
+        name=court_name,
+        price_per_hour="150000",
+        business_data=new_business,
+        owner_id=owner_id,
+    )
+    business_public_id = new_business.get("business_public_id")
+    url = f"{settings.API_V1_STR}/businesses/{business_public_id}/padel-courts/{court_name}/available-matches/"
+    for day in ["2025-02-22", "2025-02-23", "2025-02-25"]:
+        await async_client.post(
+            url,
+            headers=x_api_key_header,
+            json={
+                "court_name": court_name,
+                "business_public_id": business_public_id,
+                "court_public_id": new_padel_court.get("court_public_id"),
+                "date": day,
+                "initial_hour": "5",
+                "n_matches": "2",
+            },
+            params={"owner_id": str(owner_id)},
+        )
+    # test
+    response = await async_client.get(
+        f"{url}range",
+        headers=x_api_key_header,
+        params={"date_from": "2025-02-22", "date_to": "2025-02-25"},
+    )
+    too_long = await async_client.get(
+        f"{url}range",
+        headers=x_api_key_header,
+        params={"date_from": "2025-01-01", "date_to": "2025-12-31"},
+    )
+    # assert
+    assert response.status_code == status.HTTP_200_OK
+    result = response.json()
+    assert result.get("count") == 6
+    assert [day["date"] for day in result["data"]] == [
+        "2025-02-22",
+        "2025-02-23",
+        "2025-02-25",
+    ]
+    assert all(day["count"] == 2 for day in result["data"])
+    assert too_long.status_code == status.HTTP_406_NOT_ACCEPTABLE
+
+
+async def test_create_available_matches_fetches_business_and_court_in_one_query(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], session: AsyncSession
+) -> None:
+    owner_id = uuid.uuid4()
+    business, court = await create_business_and_padel_court(session, owner_id)
+    data_available_match = {
+        "court_name": court.name,
+        "business_public_id": str(business.business_public_id),
+        "court_public_id": str(court.court_public_id),
+        "date": "2025-02-22",
+        "initial_hour": "5",
+        "n_matches": "2",
+    }
+    # test
+    with count_queries(session) as queries:
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/businesses/{business.business_public_id}/padel-courts/{court.name}/available-matches/",
+            headers=x_api_key_header,
+            json=data_available_match,
+            params={"owner_id": str(owner_id)},
+        )
+    # assert
+    assert response.status_code == status.HTTP_201_CREATED
+    lookups = [query for query in queries if "businesses" in query]
+    assert len(lookups) == 1
+    assert "JOIN padel_courts" in lookups[0]
+
+
+async def test_get_available_matches_with_matching_etag_returns_304_until_a_reserve(
+    session: AsyncSession,
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    url = f"{settings.API_V1_STR}/businesses/{business.business_public_id}/padel-courts/{padel_court.name}/available-matches/"
+    await async_client.post(
+        url,
+        headers=x_api_key_header,
+        json={
+            "court_name": padel_court.name,
+            "business_public_id": str(business.business_public_id),
+            "court_public_id": str(padel_court.court_public_id),
+            "date": "2025-02-22",
+            "initial_hour": 5,
+            "n_matches": 5,
+        },
+        params={"owner_id": str(owner_id)},
+    )
+    parameters = {"date": "2025-02-22"}
+    first_response = await async_client.get(
+        url, headers=x_api_key_header, params=parameters
+    )
+    etag = first_response.headers["etag"]
+    # test
+    not_modified = await async_client.get(
+        url, headers={**x_api_key_header, "If-None-Match": etag}, params=parameters
+    )
+    await async_client.patch(
+        url, headers=x_api_key_header, params={"date": "2025-02-22", "hour": 7}
+    )
+    modified = await async_client.get(
+        url, headers={**x_api_key_header, "If-None-Match": etag}, params=parameters
+    )
+    # assert
+    assert first_response.status_code == status.HTTP_200_OK
+    assert first_response.headers["cache-control"] == "private, no-cache"
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert modified.status_code == status.HTTP_200_OK
+    assert modified.headers["etag"] != etag
+    reserved_hours = [
+        match["initial_hour"] for match in modified.json()["data"] if match["reserve"]
+    ]
+    assert reserved_hours == [7]
+
+
+async def test_reserve_consecutive_available_matches(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    url = f"{settings.API_V1_STR}/businesses/{business.business_public_id}/padel-courts/{padel_court.name}/available-matches/"
+    await async_client.post(
+        url,
+        headers=x_api_key_header,
+        json={
+            "court_name": padel_court.name,
+            "business_public_id": str(business.business_public_id),
+            "court_public_id": str(padel_court.court_public_id),
+            "date": "2025-02-22",
+            "initial_hour": 18,
+            "n_matches": 4,
+        },
+        params={"owner_id": str(owner_id)},
+    )
+    params: dict[str, str | int] = {
+        "date": "2025-02-22",
+        "initial_hour": 19,
+        "n_matches": 2,
+    }
+    # test
+    reserve = await async_client.patch(
+        f"{url}consecutive", headers=x_api_key_header, params=params
+    )
+    reserve_overlapping = await async_client.patch(
+        f"{url}consecutive",
+        headers=x_api_key_header,
+        params={**params, "initial_hour": 18},
+    )
+    # assert
+    assert reserve.status_code == status.HTTP_200_OK
+    result = reserve.json()
+    assert result["count"] == 2
+    assert [(match["initial_hour"], match["reserve"]) for match in result["data"]] == [
+        (19, True),
+        (20, True),
+    ]
+    assert reserve_overlapping.status_code == status.HTTP_409_CONFLICT
+
+
+async def test_reserve_consecutive_available_matches_with_hour_out_of_the_day(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    url = f"{settings.API_V1_STR}/businesses/{business.business_public_id}/padel-courts/{padel_court.name}/available-matches/"
+    # test
+    response = await async_client.patch(
+        f"{url}consecutive",
+        headers=x_api_key_header,
+        params={"date": "2025-02-22", "initial_hour": 30, "n_matches": 1},
+    )
+    # assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_hold_then_reserve_and_release_available_matches(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+    monkeypatch: Any,
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", "rows")
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    url = f"{settings.API_V1_STR}/businesses/{business.business_public_id}/padel-courts/{padel_court.name}/available-matches/"
+    await async_client.post(
+        url,
+        headers=x_api_key_header,
+        json={
+            "court_name": padel_court.name,
+            "business_public_id": str(business.business_public_id),
+            "court_public_id": str(padel_court.court_public_id),
+            "date": "2025-02-22",
+            "initial_hour": 18,
+            "n_matches": 4,
+        },
+        params={"owner_id": str(owner_id)},
+    )
+    params: dict[str, str | int] = {
+        "date": "2025-02-22",
+        "initial_hour": 18,
+        "n_matches": 2,
+    }
+    # test
+    hold = await async_client.post(
+        f"{url}holds", headers=x_api_key_header, params=params
+    )
+    hold_id = hold.json()["hold_id"]
+    other_hold = await async_client.post(
+        f"{url}holds", headers=x_api_key_header, params={**params, "initial_hour": 19}
+    )
+    reserve = await async_client.patch(
+        url,
+        headers=x_api_key_header,
+        params={"date": "2025-02-22", "hour": 18, "hold_id": hold_id},
+    )
+    release = await async_client.delete(
+        f"{url}holds/{hold_id}", headers=x_api_key_header, params={"date": "2025-02-22"}
+    )
+    available_matches = await async_client.get(
+        url, headers=x_api_key_header, params={"date": "2025-02-22"}
+    )
+    # assert
+    assert hold.status_code == status.HTTP_201_CREATED
+    assert hold.json()["count"] == 2
+    assert all(match["held"] for match in hold.json()["data"])
+    assert other_hold.status_code == status.HTTP_409_CONFLICT
+    assert reserve.status_code == status.HTTP_200_OK
+    assert release.status_code == status.HTTP_204_NO_CONTENT
+    assert sorted(
+        (match["initial_hour"], match["reserve"], match["held"])
+        for match in available_matches.json()["data"]
+    ) == [(18, True, False), (19, False, False), (20, False, False), (21, False, False)]
+
+
+async def test_hold_available_matches_with_hour_out_of_the_day(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    url = f"{settings.API_V1_STR}/businesses/{business.business_public_id}/padel-courts/{padel_court.name}/available-matches/"
+    # test
+    response = await async_client.post(
+        f"{url}holds",
+        headers=x_api_key_header,
+        params={"date": "2025-02-22", "initial_hour": 30},
+    )
+    # assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
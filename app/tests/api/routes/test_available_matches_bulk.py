@@ -0,0 +1,123 @@
+import uuid
+from typing import Any
+
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette import status
+
+from app.core.config import settings
+from app.repository.available_matches_repository import AvailableMatchesRepository
+from app.services.available_match_bulk_service import BULK_JOB_FAILED
+from app.tests.utils.utils import create_business_and_padel_court
+
+BULK_DATA = {
+    "date_from": "2025-03-03",
+    "date_to": "2025-03-16",
+    "weekdays": [5, 6],
+    "hours": [{"initial_hour": 9, "n_matches": 4}],
+}
+
+
+async def test_bulk_create_available_matches(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    bpid = business.business_public_id
+    # test
+    response = await async_client.post(
+        f"{settings.API_V1_STR}/businesses/{bpid}/available-matches/bulk/",
+        headers=x_api_key_header,
+        params={"owner_id": str(owner_id)},
+        json=BULK_DATA,
+    )
+    # assert
+    assert response.status_code == status.HTTP_201_CREATED
+    result = response.json()
+    assert result["status"] == "done"
+    assert result["total_days"] == result["done_days"] == 4
+    available_matches = await async_client.get(
+        f"{settings.API_V1_STR}/businesses/{bpid}/padel-courts/{padel_court.name}/available-matches/",
+        headers=x_api_key_header,
+        params={"date": "2025-03-15"},
+    )
+    assert available_matches.json()["count"] == 4
+
+
+async def test_failed_bulk_create_responds_the_failed_job(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+    monkeypatch: Any,
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", "rows")
+    owner_id = uuid.uuid4()
+    business, _ = await create_business_and_padel_court(session, owner_id)
+    bpid = business.business_public_id
+
+    async def fail(*_args: Any) -> None:
+        raise RuntimeError("connection to server was lost")
+
+    monkeypatch.setattr(AvailableMatchesRepository, "add_available_days", fail)
+    # test
+    response = await async_client.post(
+        f"{settings.API_V1_STR}/businesses/{bpid}/available-matches/bulk/",
+        headers=x_api_key_header,
+        params={"owner_id": str(owner_id)},
+        json=BULK_DATA,
+    )
+    # assert
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert "location" not in response.headers
+    assert response.json()["status"] == "failed"
+    assert response.json()["error"] == BULK_JOB_FAILED
+
+
+async def test_large_bulk_create_responds_accepted_with_the_job(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+    monkeypatch: Any,
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABLE_MATCHES_BULK_SYNC_MAX_DAYS", 1)
+    owner_id = uuid.uuid4()
+    business, _ = await create_business_and_padel_court(session, owner_id)
+    bpid = business.business_public_id
+    # test
+    response = await async_client.post(
+        f"{settings.API_V1_STR}/businesses/{bpid}/available-matches/bulk/",
+        headers=x_api_key_header,
+        params={"owner_id": str(owner_id)},
+        json=BULK_DATA,
+    )
+    job_response = await async_client.get(
+        response.headers["location"], headers=x_api_key_header
+    )
+    # assert
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["status"] == "pending"
+    assert job_response.status_code == status.HTTP_200_OK
+    job = job_response.json()
+    assert job["job_public_id"] == response.json()["job_public_id"]
+    assert job["status"] == "done"
+    assert job["done_days"] == 4
+
+
+async def test_bulk_create_with_inverted_range_is_not_acceptable(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, _ = await create_business_and_padel_court(session, owner_id)
+    # test
+    response = await async_client.post(
+        f"{settings.API_V1_STR}/businesses/{business.business_public_id}/available-matches/bulk/",
+        headers=x_api_key_header,
+        params={"owner_id": str(owner_id)},
+        json={**BULK_DATA, "date_to": "2025-03-01"},
+    )
+    # assert
+    assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
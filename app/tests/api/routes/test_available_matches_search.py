@@ -0,0 +1,147 @@
+import uuid
+from typing import Any
+
+from httpx import AsyncClient
+from starlette import status
+
+from app.core.config import settings
+from app.tests.utils.utils import (
+    create_business_for_routes,
+    create_padel_court_for_routes,
+)
+
+
+async def create_available_matches_for_routes(
+    async_client: AsyncClient,
+    x_api_key_header: dict[str, str],
+    monkeypatch: Any,
+    business_name: str,
+    court_names: list[str],
+) -> dict[str, str]:
+    owner_id = uuid.uuid4()
+    new_business = await create_business_for_routes(
+        async_client=async_client,
+        x_api_key=x_api_key_header,
+        name=business_name,
+        location="Polaca 530",
+        parameters={"owner_id": str(owner_id)},
+        monkeypatch=monkeypatch,
+    )
+    business_public_id = new_business.get("business_public_id")
+    for court_name in court_names:
+        new_padel_court = await create_padel_court_for_routes(
+            async_client=async_client,
+            x_api_key_header=x_api_key_header,
+            name=court_name,
+            price_per_hour="150000",
+            business_data=new_business,
+            owner_id=owner_id,
+        )
+        await async_client.post(
+            f"{settings.API_V1_STR}/businesses/{business_public_id}/padel-courts/{court_name}/available-matches/",
+            headers=x_api_key_header,
+            json={
+                "court_name": court_name,
+                "business_public_id": business_public_id,
+                "court_public_id": new_padel_court.get("court_public_id"),
+                "date": "2025-02-22",
+                "initial_hour": "18",
+                "n_matches": "3",
+            },
+            params={"owner_id": str(owner_id)},
+        )
+    return new_business
+
+
+async def test_search_available_matches_across_courts_with_pagination(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
+) -> None:
+    await create_available_matches_for_routes(
+        async_client, x_api_key_header, monkeypatch, "Paloma SA", ["A", "B"]
+    )
+    await create_available_matches_for_routes(
+        async_client, x_api_key_header, monkeypatch, "Halcon SA", ["C"]
+    )
+    params = {
+        "date_from": "2025-02-22",
+        "initial_hour_from": "19",
+        "initial_hour_to": "20",
+        "limit": "4",
+    }
+    # test
+    first_page = await async_client.get(
+        f"{settings.API_V1_STR}/available-matches/",
+        headers=x_api_key_header,
+        params=params,
+    )
+    next_cursor = first_page.json().get("next_cursor")
+    second_page = await async_client.get(
+        f"{settings.API_V1_STR}/available-matches/",
+        headers=x_api_key_header,
+        params={**params, "cursor": next_cursor},
+    )
+    # assert
+    assert first_page.status_code == status.HTTP_200_OK
+    assert second_page.status_code == status.HTTP_200_OK
+    first_data = first_page.json()["data"]
+    second_data = second_page.json()["data"]
+    assert len(first_data) == 4
+    assert len(second_data) == 2
+    assert second_page.json().get("next_cursor") is None
+    slots = {
+        (match["court_name"], match["initial_hour"])
+        for match in first_data + second_data
+    }
+    assert len(slots) == 6
+    assert {hour for _, hour in slots} == {19, 20}
+    assert all(match["latitude"] == 0.3 for match in first_data + second_data)
+
+
+async def test_search_available_matches_filtered_by_business_and_area(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
+) -> None:
+    business = await create_available_matches_for_routes(
+        async_client, x_api_key_header, monkeypatch, "Paloma SA", ["A"]
+    )
+    await create_available_matches_for_routes(
+        async_client, x_api_key_header, monkeypatch, "Halcon SA", ["B"]
+    )
+    # test
+    by_business = await async_client.get(
+        f"{settings.API_V1_STR}/available-matches/",
+        headers=x_api_key_header,
+        params={
+            "date_from": "2025-02-22",
+            "business_public_id": business["business_public_id"],
+        },
+    )
+    outside_area = await async_client.get(
+        f"{settings.API_V1_STR}/available-matches/",
+        headers=x_api_key_header,
+        params={
+            "date_from": "2025-02-22",
+            "min_latitude": "10",
+            "max_latitude": "20",
+            "min_longitude": "10",
+            "max_longitude": "20",
+        },
+    )
+    # assert
+    assert by_business.status_code == status.HTTP_200_OK
+    assert by_business.json().get("count") == 3
+    assert all(match["court_name"] == "A" for match in by_business.json()["data"])
+    assert outside_area.status_code == status.HTTP_200_OK
+    assert outside_area.json().get("count") == 0
+
+
+async def test_search_available_matches_with_invalid_cursor_returns_406(
+    async_client: AsyncClient, x_api_key_header: dict[str, str]
+) -> None:
+    # test
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/available-matches/",
+        headers=x_api_key_header,
+        params={"date_from": "2025-02-22", "cursor": "invalid"},
+    )
+    # assert
+    assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
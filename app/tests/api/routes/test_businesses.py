@@ -221,6 +221,18 @@ async def test_get_businesses_with_pagination(
     assert not any(id in page1_ids for id in page2_ids)
 
 
+async def test_get_businesses_with_zero_limit_returns_422(
+    async_client: AsyncClient, x_api_key_header: dict[str, str]
+) -> None:
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/businesses/",
+        headers=x_api_key_header,
+        params={"limit": "0"},
+    )
+
+    assert response.status_code == 422
+
+
 async def test_create_business_raise_invalid_conection_whit_google(
     async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
 ):
@@ -361,3 +373,74 @@ async def test_update_business_not_business(
     )
     assert update_response.status_code == 404
     assert update_response.json().get("detail") == "No se encontró establecimiento"
+
+
+async def test_get_businesses_nearby(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
+) -> None:
+    new_business = await create_business_for_routes(
+        async_client=async_client,
+        x_api_key=x_api_key_header,
+        name="Nearby",
+        location="Av. Belgrano 3450",
+        parameters={"owner_id": str(uuid.uuid4())},
+        monkeypatch=monkeypatch,
+    )
+    params = {
+        "lat": new_business["latitude"],
+        "lng": new_business["longitude"],
+        "radius_km": 1,
+    }
+    # test
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/businesses/nearby",
+        headers=x_api_key_header,
+        params=params,
+    )
+    too_large_radius = await async_client.get(
+        f"{settings.API_V1_STR}/businesses/nearby",
+        headers=x_api_key_header,
+        params={**params, "radius_km": settings.NEARBY_MAX_RADIUS_KM + 1},
+    )
+    # assert
+    assert response.status_code == 200
+    content = response.json()
+    assert content["count"] == 1
+    assert (
+        content["data"][0]["business_public_id"] == new_business["business_public_id"]
+    )
+    assert content["data"][0]["distance_km"] == 0
+    assert too_large_radius.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+async def test_get_businesses_with_matching_etag_returns_304(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
+) -> None:
+    owner_id = uuid.uuid4()
+    await create_business_for_routes(
+        async_client,
+        x_api_key_header,
+        "Padel Si",
+        "Av. Belgrano 3450",
+        {"owner_id": str(owner_id)},
+        monkeypatch,
+    )
+    url = f"{settings.API_V1_STR}/businesses/"
+    parameters = {"owner_id": str(owner_id)}
+    first_response = await async_client.get(
+        url, headers=x_api_key_header, params=parameters
+    )
+    etag = first_response.headers["etag"]
+    # test
+    response = await async_client.get(
+        url,
+        headers={**x_api_key_header, "If-None-Match": f'W/"other", {etag}'},
+        params=parameters,
+    )
+    # assert
+    assert first_response.status_code == HTTPStatus.OK
+    assert first_response.json()["count"] == 1
+    assert first_response.headers["cache-control"] == "private, max-age=30"
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
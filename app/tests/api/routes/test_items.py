@@ -250,3 +250,80 @@ async def test_delete_item_not_owner(
     assert response.status_code == 403
     content = response.json()
     assert content["detail"] == "Permisos insuficientes"
+
+
+async def test_read_items_with_cursor(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], session: AsyncSession
+) -> None:
+    user_id = uuid.uuid4()
+    items = [await create_random_item(user_id, session) for _ in range(3)]
+
+    # test
+    ids = []
+    params: dict[str, str | int] = {"user_id": str(user_id), "limit": 2}
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/items/", headers=x_api_key_header, params=params
+    )
+    content = response.json()
+    ids += [item["id"] for item in content["data"]]
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=x_api_key_header,
+        params={**params, "cursor": content["next_cursor"]},
+    )
+    last_page = response.json()
+    ids += [item["id"] for item in last_page["data"]]
+
+    # assert
+    assert response.status_code == 200
+    assert ids == sorted(str(item.id) for item in items)
+    assert last_page["next_cursor"] is None
+
+
+async def test_read_items_with_zero_limit(
+    async_client: AsyncClient, x_api_key_header: dict[str, str]
+) -> None:
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=x_api_key_header,
+        params={"user_id": str(uuid.uuid4()), "limit": 0},
+    )
+    assert response.status_code == 422
+
+
+async def test_read_items_with_invalid_cursor(
+    async_client: AsyncClient, x_api_key_header: dict[str, str]
+) -> None:
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=x_api_key_header,
+        params={"user_id": str(uuid.uuid4()), "cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 406
+
+
+async def test_read_items_without_count(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], session: AsyncSession
+) -> None:
+    user_id = uuid.uuid4()
+    await create_random_item(user_id, session)
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=x_api_key_header,
+        params={"user_id": str(user_id), "count": "none"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["count"] is None
+    assert len(content["data"]) == 1
+
+
+async def test_read_items_with_invalid_count_mode(
+    async_client: AsyncClient, x_api_key_header: dict[str, str]
+) -> None:
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=x_api_key_header,
+        params={"user_id": str(uuid.uuid4()), "count": "approximate"},
+    )
+    assert response.status_code == 422
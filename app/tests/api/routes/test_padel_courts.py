@@ -286,6 +286,18 @@ async def test_get_padel_courts_with_pagination(
     assert not any(id in page1_ids for id in page2_ids)
 
 
+async def test_get_padel_courts_with_zero_limit_returns_422(
+    async_client: AsyncClient, x_api_key_header: dict[str, str]
+) -> None:
+    response = await async_client.get(
+        f"{settings.API_V1_STR}/padel-courts/",
+        headers=x_api_key_header,
+        params={"limit": "0"},
+    )
+
+    assert response.status_code == 422
+
+
 async def test_update_padel_court(
     async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
 ) -> None:
@@ -625,3 +637,45 @@ async def test_get_padel_courts_whit_filter_by_court_public_id(
     assert court["latitude"] == business1["latitude"]
     assert court["longitude"] == business1["longitude"]
     assert court["price_per_hour"] == "100.00"
+
+
+async def test_get_padel_courts_nearby(
+    async_client: AsyncClient, x_api_key_header: dict[str, str], monkeypatch: Any
+) -> None:
+    owner_id = uuid.uuid4()
+    new_business = await create_business_for_routes(
+        async_client=async_client,
+        x_api_key=x_api_key_header,
+        name="Nearby Business",
+        location="Nearby Location",
+        parameters={"owner_id": str(owner_id)},
+        monkeypatch=monkeypatch,
+    )
+    await create_padel_court_for_routes(
+        async_client=async_client,
+        x_api_key_header=x_api_key_header,
+        name="Nearby Court",
+        price_per_hour="100",
+        business_data=new_business,
+        owner_id=owner_id,
+    )
+    latitude, longitude = new_business["latitude"], new_business["longitude"]
+    # test
+    nearby = await async_client.get(
+        f"{settings.API_V1_STR}/padel-courts/nearby",
+        headers=x_api_key_header,
+        params={"lat": latitude, "lng": longitude, "radius_km": 1},
+    )
+    far_away = await async_client.get(
+        f"{settings.API_V1_STR}/padel-courts/nearby",
+        headers=x_api_key_header,
+        params={"lat": latitude + 1, "lng": longitude, "radius_km": 1},
+    )
+    # assert
+    assert nearby.status_code == 200
+    assert nearby.json()["count"] == 1
+    court = nearby.json()["data"][0]
+    assert court["name"] == "Nearby Court"
+    assert court["business_name"] == "Nearby Business"
+    assert far_away.status_code == 200
+    assert far_away.json()["count"] == 0
@@ -7,34 +7,56 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from pytest_asyncio import is_async_test
 from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import test_settings
-from app.core.db import get_async_engine, init_db
+from app.core.db import close_engine, open_engine
 from app.main import app
+from app.migrations import upgrade
+from app.models.availability_day import AvailabilityDay
+from app.models.availability_template import (
+    AvailabilityTemplate,
+    AvailabilityTemplateDate,
+)
 from app.models.available_match import AvailableMatch
+from app.models.available_match_bulk import AvailableMatchesBulkJob
 from app.models.business import Business
+from app.models.geocoding import GeocodedAddress
 from app.models.item import Item
 from app.models.padel_court import PadelCourt
+from app.services.geocoding_service import GeocodingService
 from app.tests.utils.utils import get_x_api_key_header
+from app.utilities.cache import MemoryCacheBackend
 from app.utilities.dependencies import get_db
+from app.utilities.entity_cache import EntityCache, get_entity_cache, set_entity_cache
 
 db_url = str(test_settings.SQLALCHEMY_DATABASE_URI)
 
 
+@pytest_asyncio.fixture(name="engine", scope="session")
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    _engine = open_engine(db_url)
+    await upgrade(_engine)
+    yield _engine
+    await close_engine()
+
+
 @pytest_asyncio.fixture(name="session")
-async def db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSession(
-        get_async_engine(db_url), expire_on_commit=False
-    ) as _session:
+async def db(engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(engine, expire_on_commit=False) as _session:
         try:
-            await init_db(db_url)
             yield _session
 
             await _session.exec(delete(Item))  # type: ignore[call-overload]
             await _session.exec(delete(PadelCourt))  # type: ignore[call-overload]
             await _session.exec(delete(Business))  # type: ignore[call-overload]
             await _session.exec(delete(AvailableMatch))  # type: ignore[call-overload]
+            await _session.exec(delete(AvailableMatchesBulkJob))  # type: ignore[call-overload]
+            await _session.exec(delete(AvailabilityDay))  # type: ignore[call-overload]
+            await _session.exec(delete(AvailabilityTemplate))  # type: ignore[call-overload]
+            await _session.exec(delete(AvailabilityTemplateDate))  # type: ignore[call-overload]
+            await _session.exec(delete(GeocodedAddress))  # type: ignore[call-overload]
 
             await _session.commit()
         finally:
@@ -46,6 +68,25 @@ async def override_dependency(session: AsyncSession):
     app.dependency_overrides[get_db] = lambda: session
 
 
+@pytest_asyncio.fixture(autouse=True)
+def clear_geocoding_cache() -> None:
+    GeocodingService().clear_cache()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_entity_cache() -> None:
+    await get_entity_cache().clear()
+
+
+@pytest_asyncio.fixture(name="memory_entity_cache")
+async def memory_entity_cache() -> AsyncGenerator[EntityCache, None]:
+    """Per worker entity cache, whatever the settings say."""
+    entity_cache = EntityCache(MemoryCacheBackend(max_size=100, ttl=60), ttl=60)
+    set_entity_cache(entity_cache)
+    yield entity_cache
+    set_entity_cache(None)
+
+
 @pytest_asyncio.fixture(name="async_client")
 async def async_client() -> AsyncGenerator[AsyncClient, None]:
     async with AsyncClient(
@@ -0,0 +1,21 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.db import get_engine, get_session_maker
+from app.utilities.dependencies import get_db
+
+
+async def test_get_engine_returns_shared_engine(engine: AsyncEngine) -> None:
+    # assert
+    assert get_engine() is engine
+    assert get_engine() is get_engine()
+
+
+async def test_get_db_uses_shared_session_maker(engine: AsyncEngine) -> None:
+    session_maker = get_session_maker()
+    # test
+    generator = get_db()
+    session = await anext(generator)
+    # assert
+    assert session.bind is engine
+    assert get_session_maker() is session_maker
+    await generator.aclose()
@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import SQLModel
+
+from app.migrations import (
+    MIGRATIONS,
+    Migration,
+    SchemaVersionError,
+    check_schema_version,
+    get_latest_version,
+    render_sql,
+    upgrade,
+)
+from app.migrations.runner import SCHEMA_MIGRATIONS_TABLE_NAME
+
+NEXT_VERSION = get_latest_version() + 1
+NEXT_MIGRATION = Migration(
+    version=NEXT_VERSION,
+    description="test table",
+    statements=("CREATE TABLE migrations_test_table (id INTEGER PRIMARY KEY)",),
+)
+
+
+async def test_upgrade_without_pending_migrations_applies_nothing(
+    engine: AsyncEngine,
+) -> None:
+    # test
+    applied = await upgrade(engine)
+    # assert
+    assert applied == []
+    assert await check_schema_version(engine) == get_latest_version()
+
+
+async def test_upgrade_applies_pending_migrations_once(engine: AsyncEngine) -> None:
+    migrations = [*MIGRATIONS, NEXT_MIGRATION]
+    try:
+        # test
+        first = await upgrade(engine, migrations=migrations)
+        second = await upgrade(engine, migrations=migrations)
+        # assert
+        assert first == [NEXT_VERSION]
+        assert second == []
+        assert await check_schema_version(engine, migrations) == NEXT_VERSION
+    finally:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("DROP TABLE IF EXISTS migrations_test_table")
+            await conn.exec_driver_sql(
+                f"DELETE FROM {SCHEMA_MIGRATIONS_TABLE_NAME} WHERE version = {NEXT_VERSION}"
+            )
+
+
+async def test_check_schema_version_with_pending_migrations_raise_error(
+    engine: AsyncEngine,
+) -> None:
+    # test
+    with pytest.raises(SchemaVersionError):
+        await check_schema_version(engine, [*MIGRATIONS, NEXT_MIGRATION])
+
+
+async def test_migrated_schema_has_every_table_and_index_of_the_models(
+    engine: AsyncEngine,
+) -> None:
+    tables = SQLModel.metadata.tables.values()
+    index_names = {index.name for table in tables for index in table.indexes}
+    # test
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(
+            "SELECT tablename FROM pg_tables WHERE schemaname = 'public'"
+        )
+        db_tables = set(result.scalars())
+        result = await conn.exec_driver_sql(
+            "SELECT indexname FROM pg_indexes WHERE schemaname = 'public'"
+        )
+        db_indexes = set(result.scalars())
+    # assert
+    assert {table.name for table in tables} <= db_tables
+    assert index_names <= db_indexes
+
+
+async def test_render_sql_creates_indexes_concurrently_outside_transactions() -> None:
+    # test
+    sql = render_sql(from_version=1, target=2)
+    # assert
+    assert "CREATE INDEX CONCURRENTLY" in sql
+    assert "BEGIN;" not in sql
+    assert "VALUES (2, 'lookup indexes')" in sql
+    assert "CREATE TABLE IF NOT EXISTS businesses" not in sql
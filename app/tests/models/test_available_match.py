@@ -6,7 +6,10 @@ import pytest
 from app.models.available_match import (
     AvailableMatch,
     AvailableMatchCreate,
+    AvailableMatchesCreatedPublic,
+    AvailableMatchesInRangePublic,
     AvailableMatchesPublic,
+    AvailableMatchesRangeFilter,
     AvailableMatchPublic,
 )
 from app.utilities.exceptions import NotAcceptableException
@@ -201,3 +204,76 @@ async def test_publics_from_private() -> None:
         if key == "id":
             continue
         assert getattr(available_date_public, key) == value
+
+
+async def test_get_hours_of_available_match_create() -> None:
+    data = {
+        "court_name": "35",
+        "business_public_id": uuid.uuid4(),
+        "date": date(2025, 1, 1),
+        "court_public_id": uuid.uuid4(),
+        "initial_hour": 5,
+        "n_matches": 3,
+    }
+    create = AvailableMatchCreate(**data)
+    # assert
+    assert create.get_hours() == [5, 6, 7]
+
+
+async def test_available_matches_created_public_reports_existing_hours() -> None:
+    data = {
+        "court_name": "35",
+        "business_public_id": uuid.uuid4(),
+        "date": date(2025, 1, 1),
+        "court_public_id": uuid.uuid4(),
+        "initial_hour": 5,
+        "n_matches": 1,
+    }
+    created = AvailableMatch.from_create(AvailableMatchCreate(**data))
+    # test
+    result = AvailableMatchesCreatedPublic.from_created(created, (0.1, 0.4), [4, 5, 6])
+    # assert
+    assert result.count == 1
+    assert result.existing_hours == [4, 6]
+
+
+async def test_range_filter_longer_than_limit_raise_not_acceptable() -> None:
+    range_filter = AvailableMatchesRangeFilter(
+        date_from=date(2025, 1, 1), date_to=date(2025, 3, 1)
+    )
+    # test
+    with pytest.raises(NotAcceptableException):
+        range_filter.validate_range()
+
+
+async def test_range_filter_with_inverted_dates_raise_not_acceptable() -> None:
+    range_filter = AvailableMatchesRangeFilter(
+        date_from=date(2025, 1, 2), date_to=date(2025, 1, 1)
+    )
+    # test
+    with pytest.raises(NotAcceptableException):
+        range_filter.validate_range()
+
+
+async def test_available_matches_in_range_public_groups_by_date() -> None:
+    data = {
+        "court_name": "35",
+        "business_public_id": uuid.uuid4(),
+        "court_public_id": uuid.uuid4(),
+        "initial_hour": 5,
+        "n_matches": 2,
+    }
+    first_day = AvailableMatch.from_create(
+        AvailableMatchCreate(**data, date=date(2025, 1, 1))
+    )
+    second_day = AvailableMatch.from_create(
+        AvailableMatchCreate(**data, date=date(2025, 1, 2))
+    )
+    # test
+    result = AvailableMatchesInRangePublic.from_private(
+        second_day + first_day, (0.1, 0.4)
+    )
+    # assert
+    assert result.count == 4
+    assert [day.date for day in result.data] == [date(2025, 1, 1), date(2025, 1, 2)]
+    assert all(day.count == 2 for day in result.data)
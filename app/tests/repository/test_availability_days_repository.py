@@ -0,0 +1,332 @@
+import datetime
+import hashlib
+import time
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.availability_day import AVAILABILITY_DAY_TABLE_NAME
+from app.models.available_match import (
+    AVAILABILITY_TABLE_NAME,
+    AvailableMatchCreate,
+    AvailableMatchesRangeFilter,
+    AvailableMatchesSearchFilter,
+)
+from app.models.padel_court import PadelCourt
+from app.repository.availability_days_repository import AvailabilityDaysRepository
+from app.repository.available_matches_repository import AvailableMatchesRepository
+from app.tests.utils.utils import (
+    benchmark,
+    count_queries,
+    create_business_and_padel_court,
+)
+from app.utilities.exceptions import NotFoundException, NotUniqueException
+
+DATE = datetime.date(2025, 1, 1)
+
+
+def available_match_create(
+    padel_court: PadelCourt,
+    initial_hour: int,
+    n_matches: int,
+    date: datetime.date = DATE,
+) -> AvailableMatchCreate:
+    return AvailableMatchCreate(
+        court_name=padel_court.name,
+        court_public_id=padel_court.court_public_id,
+        business_public_id=padel_court.business_public_id,
+        date=date,
+        initial_hour=initial_hour,
+        n_matches=n_matches,
+    )
+
+
+async def test_create_get_and_reserve_available_matches(
+    session: AsyncSession,
+) -> None:
+    _, padel_court = await create_business_and_padel_court(session, uuid.uuid4())
+    repository = AvailabilityDaysRepository(session)
+    bpid = padel_court.business_public_id
+    # test
+    created = await repository.create_available_matches_in_date(
+        available_match_create(padel_court, 5, 3)
+    )
+    with count_queries(session) as statements:
+        reserved = await repository.reserve_available_match(
+            padel_court.name, bpid, DATE, 6
+        )
+    reserved_again = await repository.reserve_available_match(
+        padel_court.name, bpid, DATE, 6
+    )
+    available_matches = await repository.get_available_matches_in_date(
+        padel_court.name, bpid, DATE
+    )
+    # assert
+    assert [match.initial_hour for match in created] == [5, 6, 7]
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 1
+    assert reserved is not None and reserved.reserve
+    assert reserved_again is None
+    assert [(m.initial_hour, m.reserve) for m in available_matches] == [
+        (5, False),
+        (6, True),
+        (7, False),
+    ]
+    assert len({match.id for match in available_matches}) == 3
+    with pytest.raises(NotFoundException):
+        await repository.get_available_match(padel_court.name, bpid, DATE, 8)
+
+
+async def test_create_existing_hours_raise_error_unless_ignored(
+    session: AsyncSession,
+) -> None:
+    _, padel_court = await create_business_and_padel_court(session, uuid.uuid4())
+    repository = AvailabilityDaysRepository(session)
+    await repository.create_available_matches_in_date(
+        available_match_create(padel_court, 5, 3)
+    )
+    overlapping_create = available_match_create(padel_court, 7, 2)
+    court_name, bpid = padel_court.name, padel_court.business_public_id
+    # test
+    with pytest.raises(NotUniqueException):
+        await repository.create_available_matches_in_date(overlapping_create)
+    created = await repository.create_available_matches_in_date(
+        overlapping_create, ignore_existing=True
+    )
+    # assert
+    assert [match.initial_hour for match in created] == [8]
+    available_matches = await repository.get_available_matches_in_date(
+        court_name, bpid, DATE
+    )
+    assert [match.initial_hour for match in available_matches] == [5, 6, 7, 8]
+
+
+async def test_get_range_and_delete_like_the_rows_storage(
+    session: AsyncSession,
+) -> None:
+    _, padel_court = await create_business_and_padel_court(session, uuid.uuid4())
+    bpid = padel_court.business_public_id
+    range_filter = AvailableMatchesRangeFilter(
+        date_from=DATE,
+        date_to=DATE + datetime.timedelta(days=1),
+        initial_hour_from=6,
+        initial_hour_to=20,
+        reserve=False,
+    )
+    results = []
+    for repository in (
+        AvailableMatchesRepository(session),
+        AvailabilityDaysRepository(session),
+    ):
+        for date in (DATE, DATE + datetime.timedelta(days=1)):
+            await repository.create_available_matches_in_date(
+                available_match_create(padel_court, 5, 4, date)
+            )
+        await repository.reserve_available_match(padel_court.name, bpid, DATE, 7)
+        # test
+        in_range = await repository.get_available_matches_in_range(
+            padel_court.name, bpid, range_filter
+        )
+        not_forced = await repository.delete_available_matches_in_date(
+            padel_court.name, bpid, DATE, force=False
+        )
+        forced = await repository.delete_available_matches_in_date(
+            padel_court.name, bpid, DATE
+        )
+        results.append(
+            (
+                [(match.date, match.initial_hour) for match in in_range],
+                not_forced,
+                len(forced),
+            )
+        )
+    # assert
+    assert results[0] == results[1]
+    assert results[1][0] == [
+        (DATE, 6),
+        (DATE, 8),
+        (DATE + datetime.timedelta(days=1), 6),
+        (DATE + datetime.timedelta(days=1), 7),
+        (DATE + datetime.timedelta(days=1), 8),
+    ]
+    assert results[1][1:] == ([], 4)
+
+
+async def test_search_available_matches_like_the_rows_storage(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    _, court_1 = await create_business_and_padel_court(session, owner_id, "1")
+    _, court_2 = await create_business_and_padel_court(session, owner_id, "2")
+    search_filter = AvailableMatchesSearchFilter(
+        date_from=DATE, initial_hour_from=8, initial_hour_to=10
+    )
+    pages = []
+    for repository in (
+        AvailableMatchesRepository(session),
+        AvailabilityDaysRepository(session),
+    ):
+        for padel_court in (court_1, court_2):
+            await repository.create_available_matches_in_date(
+                available_match_create(padel_court, 7, 5)
+            )
+        await repository.reserve_available_match(
+            court_1.name, court_1.business_public_id, DATE, 9
+        )
+        # test
+        first_page = await repository.search_available_matches(search_filter, None, 3)
+        last_match = first_page[-1][0]
+        after = (last_match.date, last_match.initial_hour, last_match.id)
+        second_page = await repository.search_available_matches(search_filter, after, 3)
+        pages.append(
+            [
+                (match.court_name, match.initial_hour, latitude)
+                for match, latitude, _ in first_page + second_page
+            ]
+        )
+    # assert
+    assert pages[0] == pages[1]
+    assert len(pages[1]) == 5
+
+
+@pytest.mark.parametrize(
+    "repository_class", [AvailableMatchesRepository, AvailabilityDaysRepository]
+)
+async def test_search_skips_matches_of_renamed_courts(
+    session: AsyncSession, repository_class: type
+) -> None:
+    _, padel_court = await create_business_and_padel_court(session, uuid.uuid4())
+    repository = repository_class(session)
+    await repository.create_available_matches_in_date(
+        available_match_create(padel_court, 8, 2)
+    )
+    padel_court.name = f"{padel_court.name} renamed"
+    session.add(padel_court)
+    await session.commit()
+    # test
+    search = await repository.search_available_matches(
+        AvailableMatchesSearchFilter(
+            date_from=DATE, business_public_id=padel_court.business_public_id
+        )
+    )
+    # assert
+    assert search == []
+
+
+async def test_copy_from_available_matches(session: AsyncSession) -> None:
+    _, padel_court = await create_business_and_padel_court(session, uuid.uuid4())
+    rows_repository = AvailableMatchesRepository(session)
+    await rows_repository.create_available_matches_in_date(
+        available_match_create(padel_court, 5, 3)
+    )
+    await rows_repository.reserve_available_match(
+        padel_court.name, padel_court.business_public_id, DATE, 7
+    )
+    repository = AvailabilityDaysRepository(session)
+    # test
+    copied_days = await repository.copy_from_available_matches()
+    # assert
+    assert copied_days == 1
+    available_matches = await repository.get_available_matches_in_date(
+        padel_court.name, padel_court.business_public_id, DATE
+    )
+    assert [(m.initial_hour, m.reserve) for m in available_matches] == [
+        (5, False),
+        (6, False),
+        (7, True),
+    ]
+
+
+async def insert_rows_storage(
+    session: AsyncSession, n_courts: int, n_days: int
+) -> None:
+    """Matches from 8 to 23 of n_courts courts and n_days days, in the rows table."""
+    await session.exec(  # type: ignore[call-overload]
+        text(
+            f"""
+            INSERT INTO {AVAILABILITY_TABLE_NAME} (
+                court_name, court_public_id, business_public_id, date,
+                initial_hour, reserve
+            )
+            SELECT 'court ' || court, md5('court' || court)::uuid,
+                md5('business' || court)::uuid, DATE '2025-01-01' + day, hour,
+                hour % 3 = 0
+            FROM generate_series(1, {n_courts}) AS court,
+                generate_series(0, {n_days - 1}) AS day,
+                generate_series(8, 23) AS hour
+            """
+        )
+    )
+    await session.commit()
+
+
+def court_business_public_id(court: int) -> uuid.UUID:
+    return uuid.UUID(hashlib.md5(f"business{court}".encode()).hexdigest())
+
+
+async def test_copied_storage_returns_the_same_matches(session: AsyncSession) -> None:
+    n_courts, n_days = 2, 3
+    await insert_rows_storage(session, n_courts, n_days)
+    rows_repository = AvailableMatchesRepository(session)
+    repository = AvailabilityDaysRepository(session)
+    # test
+    copied_days = await repository.copy_from_available_matches()
+    # assert
+    assert copied_days == n_courts * n_days
+    for court in range(1, n_courts + 1):
+        for day in range(n_days):
+            date = DATE + datetime.timedelta(days=day)
+            args = (f"court {court}", court_business_public_id(court), date)
+            rows_matches = await rows_repository.get_available_matches_in_date(*args)
+            bitmap_matches = await repository.get_available_matches_in_date(*args)
+            assert sorted((m.initial_hour, m.reserve) for m in rows_matches) == [
+                (m.initial_hour, m.reserve) for m in bitmap_matches
+            ]
+    await session.exec(text(f"DELETE FROM {AVAILABILITY_TABLE_NAME}"))  # type: ignore[call-overload]
+    await session.commit()
+
+
+@benchmark
+async def test_benchmark_against_the_rows_storage(session: AsyncSession) -> None:
+    n_courts, n_days, n_queries = 50, 60, 200
+    await insert_rows_storage(session, n_courts, n_days)
+    await AvailabilityDaysRepository(session).copy_from_available_matches()
+    await session.exec(text(f"ANALYZE {AVAILABILITY_TABLE_NAME}"))  # type: ignore[call-overload]
+    await session.exec(text(f"ANALYZE {AVAILABILITY_DAY_TABLE_NAME}"))  # type: ignore[call-overload]
+
+    stats = {}
+    for table_name, repository in (
+        (AVAILABILITY_TABLE_NAME, AvailableMatchesRepository(session)),
+        (AVAILABILITY_DAY_TABLE_NAME, AvailabilityDaysRepository(session)),
+    ):
+        result = await session.exec(  # type: ignore[call-overload]
+            text(
+                f"SELECT count(*), pg_table_size('{table_name}'), "
+                f"pg_indexes_size('{table_name}') FROM {table_name}"
+            )
+        )
+        n_rows, table_size, indexes_size = result.one()
+        start = time.perf_counter()
+        for i in range(n_queries):
+            court = i % n_courts + 1
+            await repository.get_available_matches_in_date(
+                f"court {court}",
+                court_business_public_id(court),
+                DATE + datetime.timedelta(days=i % n_days),
+            )
+        elapsed = time.perf_counter() - start
+        stats[table_name] = {
+            "rows": n_rows,
+            "table_bytes": table_size,
+            "index_bytes": indexes_size,
+            "ms_per_query": 1000 * elapsed / n_queries,
+        }
+    await session.exec(text(f"DELETE FROM {AVAILABILITY_TABLE_NAME}"))  # type: ignore[call-overload]
+    await session.commit()
+    # assert
+    rows_stats = stats[AVAILABILITY_TABLE_NAME]
+    bitmap_stats = stats[AVAILABILITY_DAY_TABLE_NAME]
+    assert bitmap_stats["rows"] * 16 == rows_stats["rows"], stats
+    assert bitmap_stats["table_bytes"] < rows_stats["table_bytes"], stats
+    assert bitmap_stats["index_bytes"] < rows_stats["index_bytes"], stats
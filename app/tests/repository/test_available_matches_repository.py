@@ -5,11 +5,15 @@ from decimal import Decimal
 import pytest
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.available_match import AvailableMatchCreate
+from app.models.available_match import (
+    AvailableMatchCreate,
+    AvailableMatchesRangeFilter,
+)
 from app.models.business import BusinessCreate
 from app.models.padel_court import PadelCourt, PadelCourtCreate
 from app.repository.available_matches_repository import AvailableMatchesRepository
 from app.repository.business_repository import BusinessRepository
+from app.tests.utils.utils import count_queries, create_business_and_padel_court
 from app.utilities.exceptions import NotFoundException
 
 
@@ -273,3 +277,145 @@ async def test_update_to_reserve_available_date(session: AsyncSession) -> None:
     assert len(dates) == 1
     assert dates[0].is_reserved()
     assert date.is_reserved()
+
+
+async def test_reserve_available_match_only_once(session: AsyncSession) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    available_date_create_date = datetime.date(2025, 1, 1)
+    create = AvailableMatchCreate(
+        court_name=padel_court.name,
+        business_public_id=business.business_public_id,
+        date=available_date_create_date,
+        court_public_id=padel_court.court_public_id,
+        initial_hour=5,
+        n_matches=1,
+    )
+    repository_available_date = AvailableMatchesRepository(session)
+    await repository_available_date.create_available_matches_in_date(create)
+    # test
+    reserved = await repository_available_date.reserve_available_match(
+        padel_court.name, business.business_public_id, available_date_create_date, 5
+    )
+    reserved_again = await repository_available_date.reserve_available_match(
+        padel_court.name, business.business_public_id, available_date_create_date, 5
+    )
+    not_existing = await repository_available_date.reserve_available_match(
+        padel_court.name, business.business_public_id, available_date_create_date, 6
+    )
+    # assert
+    assert reserved is not None
+    assert reserved.is_reserved()
+    assert reserved_again is None
+    assert not_existing is None
+
+
+async def test_create_available_matches_in_one_statement(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    create = AvailableMatchCreate(
+        court_name=padel_court.name,
+        business_public_id=business.business_public_id,
+        date=datetime.date(2025, 1, 1),
+        court_public_id=padel_court.court_public_id,
+        initial_hour=0,
+        n_matches=24,
+    )
+    repository_available_date = AvailableMatchesRepository(session)
+    # test
+    with count_queries(session) as queries:
+        matches = await repository_available_date.create_available_matches_in_date(
+            create
+        )
+    # assert
+    assert len(queries) == 1
+    assert [match.initial_hour for match in matches] == list(range(24))
+    assert all(match.id is not None for match in matches)
+
+
+async def test_create_available_matches_ignoring_existing(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    create_data = {
+        "court_name": padel_court.name,
+        "business_public_id": business.business_public_id,
+        "date": datetime.date(2025, 1, 1),
+        "court_public_id": padel_court.court_public_id,
+    }
+    repository_available_date = AvailableMatchesRepository(session)
+    await repository_available_date.create_available_matches_in_date(
+        AvailableMatchCreate(**create_data, initial_hour=6, n_matches=2)
+    )
+    # test
+    matches = await repository_available_date.create_available_matches_in_date(
+        AvailableMatchCreate(**create_data, initial_hour=5, n_matches=4),
+        ignore_existing=True,
+    )
+    # assert
+    assert [match.initial_hour for match in matches] == [5, 8]
+
+
+async def test_delete_available_matches_in_one_statement(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    available_date_create_date = datetime.date(2025, 1, 1)
+    create = AvailableMatchCreate(
+        court_name=padel_court.name,
+        business_public_id=business.business_public_id,
+        date=available_date_create_date,
+        court_public_id=padel_court.court_public_id,
+        initial_hour=0,
+        n_matches=24,
+    )
+    repository_available_date = AvailableMatchesRepository(session)
+    created = await repository_available_date.create_available_matches_in_date(create)
+    # test
+    with count_queries(session) as queries:
+        deleted_ids = await repository_available_date.delete_available_matches_in_date(
+            padel_court.name, business.business_public_id, available_date_create_date
+        )
+    # assert
+    assert len(queries) == 1
+    assert sorted(deleted_ids) == sorted(match.id for match in created)
+
+
+async def test_get_available_matches_in_range(session: AsyncSession) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    repository_available_date = AvailableMatchesRepository(session)
+    for day in range(1, 5):
+        create = AvailableMatchCreate(
+            court_name=padel_court.name,
+            business_public_id=business.business_public_id,
+            date=datetime.date(2025, 1, day),
+            court_public_id=padel_court.court_public_id,
+            initial_hour=8,
+            n_matches=4,
+        )
+        await repository_available_date.create_available_matches_in_date(create)
+    await repository_available_date.reserve_available_match(
+        padel_court.name, business.business_public_id, datetime.date(2025, 1, 2), 10
+    )
+    range_filter = AvailableMatchesRangeFilter(
+        date_from=datetime.date(2025, 1, 2),
+        date_to=datetime.date(2025, 1, 3),
+        initial_hour_from=9,
+        initial_hour_to=10,
+        reserve=False,
+    )
+    # test
+    matches = await repository_available_date.get_available_matches_in_range(
+        padel_court.name, business.business_public_id, range_filter
+    )
+    # assert
+    assert [(match.date.day, match.initial_hour) for match in matches] == [
+        (2, 9),
+        (3, 9),
+        (3, 10),
+    ]
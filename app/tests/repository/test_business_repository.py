@@ -1,9 +1,15 @@
 import uuid
 
+import pytest
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.business import BusinessCreate
+from app.models.business import BusinessCreate, BusinessUpdate, NearbyFilter
 from app.repository.business_repository import BusinessRepository
+from app.tests.utils.cache import FakeSharedCacheBackend
+from app.tests.utils.utils import count_queries
+from app.utilities.cache import TTLCache
+from app.utilities.entity_cache import EntityCache, set_entity_cache
+from app.utilities.pagination import CountMode
 
 
 async def test_create_business(session: AsyncSession):
@@ -57,6 +63,7 @@ async def test_get_all_businesses(session: AsyncSession) -> None:
 
     result = await repository.get_businesses()
 
+    assert result.count is not None
     assert result.count >= 3
     assert len(result.data) >= 3
     business_names = [b.name for b in result.data]
@@ -104,12 +111,185 @@ async def test_get_businesses_with_pagination(session: AsyncSession) -> None:
 
     page2 = await repository.get_businesses(skip=2, limit=2)
 
+    assert page1.count is not None
     assert page1.count >= 5
     assert len(page1.data) == 2
 
+    assert page2.count is not None
     assert page2.count >= 5
     assert len(page2.data) == 2
 
     page1_names = [b.name for b in page1.data]
     page2_names = [b.name for b in page2.data]
     assert not any(name in page1_names for name in page2_names)
+
+
+async def test_get_businesses_with_cursor(session: AsyncSession) -> None:
+    repository = BusinessRepository(session)
+    owner_id = uuid.uuid4()
+    coords = (0.1, 0.4)
+
+    for i in range(1, 6):
+        business = BusinessCreate(name=f"Cursor Business {i}", location=f"Loc {i}")
+        await repository.create_business(owner_id, business, *coords)
+
+    # test
+    names = []
+    page = await repository.get_businesses(limit=2, owner_id=owner_id)
+    names += [b.name for b in page.data]
+    while page.next_cursor is not None:
+        page = await repository.get_businesses(
+            limit=2, cursor=page.next_cursor, owner_id=owner_id
+        )
+        names += [b.name for b in page.data]
+
+    # assert
+    assert names == [f"Cursor Business {i}" for i in range(1, 6)]
+    assert page.count == 5
+
+
+async def test_get_businesses_exact_count_in_the_page_query(
+    session: AsyncSession,
+) -> None:
+    repository = BusinessRepository(session)
+    owner_id = uuid.uuid4()
+    for i in range(1, 4):
+        business = BusinessCreate(name=f"Counted Business {i}", location=f"Loc {i}")
+        await repository.create_business(owner_id, business, 0.1, 0.4)
+
+    # test
+    with count_queries(session) as queries:
+        first_page = await repository.get_businesses(limit=2, owner_id=owner_id)
+    last_page = await repository.get_businesses(
+        limit=2, cursor=first_page.next_cursor, owner_id=owner_id
+    )
+    past_the_end = await repository.get_businesses(skip=10, limit=2, owner_id=owner_id)
+
+    # assert
+    assert len(queries) == 1
+    assert first_page.count == 3
+    assert len(last_page.data) == 1
+    assert last_page.count == 3
+    assert past_the_end.data == []
+    assert past_the_end.count == 3
+
+
+async def test_get_businesses_estimated_and_without_count(
+    session: AsyncSession,
+) -> None:
+    repository = BusinessRepository(session)
+    owner_id = uuid.uuid4()
+    business = BusinessCreate(name="Estimated Business", location="Location")
+    await repository.create_business(owner_id, business, 0.1, 0.4)
+
+    # test
+    estimated = await repository.get_businesses(count_mode=CountMode.ESTIMATED)
+    estimated_filtered = await repository.get_businesses(
+        count_mode=CountMode.ESTIMATED, owner_id=owner_id
+    )
+    without_count = await repository.get_businesses(
+        count_mode=CountMode.NONE, owner_id=owner_id
+    )
+
+    # assert
+    assert isinstance(estimated.count, int)
+    assert isinstance(estimated_filtered.count, int)
+    assert estimated.count is not None
+    assert estimated.count >= 0
+    assert estimated_filtered.count >= 0
+    assert without_count.count is None
+    assert len(without_count.data) == 1
+
+
+async def test_get_businesses_estimated_with_colon_in_the_filter(
+    session: AsyncSession,
+) -> None:
+    repository = BusinessRepository(session)
+    owner_id = uuid.uuid4()
+    business = BusinessCreate(name="Cancha :uno", location="Location")
+    await repository.create_business(owner_id, business, 0.1, 0.4)
+
+    # test
+    estimated = await repository.get_businesses(
+        count_mode=CountMode.ESTIMATED, name="Cancha :uno"
+    )
+
+    # assert
+    assert isinstance(estimated.count, int)
+    assert [b.name for b in estimated.data] == ["Cancha :uno"]
+
+
+async def test_get_businesses_nearby_sorted_by_distance(
+    session: AsyncSession,
+) -> None:
+    repository = BusinessRepository(session)
+    owner_id = uuid.uuid4()
+    # (longitude, latitude): Obelisco, Plaza de Mayo (~1.5 km), La Plata (~55 km)
+    locations = {
+        "Obelisco": (-58.3816, -34.6037),
+        "Plaza de Mayo": (-58.3724, -34.6083),
+        "La Plata": (-57.9545, -34.9214),
+    }
+    for name, (longitude, latitude) in locations.items():
+        await repository.create_business(
+            owner_id,
+            BusinessCreate(name=name, location=name),
+            longitude,
+            latitude,
+        )
+    nearby_filter = NearbyFilter(lat=-34.6083, lng=-58.3712, radius_km=5)
+    # test
+    result = await repository.get_businesses_nearby(nearby_filter)
+    # assert
+    assert [business.name for business, _ in result] == ["Plaza de Mayo", "Obelisco"]
+    distances = [distance_km for _, distance_km in result]
+    assert distances[0] < 0.2
+    assert 0.5 < distances[1] < 2
+
+
+@pytest.mark.usefixtures("memory_entity_cache")
+async def test_get_business_twice_is_read_from_the_entity_cache(
+    session: AsyncSession,
+) -> None:
+    repository = BusinessRepository(session)
+    business = await repository.create_business(
+        uuid.uuid4(), BusinessCreate(name="Padel Si", location="Av 1"), 0.1, 0.4
+    )
+    await repository.get_business(business.business_public_id)
+    # test
+    with count_queries(session) as statements:
+        cached_business = await repository.get_business(business.business_public_id)
+    # assert
+    assert statements == []
+    assert cached_business.name == "Padel Si"
+    assert cached_business.latitude == 0.4
+
+
+async def test_update_business_invalidates_it_for_every_worker(
+    session: AsyncSession,
+) -> None:
+    store: TTLCache[str, bytes] = TTLCache(max_size=100, ttl=60)
+    worker_1 = EntityCache(FakeSharedCacheBackend(store), ttl=60)
+    worker_2 = EntityCache(FakeSharedCacheBackend(store), ttl=60)
+    repository = BusinessRepository(session)
+    try:
+        set_entity_cache(worker_1)
+        business = await repository.create_business(
+            uuid.uuid4(), BusinessCreate(name="Padel Si", location="Av 1"), 0.1, 0.4
+        )
+        await repository.get_business(business.business_public_id)
+        set_entity_cache(worker_2)
+        # test
+        await repository.update_business(
+            business.business_public_id, BusinessUpdate(name="Padel No")
+        )
+        set_entity_cache(worker_1)
+        with count_queries(session) as statements:
+            updated_business = await repository.get_business(
+                business.business_public_id
+            )
+    finally:
+        set_entity_cache(None)
+    # assert
+    assert updated_business.name == "Padel No"
+    assert len(statements) == 1
@@ -0,0 +1,194 @@
+import datetime
+import json
+import uuid
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.available_match import (
+    AVAILABILITY_TABLE_NAME,
+    AvailableMatchCreate,
+    AvailableMatchesRangeFilter,
+    AvailableMatchesSearchFilter,
+)
+from app.models.business import BUSINESS_TABLE_NAME, Business
+from app.models.padel_court import PADEL_COURT_TABLE_NAME
+from app.repository.available_matches_repository import AvailableMatchesRepository
+from app.repository.business_repository import BusinessRepository
+from app.repository.padel_court_repository import PadelCourtRepository
+from app.tests.utils.utils import count_queries, create_business_and_padel_court
+
+INDEX_NODE_TYPES = {"Index Scan", "Index Only Scan", "Bitmap Heap Scan"}
+
+
+def _plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def explain_scans(
+    engine: AsyncEngine, statements: list[tuple[str, Any]], table: str
+) -> tuple[set[str], set[str]]:
+    """Scan node types and index names the planner uses to read table.
+
+    Sequential scans are disabled, so they only show up when no index can
+    serve the statement, however small the test tables are. The table is
+    analyzed first so the choice between indexes does not depend on stale
+    statistics left by other tests.
+    """
+    node_types: set[str] = set()
+    index_names: set[str] = set()
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql(f"ANALYZE {table}")
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        for statement, parameters in statements:
+            if table not in statement:
+                continue
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            plan = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            for node in _plan_nodes(plan[0]["Plan"]):
+                is_scan = node["Node Type"].endswith("Scan")
+                if is_scan and node.get("Relation Name") == table:
+                    node_types.add(node["Node Type"])
+                if "Index Name" in node:
+                    index_names.add(node["Index Name"])
+        await conn.rollback()
+    return node_types, index_names
+
+
+async def test_get_available_matches_in_date_uses_index(
+    session: AsyncSession, engine: AsyncEngine
+) -> None:
+    business, court = await create_business_and_padel_court(session, uuid.uuid4())
+    repository = AvailableMatchesRepository(session)
+    # test
+    with count_queries(session, with_parameters=True) as statements:
+        await repository.get_available_matches_in_date(
+            court.name, business.business_public_id, datetime.date.today()
+        )
+    node_types, _ = await explain_scans(engine, statements, AVAILABILITY_TABLE_NAME)
+    # assert
+    assert node_types
+    assert node_types <= INDEX_NODE_TYPES
+
+
+async def test_get_available_matches_in_range_uses_index(
+    session: AsyncSession, engine: AsyncEngine
+) -> None:
+    business, court = await create_business_and_padel_court(session, uuid.uuid4())
+    repository = AvailableMatchesRepository(session)
+    range_filter = AvailableMatchesRangeFilter(date_from=datetime.date.today())
+    # test
+    with count_queries(session, with_parameters=True) as statements:
+        await repository.get_available_matches_in_range(
+            court.name, business.business_public_id, range_filter
+        )
+    node_types, _ = await explain_scans(engine, statements, AVAILABILITY_TABLE_NAME)
+    # assert
+    assert node_types
+    assert node_types <= INDEX_NODE_TYPES
+
+
+async def test_reserve_available_match_uses_index(
+    session: AsyncSession, engine: AsyncEngine
+) -> None:
+    business, court = await create_business_and_padel_court(session, uuid.uuid4())
+    repository = AvailableMatchesRepository(session)
+    today = datetime.date.today()
+    await repository.create_available_matches_in_date(
+        AvailableMatchCreate(
+            court_name=court.name,
+            court_public_id=court.court_public_id,
+            business_public_id=business.business_public_id,
+            date=today,
+            initial_hour=10,
+        )
+    )
+    # test
+    with count_queries(session, with_parameters=True) as statements:
+        await repository.reserve_available_match(
+            court.name, business.business_public_id, today, 10
+        )
+    node_types, _ = await explain_scans(engine, statements, AVAILABILITY_TABLE_NAME)
+    # assert
+    assert node_types
+    assert node_types <= INDEX_NODE_TYPES
+
+
+async def test_search_available_matches_uses_unreserved_partial_index(
+    session: AsyncSession, engine: AsyncEngine
+) -> None:
+    repository = AvailableMatchesRepository(session)
+    search_filter = AvailableMatchesSearchFilter(date_from=datetime.date.today())
+    # test
+    with count_queries(session, with_parameters=True) as statements:
+        await repository.search_available_matches(search_filter)
+    node_types, index_names = await explain_scans(
+        engine, statements, AVAILABILITY_TABLE_NAME
+    )
+    # assert
+    assert node_types <= INDEX_NODE_TYPES
+    assert f"ix_{AVAILABILITY_TABLE_NAME}_unreserved" in index_names
+
+
+async def test_release_expired_holds_uses_hold_partial_index(
+    session: AsyncSession, engine: AsyncEngine
+) -> None:
+    repository = AvailableMatchesRepository(session)
+    # test
+    with count_queries(session, with_parameters=True) as statements:
+        await repository.release_expired_holds(batch_size=100)
+    node_types, index_names = await explain_scans(
+        engine, statements, AVAILABILITY_TABLE_NAME
+    )
+    # assert
+    assert node_types <= INDEX_NODE_TYPES
+    assert f"ix_{AVAILABILITY_TABLE_NAME}_hold_expires_at" in index_names
+
+
+async def test_get_businesses_by_owner_uses_index(
+    session: AsyncSession, engine: AsyncEngine
+) -> None:
+    # Businesses of other owners, so scanning by id is clearly the worse plan
+    session.add_all(
+        Business(
+            name=f"Padel {number}",
+            location="Av 1",
+            owner_id=uuid.uuid4(),
+            latitude=0.1,
+            longitude=0.4,
+        )
+        for number in range(50)
+    )
+    await session.commit()
+    repository = BusinessRepository(session)
+    # test
+    with count_queries(session, with_parameters=True) as statements:
+        await repository.get_businesses(owner_id=uuid.uuid4())
+    node_types, index_names = await explain_scans(
+        engine, statements, BUSINESS_TABLE_NAME
+    )
+    # assert
+    assert node_types <= INDEX_NODE_TYPES
+    assert "ix_businesses_owner_id_id" in index_names
+
+
+async def test_get_padel_court_uses_index(
+    session: AsyncSession, engine: AsyncEngine
+) -> None:
+    business, court = await create_business_and_padel_court(session, uuid.uuid4())
+    repository = PadelCourtRepository(session)
+    # test
+    with count_queries(session, with_parameters=True) as statements:
+        await repository.get_padel_court(court.name, business.business_public_id)
+    node_types, _ = await explain_scans(engine, statements, PADEL_COURT_TABLE_NAME)
+    # assert
+    assert node_types
+    assert node_types <= INDEX_NODE_TYPES
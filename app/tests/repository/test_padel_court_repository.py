@@ -5,13 +5,16 @@ import pytest
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.business import BusinessCreate
-from app.models.padel_court import PadelCourt, PadelCourtCreate
+from app.models.padel_court import PadelCourt, PadelCourtCreate, PadelCourtUpdate
 from app.repository.business_repository import BusinessRepository
 from app.repository.padel_court_repository import PadelCourtRepository
+from app.tests.utils.utils import count_queries
 from app.utilities.exceptions import (
     BusinessNotFoundException,
+    NotFoundException,
     UnauthorizedPadelCourtOperationException,
 )
+from app.utilities.pagination import CountMode
 
 
 async def test_create_padel_court(session: AsyncSession):
@@ -148,6 +151,7 @@ async def test_get_all_padel_courts(session: AsyncSession) -> None:
 
     result = await padel_court_repo.get_padel_courts()
 
+    assert result.count is not None
     assert result.count >= 3
     assert len(result.data) >= 3
     court_names = [c.name for c in result.data]
@@ -227,12 +231,164 @@ async def test_get_padel_courts_with_pagination(session: AsyncSession) -> None:
         business_public_id=business.business_public_id, skip=2, limit=2
     )
 
+    assert page1.count is not None
     assert page1.count >= 5
     assert len(page1.data) == 2
 
+    assert page2.count is not None
     assert page2.count >= 5
     assert len(page2.data) == 2
 
     page1_names = [c.name for c in page1.data]
     page2_names = [c.name for c in page2.data]
     assert not any(name in page1_names for name in page2_names)
+
+
+async def test_get_padel_courts_extended_with_cursor(session: AsyncSession) -> None:
+    business_repo = BusinessRepository(session)
+    padel_court_repo = PadelCourtRepository(session)
+    owner_id = uuid.uuid4()
+    business = await business_repo.create_business(
+        owner_id, BusinessCreate(name="Cursor Business", location="Location"), 0.1, 0.4
+    )
+    for i in range(1, 6):
+        court = PadelCourtCreate(name=f"Cursor Court {i}", price_per_hour=Decimal(100))
+        await padel_court_repo.create_padel_court(
+            owner_id, business.business_public_id, court
+        )
+
+    # test
+    names = []
+    cursor = None
+    for _ in range(3):
+        page = await padel_court_repo.get_padel_courts_extended(
+            business.business_public_id, owner_id, limit=2, cursor=cursor
+        )
+        names += [c.name for c in page.data]
+        cursor = page.next_cursor
+
+    # assert
+    assert names == [f"Cursor Court {i}" for i in range(1, 6)]
+    assert cursor is None
+
+
+async def test_get_padel_courts_extended_with_count_mode(
+    session: AsyncSession,
+) -> None:
+    business_repo = BusinessRepository(session)
+    padel_court_repo = PadelCourtRepository(session)
+    owner_id = uuid.uuid4()
+    business = await business_repo.create_business(
+        owner_id, BusinessCreate(name="Count Business", location="Location"), 0.1, 0.4
+    )
+    for i in range(1, 4):
+        court = PadelCourtCreate(name=f"Count Court {i}", price_per_hour=Decimal(100))
+        await padel_court_repo.create_padel_court(
+            owner_id, business.business_public_id, court
+        )
+
+    # test
+    page = await padel_court_repo.get_padel_courts_extended(
+        business.business_public_id, owner_id, limit=2
+    )
+    exact = await padel_court_repo.get_padel_courts_extended(
+        business.business_public_id, owner_id, limit=2, count_mode=CountMode.EXACT
+    )
+
+    # assert
+    assert page.count == 2
+    assert exact.count == 3
+    assert [c.name for c in exact.data] == ["Count Court 1", "Count Court 2"]
+
+
+async def test_get_padel_courts_extended_includes_business(
+    session: AsyncSession,
+) -> None:
+    business_repo = BusinessRepository(session)
+    padel_court_repo = PadelCourtRepository(session)
+    owner_id = uuid.uuid4()
+    coords = (0.1, 0.4)
+
+    business = await business_repo.create_business(
+        owner_id,
+        BusinessCreate(name="Extended Business", location="Extended Location"),
+        *coords,
+    )
+    court = PadelCourtCreate(name="Extended Court", price_per_hour=Decimal("100.00"))
+    await padel_court_repo.create_padel_court(
+        owner_id, business.business_public_id, court
+    )
+
+    result = await padel_court_repo.get_padel_courts_extended(
+        business_public_id=business.business_public_id, user_id=owner_id
+    )
+
+    assert result.count == 1
+    court_extended = result.data[0]
+    assert court_extended.name == "Extended Court"
+    assert court_extended.business_name == "Extended Business"
+    assert court_extended.business_location == "Extended Location"
+    assert court_extended.owner_id == owner_id
+    assert court_extended.business_public_id == business.business_public_id
+
+
+async def test_get_padel_courts_extended_uses_one_query_for_any_page_size(
+    session: AsyncSession,
+) -> None:
+    business_repo = BusinessRepository(session)
+    padel_court_repo = PadelCourtRepository(session)
+    coords = (0.1, 0.4)
+
+    for i in range(10):
+        owner_id = uuid.uuid4()
+        business = await business_repo.create_business(
+            owner_id,
+            BusinessCreate(name=f"Round Trip Business {i}", location="Location"),
+            *coords,
+        )
+        court = PadelCourtCreate(name=f"Court {i}", price_per_hour=Decimal("100.00"))
+        await padel_court_repo.create_padel_court(
+            owner_id, business.business_public_id, court
+        )
+
+    with count_queries(session) as small_page_queries:
+        small_page = await padel_court_repo.get_padel_courts_extended(limit=2)
+    with count_queries(session) as large_page_queries:
+        large_page = await padel_court_repo.get_padel_courts_extended(limit=10)
+
+    assert small_page.count == 2
+    assert large_page.count == 10
+    assert len(small_page_queries) == len(large_page_queries) == 1
+
+
+@pytest.mark.usefixtures("memory_entity_cache")
+async def test_get_padel_court_after_rename_is_not_read_from_the_entity_cache(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business = await BusinessRepository(session).create_business(
+        owner_id, BusinessCreate(name="Padel Si", location="Av 1"), 0.1, 0.4
+    )
+    repository = PadelCourtRepository(session)
+    court = await repository.create_padel_court(
+        owner_id,
+        business.business_public_id,
+        PadelCourtCreate(name="1", price_per_hour=Decimal("15000.00")),
+    )
+    await repository.get_padel_court("1", business.business_public_id)
+    with count_queries(session) as statements:
+        cached_court = await repository.get_padel_court(
+            "1", business.business_public_id
+        )
+    assert statements == []
+    assert cached_court.price_per_hour == Decimal("15000.00")
+    # test
+    await repository.update_padel_court(
+        court.court_public_id,
+        PadelCourtUpdate(name="2", price_per_hour=Decimal("20000.00")),
+    )
+    # assert
+    with pytest.raises(NotFoundException):
+        await repository.get_padel_court("1", business.business_public_id)
+    renamed_court = await repository.get_padel_court("2", business.business_public_id)
+    assert renamed_court.court_public_id == court.court_public_id
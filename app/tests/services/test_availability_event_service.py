@@ -0,0 +1,76 @@
+import asyncio
+import datetime
+import json
+import uuid
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.available_match import AvailabilityEventType, AvailableMatchCreate
+from app.services.availability_event_service import AvailabilityEventService
+from app.services.available_match_service import AvailableMatchService
+from app.tests.utils.utils import create_business_and_padel_court
+
+DATE = datetime.date(2025, 2, 22)
+
+
+async def test_stream_sends_only_the_events_of_the_court_and_date() -> None:
+    service = AvailabilityEventService()
+    business_public_id = uuid.uuid4()
+    stream = service.stream(business_public_id, "cancha 1", DATE)
+    # test
+    assert await anext(stream) == ": subscribed\n\n"
+    await service.publish(
+        AvailabilityEventType.RESERVED, uuid.uuid4(), "cancha 1", DATE, [7]
+    )
+    await service.publish(
+        AvailabilityEventType.RESERVED, business_public_id, "cancha 2", DATE, [7]
+    )
+    await service.publish(
+        AvailabilityEventType.RESERVED, business_public_id, "cancha 1", DATE, [8]
+    )
+    message = await asyncio.wait_for(anext(stream), 5)
+    await stream.aclose()
+    # assert
+    event_line, data_line, _, _ = message.split("\n")
+    assert event_line == "event: reserved"
+    data = json.loads(data_line.removeprefix("data: "))
+    assert data["court_name"] == "cancha 1"
+    assert data["hours"] == [8]
+
+
+async def test_available_match_mutations_are_streamed(session: AsyncSession) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    service = AvailableMatchService()
+    stream = AvailabilityEventService().stream(business.business_public_id)
+    await anext(stream)
+    # test
+    await service.create_available_matches_in_date(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        AvailableMatchCreate(
+            court_name=padel_court.name,
+            court_public_id=padel_court.court_public_id,
+            business_public_id=business.business_public_id,
+            date=DATE,
+            initial_hour=5,
+            n_matches=3,
+        ),
+    )
+    await service.reserve_available_match(
+        session, padel_court.name, business.business_public_id, DATE, 6
+    )
+    await service.delete_available_matches_in_date(
+        session, owner_id, padel_court.name, business.business_public_id, DATE
+    )
+    messages = [await asyncio.wait_for(anext(stream), 5) for _ in range(3)]
+    await stream.aclose()
+    # assert
+    events = [json.loads(message.split("data: ")[1]) for message in messages]
+    assert [(event["type"], event["hours"]) for event in events] == [
+        ("created", [5, 6, 7]),
+        ("reserved", [6]),
+        ("deleted", []),
+    ]
@@ -0,0 +1,373 @@
+import asyncio
+import datetime
+import json
+import uuid
+from typing import Any
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.models.availability_template import (
+    AvailabilityTemplateCreate,
+    AvailabilityTemplateDayCreate,
+)
+from app.models.available_match import (
+    AvailableMatchCreate,
+    AvailableMatchesSearchFilter,
+)
+from app.services.availability_event_service import AvailabilityEventService
+from app.services.availability_template_service import AvailabilityTemplateService
+from app.services.available_match_service import AvailableMatchService
+from app.tests.utils.utils import create_business_and_padel_court
+from app.utilities.exceptions import NotAcceptableException, UnauthorizedUserException
+
+
+def next_weekday(weekday: int, weeks: int = 1) -> datetime.date:
+    """Date of the weekday in the given week from today, never today."""
+    today = datetime.date.today()
+    days = (weekday - today.weekday()) % 7 or 7
+    return today + datetime.timedelta(days=days + 7 * (weeks - 1))
+
+
+def template(*days: tuple[int, int, int]) -> AvailabilityTemplateCreate:
+    return AvailabilityTemplateCreate(
+        days=[
+            AvailabilityTemplateDayCreate(
+                weekday=weekday, initial_hour=initial_hour, n_matches=n_matches
+            )
+            for weekday, initial_hour, n_matches in days
+        ]
+    )
+
+
+async def test_set_template_returns_the_days_as_runs_of_hours(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    service = AvailabilityTemplateService()
+    # test
+    result = await service.set_template(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        template((2, 18, 2), (0, 8, 2), (0, 10, 1)),
+    )
+    # assert
+    assert [(day.weekday, day.initial_hour, day.n_matches) for day in result.days] == [
+        (0, 8, 3),
+        (2, 18, 2),
+    ]
+    assert result.exceptions == []
+
+
+async def test_set_template_of_other_owner_raises_unauthorized(
+    session: AsyncSession,
+) -> None:
+    business, padel_court = await create_business_and_padel_court(session, uuid.uuid4())
+    # test
+    with pytest.raises(UnauthorizedUserException):
+        await AvailabilityTemplateService().set_template(
+            session,
+            uuid.uuid4(),
+            padel_court.name,
+            business.business_public_id,
+            template((0, 8, 2)),
+        )
+
+
+async def test_set_template_exceeding_the_day_raises_not_acceptable(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    # test
+    with pytest.raises(NotAcceptableException):
+        await AvailabilityTemplateService().set_template(
+            session,
+            owner_id,
+            padel_court.name,
+            business.business_public_id,
+            template((0, 20, 8)),
+        )
+
+
+async def test_reading_a_date_materializes_the_template(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    await AvailabilityTemplateService().set_template(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        template((3, 18, 3)),
+    )
+    thursday = next_weekday(3)
+    service = AvailableMatchService()
+    # test
+    available_matches = await service.get_available_matches_in_date(
+        session, padel_court.name, business.business_public_id, thursday
+    )
+    friday = await service.get_available_matches_in_date(
+        session,
+        padel_court.name,
+        business.business_public_id,
+        thursday + datetime.timedelta(days=1),
+    )
+    # assert
+    assert sorted(match.initial_hour for match in available_matches) == [18, 19, 20]
+    assert all(match.date == thursday for match in available_matches)
+    assert friday == []
+
+
+async def test_deleted_matches_of_a_materialized_date_are_not_created_again(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    await AvailabilityTemplateService().set_template(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        template((1, 9, 2)),
+    )
+    tuesday = next_weekday(1)
+    service = AvailableMatchService()
+    await service.get_available_matches_in_date(
+        session, padel_court.name, business.business_public_id, tuesday
+    )
+    await service.delete_available_matches_in_date(
+        session, owner_id, padel_court.name, business.business_public_id, tuesday
+    )
+    # test
+    available_matches = await service.get_available_matches_in_date(
+        session, padel_court.name, business.business_public_id, tuesday
+    )
+    # assert
+    assert available_matches == []
+
+
+async def test_exception_dates_are_skipped_until_removed(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    service = AvailabilityTemplateService()
+    await service.set_template(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        template((5, 10, 2)),
+    )
+    saturday = next_weekday(5)
+    result = await service.add_exception(
+        session, owner_id, padel_court.name, business.business_public_id, saturday
+    )
+    assert result.exceptions == [saturday]
+    match_service = AvailableMatchService()
+    # test
+    skipped = await match_service.get_available_matches_in_date(
+        session, padel_court.name, business.business_public_id, saturday
+    )
+    await service.delete_exception(
+        session, owner_id, padel_court.name, business.business_public_id, saturday
+    )
+    restored = await match_service.get_available_matches_in_date(
+        session, padel_court.name, business.business_public_id, saturday
+    )
+    # assert
+    assert skipped == []
+    assert sorted(match.initial_hour for match in restored) == [10, 11]
+
+
+async def test_reserve_materializes_the_template_first(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    await AvailabilityTemplateService().set_template(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        template((4, 20, 1)),
+    )
+    # test
+    available_match = await AvailableMatchService().reserve_available_match(
+        session, padel_court.name, business.business_public_id, next_weekday(4), 20
+    )
+    # assert
+    assert available_match.reserve is True
+
+
+async def test_search_materializes_the_templates_first(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    await AvailabilityTemplateService().set_template(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        template((1, 9, 2)),
+    )
+    tuesday = next_weekday(1, weeks=3)
+    # test
+    rows = await AvailableMatchService().search_available_matches(
+        session,
+        AvailableMatchesSearchFilter(
+            date_from=tuesday, business_public_id=business.business_public_id
+        ),
+    )
+    # assert
+    assert [(match.date, match.initial_hour) for match, _, _ in rows] == [
+        (tuesday, 9),
+        (tuesday, 10),
+    ]
+
+
+async def test_search_without_business_does_not_materialize(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    await AvailabilityTemplateService().set_template(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        template((1, 9, 2)),
+    )
+    tuesday = next_weekday(1, weeks=3)
+    # test
+    rows = await AvailableMatchService().search_available_matches(
+        session, AvailableMatchesSearchFilter(date_from=tuesday, date_to=tuesday)
+    )
+    # assert
+    assert [
+        match
+        for match, _, _ in rows
+        if match.business_public_id == business.business_public_id
+    ] == []
+
+
+@pytest.mark.parametrize("storage", ["rows", "bitmap"])
+async def test_materialized_dates_are_streamed_as_created(
+    session: AsyncSession, monkeypatch: Any, storage: str
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", storage)
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    service = AvailabilityTemplateService()
+    await service.set_template(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        template((5, 10, 2)),
+    )
+    saturday = next_weekday(5)
+    stream = AvailabilityEventService().stream(business.business_public_id)
+    await anext(stream)
+    # test
+    await service.materialize(
+        session, padel_court.name, business.business_public_id, saturday, saturday
+    )
+    message = await asyncio.wait_for(anext(stream), 5)
+    await stream.aclose()
+    # assert
+    event = json.loads(message.split("data: ")[1])
+    assert (event["type"], event["date"], event["hours"]) == (
+        "created",
+        saturday.isoformat(),
+        [10, 11],
+    )
+
+
+@pytest.mark.parametrize("storage", ["rows", "bitmap"])
+async def test_materialize_ahead_creates_every_template_once(
+    session: AsyncSession, monkeypatch: Any, storage: str
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", storage)
+    monkeypatch.setattr(settings, "AVAILABILITY_TEMPLATES_LAZY", False)
+    owner_id = uuid.uuid4()
+    service = AvailabilityTemplateService()
+    courts = []
+    for court_name in ("Norte", "Sur"):
+        business, padel_court = await create_business_and_padel_court(
+            session, owner_id, court_name=court_name
+        )
+        await service.set_template(
+            session,
+            owner_id,
+            padel_court.name,
+            business.business_public_id,
+            template(*[(weekday, 8, 4) for weekday in range(7)]),
+        )
+        courts.append((business, padel_court))
+    # test
+    n_days = await service.materialize_ahead(session, weeks=2)
+    n_days_again = await service.materialize_ahead(session, weeks=2)
+    # assert
+    assert n_days == 2 * 14
+    assert n_days_again == 0
+    date = datetime.date.today() + datetime.timedelta(days=13)
+    for business, padel_court in courts:
+        available_matches = await AvailableMatchService().get_available_matches_in_date(
+            session, padel_court.name, business.business_public_id, date
+        )
+        assert sorted(match.initial_hour for match in available_matches) == [
+            8,
+            9,
+            10,
+            11,
+        ]
+
+
+async def test_materialize_keeps_existing_matches_of_the_date(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    wednesday = next_weekday(2)
+    match_service = AvailableMatchService()
+    await match_service.create_available_matches_in_date(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        AvailableMatchCreate(
+            court_name=padel_court.name,
+            court_public_id=padel_court.court_public_id,
+            business_public_id=business.business_public_id,
+            date=wednesday,
+            initial_hour=9,
+            n_matches=2,
+        ),
+    )
+    await match_service.reserve_available_match(
+        session, padel_court.name, business.business_public_id, wednesday, 9
+    )
+    await AvailabilityTemplateService().set_template(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        template((2, 8, 3)),
+    )
+    # test
+    available_matches = await match_service.get_available_matches_in_date(
+        session, padel_court.name, business.business_public_id, wednesday
+    )
+    # assert
+    assert [
+        (match.initial_hour, match.reserve)
+        for match in sorted(available_matches, key=lambda match: match.initial_hour)
+    ] == [(8, False), (9, True), (10, False)]
@@ -1,17 +1,32 @@
+import asyncio
+import datetime
 import uuid
 from datetime import date
 from decimal import Decimal
+from typing import Any
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.available_match import AvailableMatchCreate
+from app.core.config import settings
+from app.models.available_match import (
+    AvailableMatch,
+    AvailableMatchCreate,
+    AvailableMatchesHours,
+    AvailableMatchesRangeFilter,
+    AvailableMatchesSearchFilter,
+    AvailableMatchPublic,
+)
 from app.models.business import BusinessCreate
 from app.models.padel_court import PadelCourt, PadelCourtCreate
+from app.repository.available_matches_repository import AvailableMatchesRepository
 from app.repository.business_repository import BusinessRepository
 from app.services.available_match_service import AvailableMatchService
+from app.tests.utils.utils import count_queries, create_business_and_padel_court
 from app.utilities.exceptions import (
     CourtAlreadyReservedException,
+    NotAcceptableException,
     NotFoundException,
     NotUniqueException,
     UnauthorizedUserException,
@@ -369,3 +384,516 @@ async def test_reserve_match_already_reserved_raise_CourtAlreadyReservedExceptio
     assert (
         e.value.detail == f"La cancha {str(padel_court_data['name'])} está reservada."
     )
+
+
+async def test_reserve_match_concurrently_has_exactly_one_winner(
+    session: AsyncSession, engine: AsyncEngine
+) -> None:
+    business_data = {"name": "Padel Ya", "location": "Av La plata 210"}
+    business = BusinessCreate(**business_data)
+    owner_id = uuid.uuid4()
+    padel_court_data = {"name": "Padel Si", "price_per_hour": Decimal("15000.00")}
+    padel_court_in = PadelCourtCreate(**padel_court_data)
+
+    business_repository = BusinessRepository(session)
+    longitude = 0.1
+    latitude = 0.4
+    created_business = await business_repository.create_business(
+        owner_id, business, longitude, latitude
+    )
+    business_public_id = created_business.business_public_id
+    new_padel_court = PadelCourt.model_validate(
+        padel_court_in, update={"business_public_id": business_public_id}
+    )
+    session.add(new_padel_court)
+    await session.commit()
+    await session.refresh(new_padel_court)
+
+    create_date = date(2025, 1, 1)
+
+    service = AvailableMatchService()
+    data_available_date = {
+        "court_name": str(padel_court_data["name"]),
+        "business_public_id": business_public_id,
+        "date": create_date,
+        "court_public_id": new_padel_court.court_public_id,
+        "initial_hour": 5,
+        "n_matches": 1,
+    }
+    available_date_create = AvailableMatchCreate(**data_available_date)
+    await service.create_available_matches_in_date(
+        session,
+        owner_id,
+        str(padel_court_data["name"]),
+        business_public_id,
+        available_date_create,
+    )
+    n_requests = 10
+
+    async def reserve() -> bool:
+        async with AsyncSession(engine, expire_on_commit=False) as other_session:
+            try:
+                await service.reserve_available_match(
+                    other_session,
+                    str(padel_court_data["name"]),
+                    business_public_id,
+                    create_date,
+                    5,
+                )
+                return True
+            except CourtAlreadyReservedException:
+                return False
+
+    # test
+    results = await asyncio.gather(*(reserve() for _ in range(n_requests)))
+    # assert
+    assert results.count(True) == 1
+    assert results.count(False) == n_requests - 1
+
+
+async def test_delete_without_force_with_reserved_match_raises_and_keeps_matches(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    create_date = date(2025, 1, 1)
+    service = AvailableMatchService()
+    available_date_create = AvailableMatchCreate(
+        court_name=padel_court.name,
+        business_public_id=business.business_public_id,
+        court_public_id=padel_court.court_public_id,
+        date=create_date,
+        initial_hour=5,
+        n_matches=3,
+    )
+    await service.create_available_matches_in_date(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        available_date_create,
+    )
+    await service.reserve_available_match(
+        session, padel_court.name, business.business_public_id, create_date, 6
+    )
+    # test
+    with pytest.raises(CourtAlreadyReservedException):
+        await service.delete_available_matches_in_date(
+            session,
+            owner_id,
+            padel_court.name,
+            business.business_public_id,
+            create_date,
+            force=False,
+        )
+    # assert
+    response_get = await service.get_available_matches_in_date(
+        session, padel_court.name, business.business_public_id, create_date
+    )
+    assert len(response_get) == 3
+
+
+async def test_delete_with_force_deletes_reserved_matches(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    create_date = date(2025, 1, 1)
+    service = AvailableMatchService()
+    available_date_create = AvailableMatchCreate(
+        court_name=padel_court.name,
+        business_public_id=business.business_public_id,
+        court_public_id=padel_court.court_public_id,
+        date=create_date,
+        initial_hour=5,
+        n_matches=3,
+    )
+    await service.create_available_matches_in_date(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        available_date_create,
+    )
+    await service.reserve_available_match(
+        session, padel_court.name, business.business_public_id, create_date, 6
+    )
+    # test
+    count = await service.delete_available_matches_in_date(
+        session, owner_id, padel_court.name, business.business_public_id, create_date
+    )
+    # assert
+    assert count == 3
+    response_get = await service.get_available_matches_in_date(
+        session, padel_court.name, business.business_public_id, create_date
+    )
+    assert len(response_get) == 0
+
+
+async def create_matches_for_consecutive_reserve(
+    session: AsyncSession, initial_hour: int = 8, n_matches: int = 6
+) -> tuple[uuid.UUID, str]:
+    owner_id = uuid.uuid4()
+    business, padel_court = await create_business_and_padel_court(session, owner_id)
+    await AvailableMatchService().create_available_matches_in_date(
+        session,
+        owner_id,
+        padel_court.name,
+        business.business_public_id,
+        AvailableMatchCreate(
+            court_name=padel_court.name,
+            business_public_id=business.business_public_id,
+            court_public_id=padel_court.court_public_id,
+            date=date(2025, 1, 1),
+            initial_hour=initial_hour,
+            n_matches=n_matches,
+        ),
+    )
+    return business.business_public_id, padel_court.name
+
+
+async def reserved_hours(
+    session: AsyncSession, court_name: str, business_public_id: uuid.UUID
+) -> list[int]:
+    available_matches = await AvailableMatchService().get_available_matches_in_date(
+        session, court_name, business_public_id, date(2025, 1, 1)
+    )
+    return sorted(match.initial_hour for match in available_matches if match.reserve)
+
+
+@pytest.mark.parametrize("storage", ["rows", "bitmap"])
+async def test_reserve_consecutive_matches_in_one_statement(
+    session: AsyncSession, monkeypatch: Any, storage: str
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", storage)
+    monkeypatch.setattr(settings, "AVAILABILITY_TEMPLATES_LAZY", False)
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    # test
+    with count_queries(session) as statements:
+        available_matches = await AvailableMatchService().reserve_available_matches(
+            session,
+            court_name,
+            business_public_id,
+            date(2025, 1, 1),
+            AvailableMatchesHours(initial_hour=9, n_matches=2),
+        )
+    # assert
+    assert len(statements) == 1
+    assert [(match.initial_hour, match.reserve) for match in available_matches] == [
+        (9, True),
+        (10, True),
+    ]
+    assert await reserved_hours(session, court_name, business_public_id) == [9, 10]
+
+
+@pytest.mark.parametrize("storage", ["rows", "bitmap"])
+async def test_reserve_consecutive_matches_with_one_reserved_reserves_none(
+    session: AsyncSession, monkeypatch: Any, storage: str
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", storage)
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    service = AvailableMatchService()
+    await service.reserve_available_match(
+        session, court_name, business_public_id, date(2025, 1, 1), 11
+    )
+    # test
+    with pytest.raises(CourtAlreadyReservedException):
+        await service.reserve_available_matches(
+            session,
+            court_name,
+            business_public_id,
+            date(2025, 1, 1),
+            AvailableMatchesHours(initial_hour=10, n_matches=3),
+        )
+    # assert
+    assert await reserved_hours(session, court_name, business_public_id) == [11]
+
+
+@pytest.mark.parametrize("storage", ["rows", "bitmap"])
+async def test_reserve_consecutive_matches_with_one_missing_raises_not_found(
+    session: AsyncSession, monkeypatch: Any, storage: str
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", storage)
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    # test
+    with pytest.raises(NotFoundException):
+        await AvailableMatchService().reserve_available_matches(
+            session,
+            court_name,
+            business_public_id,
+            date(2025, 1, 1),
+            AvailableMatchesHours(initial_hour=12, n_matches=3),
+        )
+    # assert
+    assert await reserved_hours(session, court_name, business_public_id) == []
+
+
+@pytest.mark.parametrize("storage", ["rows", "bitmap"])
+async def test_overlapping_consecutive_reserves_never_share_an_hour(
+    session: AsyncSession, engine: AsyncEngine, monkeypatch: Any, storage: str
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", storage)
+    monkeypatch.setattr(settings, "AVAILABILITY_TEMPLATES_LAZY", False)
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session, initial_hour=8, n_matches=10
+    )
+    service = AvailableMatchService()
+
+    async def reserve(initial_hour: int) -> list[int]:
+        async with AsyncSession(engine, expire_on_commit=False) as other_session:
+            try:
+                available_matches = await service.reserve_available_matches(
+                    other_session,
+                    court_name,
+                    business_public_id,
+                    date(2025, 1, 1),
+                    AvailableMatchesHours(initial_hour=initial_hour, n_matches=2),
+                )
+            except CourtAlreadyReservedException:
+                return []
+            return [match.initial_hour for match in available_matches]
+
+    # test
+    results = await asyncio.gather(
+        *(reserve(initial_hour) for initial_hour in [8, 9, 10, 11, 12, 13, 14] * 3)
+    )
+    # assert
+    won_hours = sorted(hour for hours in results for hour in hours)
+    assert won_hours
+    assert len(won_hours) == len(set(won_hours))
+    assert all(len(hours) in (0, 2) for hours in results)
+    assert await reserved_hours(session, court_name, business_public_id) == won_hours
+
+
+@pytest.fixture
+def rows_storage(monkeypatch: Any) -> None:
+    """Holds are only supported by the rows storage."""
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", "rows")
+
+
+async def hold(
+    session: AsyncSession,
+    court_name: str,
+    business_public_id: uuid.UUID,
+    initial_hour: int,
+    n_matches: int = 1,
+    hold_id: uuid.UUID | None = None,
+) -> list[AvailableMatch]:
+    return await AvailableMatchService().hold_available_matches(
+        session,
+        court_name,
+        business_public_id,
+        date(2025, 1, 1),
+        AvailableMatchesHours(initial_hour=initial_hour, n_matches=n_matches),
+        hold_id,
+    )
+
+
+@pytest.mark.usefixtures("rows_storage")
+async def test_held_matches_can_only_be_reserved_with_their_hold_id(
+    session: AsyncSession,
+) -> None:
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    service = AvailableMatchService()
+    held = await hold(session, court_name, business_public_id, 9, 2)
+    hold_id = held[0].hold_id
+    held_ids = [match.hold_id for match in held]
+    # test
+    with pytest.raises(CourtAlreadyReservedException):
+        await service.reserve_available_match(
+            session, court_name, business_public_id, date(2025, 1, 1), 9
+        )
+    reserved = await service.reserve_available_matches(
+        session,
+        court_name,
+        business_public_id,
+        date(2025, 1, 1),
+        AvailableMatchesHours(initial_hour=9, n_matches=2),
+        hold_id,
+    )
+    # assert
+    assert hold_id is not None
+    assert held_ids == [hold_id, hold_id]
+    assert [(match.reserve, match.hold_id) for match in reserved] == [
+        (True, None),
+        (True, None),
+    ]
+
+
+@pytest.mark.usefixtures("rows_storage")
+async def test_hold_overlapping_another_hold_holds_none(
+    session: AsyncSession,
+) -> None:
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    await hold(session, court_name, business_public_id, 10)
+    # test
+    with pytest.raises(CourtAlreadyReservedException):
+        await hold(session, court_name, business_public_id, 9, 3)
+    # assert
+    available_matches = await AvailableMatchService().get_available_matches_in_date(
+        session, court_name, business_public_id, date(2025, 1, 1)
+    )
+    now = datetime.datetime.now(datetime.timezone.utc)
+    assert [
+        match.initial_hour for match in available_matches if match.is_held(now)
+    ] == [10]
+
+
+@pytest.mark.usefixtures("rows_storage")
+async def test_holding_again_with_the_hold_id_extends_it(
+    session: AsyncSession,
+) -> None:
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    held = await hold(session, court_name, business_public_id, 9)
+    hold_id = held[0].hold_id
+    expires_at = held[0].hold_expires_at
+    assert expires_at is not None
+    # test
+    held_again = await hold(session, court_name, business_public_id, 9, hold_id=hold_id)
+    # assert
+    assert held_again[0].hold_id == hold_id
+    assert held_again[0].hold_expires_at is not None
+    assert held_again[0].hold_expires_at >= expires_at
+
+
+@pytest.mark.usefixtures("rows_storage")
+async def test_expired_holds_are_free_before_the_sweeper_runs(
+    session: AsyncSession, monkeypatch: Any
+) -> None:
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    monkeypatch.setattr(settings, "AVAILABLE_MATCHES_HOLD_TTL", -60)
+    expired = await hold(session, court_name, business_public_id, 9)
+    repository = AvailableMatchesRepository(session)
+    # test
+    search = await repository.search_available_matches(
+        AvailableMatchesSearchFilter(date_from=date(2025, 1, 1))
+    )
+    public = AvailableMatchPublic.from_private(expired[0], (0.1, 0.4))
+    reserved = await AvailableMatchService().reserve_available_match(
+        session, court_name, business_public_id, date(2025, 1, 1), 9
+    )
+    # assert
+    assert 9 in [match.initial_hour for match, _, _ in search]
+    assert public.held is False
+    assert reserved.reserve is True
+
+
+@pytest.mark.usefixtures("rows_storage")
+async def test_search_skips_matches_on_active_hold(
+    session: AsyncSession,
+) -> None:
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    held = await hold(session, court_name, business_public_id, 9)
+    repository = AvailableMatchesRepository(session)
+    # test
+    search = await repository.search_available_matches(
+        AvailableMatchesSearchFilter(date_from=date(2025, 1, 1))
+    )
+    public = AvailableMatchPublic.from_private(held[0], (0.1, 0.4))
+    # assert
+    assert [match.initial_hour for match, _, _ in search] == [8, 10, 11, 12, 13]
+    assert public.held is True
+
+
+@pytest.mark.usefixtures("rows_storage")
+async def test_free_matches_in_range_skip_matches_on_active_hold(
+    session: AsyncSession,
+) -> None:
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    await hold(session, court_name, business_public_id, 9)
+    # test
+    free_matches = await AvailableMatchService().get_available_matches_in_range(
+        session,
+        court_name,
+        business_public_id,
+        AvailableMatchesRangeFilter(date_from=date(2025, 1, 1), reserve=False),
+    )
+    # assert
+    assert [match.initial_hour for match in free_matches] == [8, 10, 11, 12, 13]
+
+
+@pytest.mark.usefixtures("rows_storage")
+async def test_release_hold_frees_its_matches(
+    session: AsyncSession,
+) -> None:
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    service = AvailableMatchService()
+    held = await hold(session, court_name, business_public_id, 9, 2)
+    hold_id = held[0].hold_id
+    assert hold_id is not None
+    # test
+    await service.release_hold(
+        session, court_name, business_public_id, date(2025, 1, 1), hold_id
+    )
+    # assert
+    held_again = await hold(session, court_name, business_public_id, 9, 2)
+    assert [match.hold_id != hold_id for match in held_again] == [True, True]
+
+
+@pytest.mark.usefixtures("rows_storage")
+async def test_sweeper_releases_expired_holds_in_batches(
+    session: AsyncSession, monkeypatch: Any
+) -> None:
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    monkeypatch.setattr(settings, "AVAILABLE_MATCHES_HOLDS_SWEEP_BATCH", 2)
+    monkeypatch.setattr(settings, "AVAILABLE_MATCHES_HOLD_TTL", -60)
+    await hold(session, court_name, business_public_id, 8, 5)
+    monkeypatch.setattr(settings, "AVAILABLE_MATCHES_HOLD_TTL", 300)
+    await hold(session, court_name, business_public_id, 13)
+    repository = AvailableMatchesRepository(session)
+    batches = []
+    release_expired_holds = AvailableMatchesRepository.release_expired_holds
+
+    async def record_batch(self: Any, batch_size: int) -> list[AvailableMatch]:
+        released = await release_expired_holds(self, batch_size)
+        batches.append(len(released))
+        return released
+
+    monkeypatch.setattr(
+        AvailableMatchesRepository, "release_expired_holds", record_batch
+    )
+    # test
+    n_released = await AvailableMatchService().release_expired_holds(session)
+    # assert
+    assert n_released == 5
+    assert batches == [2, 2, 1]
+    available_matches = await repository.get_available_matches_in_date(
+        court_name, business_public_id, date(2025, 1, 1)
+    )
+    assert sorted(
+        match.initial_hour for match in available_matches if match.hold_id
+    ) == [13]
+
+
+async def test_holds_need_the_rows_storage(
+    session: AsyncSession, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", "bitmap")
+    business_public_id, court_name = await create_matches_for_consecutive_reserve(
+        session
+    )
+    # test
+    with pytest.raises(NotAcceptableException):
+        await hold(session, court_name, business_public_id, 9)
@@ -0,0 +1,283 @@
+import asyncio
+import datetime
+import json
+import uuid
+from typing import Any
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.models.available_match import AvailableMatchCreate
+from app.models.available_match_bulk import (
+    AvailableMatchesBulkCreate,
+    AvailableMatchesBulkHours,
+    AvailableMatchesBulkJobStatus,
+)
+from app.models.business import Business
+from app.models.padel_court import PadelCourt
+from app.repository.availability_days_repository import AvailabilityDaysRepository
+from app.repository.available_matches_repository import AvailableMatchesRepository
+from app.services.availability_event_service import AvailabilityEventService
+from app.services.available_match_bulk_service import (
+    BULK_JOB_FAILED,
+    AvailableMatchBulkService,
+)
+from app.services.available_match_service import AvailableMatchService
+from app.tests.utils.utils import count_queries, create_business_and_padel_court
+from app.utilities.exceptions import NotFoundException, UnauthorizedUserException
+
+MONDAY = datetime.date(2025, 3, 3)
+
+
+async def create_business_with_courts(
+    session: AsyncSession, owner_id: uuid.UUID, n_courts: int
+) -> tuple[Business, list[PadelCourt]]:
+    business, padel_court = await create_business_and_padel_court(
+        session, owner_id, court_name="Cancha 0"
+    )
+    courts = [padel_court]
+    for number in range(1, n_courts):
+        court = PadelCourt(
+            name=f"Cancha {number}",
+            price_per_hour="15000.00",
+            business_public_id=business.business_public_id,
+        )
+        session.add(court)
+        courts.append(court)
+    await session.commit()
+    return business, courts
+
+
+def bulk_create(**kwargs: Any) -> AvailableMatchesBulkCreate:
+    data = {
+        "date_from": MONDAY,
+        "date_to": MONDAY + datetime.timedelta(days=13),
+        "hours": [AvailableMatchesBulkHours(initial_hour=18, n_matches=3)],
+        **kwargs,
+    }
+    return AvailableMatchesBulkCreate(**data)
+
+
+@pytest.mark.parametrize("storage", ["rows", "bitmap"])
+async def test_bulk_creates_every_court_date_and_hour(
+    session: AsyncSession, monkeypatch: Any, storage: str
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", storage)
+    monkeypatch.setattr(settings, "AVAILABILITY_TEMPLATES_LAZY", False)
+    owner_id = uuid.uuid4()
+    business, courts = await create_business_with_courts(session, owner_id, 3)
+    bulk_in = bulk_create(
+        weekdays=[0, 2],
+        hours=[
+            AvailableMatchesBulkHours(initial_hour=8, n_matches=2),
+            AvailableMatchesBulkHours(initial_hour=18, n_matches=1),
+        ],
+    )
+    # test
+    with count_queries(session) as statements:
+        job = await AvailableMatchBulkService().create_available_matches_bulk(
+            session, owner_id, business.business_public_id, bulk_in, BackgroundTasks()
+        )
+    # assert
+    assert job.status == AvailableMatchesBulkJobStatus.DONE
+    assert job.total_days == job.done_days == 3 * 4
+    # Ownership, job insert, one insert of every day and the job update; the
+    # bitmap storage first locks the existing days to know the hours they add
+    assert len(statements) == (4 if storage == "rows" else 5)
+    service = AvailableMatchService()
+    for court in courts:
+        for day in range(14):
+            date = MONDAY + datetime.timedelta(days=day)
+            available_matches = await service.get_available_matches_in_date(
+                session, court.name, business.business_public_id, date
+            )
+            expected = [8, 9, 18] if date.weekday() in (0, 2) else []
+            assert sorted(match.initial_hour for match in available_matches) == (
+                expected
+            )
+
+
+@pytest.mark.parametrize("storage", ["rows", "bitmap"])
+async def test_bulk_skips_existing_hours_and_keeps_reservations(
+    session: AsyncSession, monkeypatch: Any, storage: str
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", storage)
+    monkeypatch.setattr(settings, "AVAILABILITY_TEMPLATES_LAZY", False)
+    owner_id = uuid.uuid4()
+    business, courts = await create_business_with_courts(session, owner_id, 1)
+    service = AvailableMatchService()
+    await service.create_available_matches_in_date(
+        session,
+        owner_id,
+        courts[0].name,
+        business.business_public_id,
+        AvailableMatchCreate(
+            court_name=courts[0].name,
+            court_public_id=courts[0].court_public_id,
+            business_public_id=business.business_public_id,
+            date=MONDAY,
+            initial_hour=19,
+            n_matches=2,
+        ),
+    )
+    await service.reserve_available_match(
+        session, courts[0].name, business.business_public_id, MONDAY, 19
+    )
+    stream = AvailabilityEventService().stream(business.business_public_id)
+    await anext(stream)
+    # test
+    await AvailableMatchBulkService().create_available_matches_bulk(
+        session,
+        owner_id,
+        business.business_public_id,
+        bulk_create(date_to=MONDAY),
+        BackgroundTasks(),
+    )
+    message = await asyncio.wait_for(anext(stream), 5)
+    await stream.aclose()
+    # assert
+    event = json.loads(message.split("data: ")[1])
+    assert (event["type"], event["hours"]) == ("created", [18])
+    available_matches = await service.get_available_matches_in_date(
+        session, courts[0].name, business.business_public_id, MONDAY
+    )
+    assert [
+        (match.initial_hour, match.reserve)
+        for match in sorted(available_matches, key=lambda match: match.initial_hour)
+    ] == [(18, False), (19, True), (20, False)]
+
+
+async def test_bulk_of_other_owner_raises_unauthorized(
+    session: AsyncSession,
+) -> None:
+    business, _ = await create_business_with_courts(session, uuid.uuid4(), 2)
+    # test
+    with pytest.raises(UnauthorizedUserException):
+        await AvailableMatchBulkService().create_available_matches_bulk(
+            session,
+            uuid.uuid4(),
+            business.business_public_id,
+            bulk_create(),
+            BackgroundTasks(),
+        )
+
+
+async def test_bulk_with_unknown_court_raises_not_found(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, _ = await create_business_with_courts(session, owner_id, 2)
+    # test
+    with pytest.raises(NotFoundException):
+        await AvailableMatchBulkService().create_available_matches_bulk(
+            session,
+            owner_id,
+            business.business_public_id,
+            bulk_create(court_names=["Cancha 0", "Cancha 9"]),
+            BackgroundTasks(),
+        )
+
+
+async def test_large_bulk_runs_in_background_in_batches(
+    session: AsyncSession, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", "rows")
+    monkeypatch.setattr(settings, "AVAILABLE_MATCHES_BULK_SYNC_MAX_DAYS", 10)
+    monkeypatch.setattr(settings, "AVAILABLE_MATCHES_BULK_BATCH_DAYS", 4)
+    owner_id = uuid.uuid4()
+    business, courts = await create_business_with_courts(session, owner_id, 2)
+    background_tasks = BackgroundTasks()
+    service = AvailableMatchBulkService()
+    add_available_days = AvailableMatchesRepository.add_available_days
+    progress = []
+
+    async def record_progress(self: Any, available_days: Any) -> Any:
+        progress.append(len(available_days))
+        return await add_available_days(self, available_days)
+
+    monkeypatch.setattr(
+        AvailableMatchesRepository, "add_available_days", record_progress
+    )
+    # test
+    job = await service.create_available_matches_bulk(
+        session,
+        owner_id,
+        business.business_public_id,
+        bulk_create(court_names=[courts[1].name]),
+        background_tasks,
+    )
+    pending_status = job.status
+    await background_tasks()
+    done = await service.get_job(
+        session, business.business_public_id, job.job_public_id
+    )
+    # assert
+    assert pending_status == AvailableMatchesBulkJobStatus.PENDING
+    assert progress == [4, 4, 4, 2]
+    assert done.status == AvailableMatchesBulkJobStatus.DONE
+    assert done.total_days == done.done_days == 14
+    available_matches = await AvailableMatchService().get_available_matches_in_date(
+        session,
+        courts[1].name,
+        business.business_public_id,
+        MONDAY + datetime.timedelta(days=13),
+    )
+    assert len(available_matches) == 3
+
+
+async def test_failed_batch_marks_the_job_failed_keeping_the_previous_ones(
+    session: AsyncSession, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(settings, "AVAILABILITY_STORAGE", "bitmap")
+    monkeypatch.setattr(settings, "AVAILABLE_MATCHES_BULK_BATCH_DAYS", 5)
+    owner_id = uuid.uuid4()
+    business, _ = await create_business_with_courts(session, owner_id, 1)
+    add_available_days = AvailabilityDaysRepository.add_available_days
+    calls = []
+
+    async def fail_second_batch(self: Any, available_days: Any) -> Any:
+        calls.append(len(available_days))
+        if len(calls) == 2:
+            raise RuntimeError("batch failed")
+        return await add_available_days(self, available_days)
+
+    monkeypatch.setattr(
+        AvailabilityDaysRepository, "add_available_days", fail_second_batch
+    )
+    # test
+    job = await AvailableMatchBulkService().create_available_matches_bulk(
+        session,
+        owner_id,
+        business.business_public_id,
+        bulk_create(),
+        BackgroundTasks(),
+    )
+    # assert
+    assert job.status == AvailableMatchesBulkJobStatus.FAILED
+    assert job.done_days == 5
+    assert job.error == BULK_JOB_FAILED
+
+
+async def test_failed_event_publication_marks_the_job_failed(
+    session: AsyncSession, monkeypatch: Any
+) -> None:
+    owner_id = uuid.uuid4()
+    business, _ = await create_business_with_courts(session, owner_id, 1)
+
+    async def fail_publish(*_args: Any) -> None:
+        raise RuntimeError("broker unavailable")
+
+    monkeypatch.setattr(AvailabilityEventService, "publish_days", fail_publish)
+    # test
+    job = await AvailableMatchBulkService().create_available_matches_bulk(
+        session,
+        owner_id,
+        business.business_public_id,
+        bulk_create(),
+        BackgroundTasks(),
+    )
+    # assert
+    assert job.status == AvailableMatchesBulkJobStatus.FAILED
+    assert job.error == BULK_JOB_FAILED
@@ -0,0 +1,51 @@
+import httpx
+
+from app.services import base_service
+from app.services.base_service import (
+    BaseService,
+    close_http_clients,
+    get_http_client,
+)
+
+
+async def test_get_http_client_is_shared_per_host() -> None:
+    # test
+    client = get_http_client("https://example.com")
+    # assert
+    assert get_http_client("https://example.com") is client
+    assert get_http_client("https://other.example.com") is not client
+    await close_http_clients()
+
+
+async def test_close_http_clients_closes_every_client() -> None:
+    client = get_http_client("https://example.com")
+    # test
+    await close_http_clients()
+    # assert
+    assert client.is_closed
+    assert get_http_client("https://example.com") is not client
+    await close_http_clients()
+
+
+async def test_requests_reuse_shared_client() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    service = BaseService()
+    service._set_base_url("example.com")
+    base_service._http_clients[service.base_url] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    # test
+    first = await service.get("/first")
+    second = await service.post("/second", json={"data": 1})
+    # assert
+    assert first == second == {"ok": True}
+    assert [str(request.url) for request in requests] == [
+        "https://example.com/first",
+        "https://example.com/second",
+    ]
+    await close_http_clients()
@@ -39,7 +39,7 @@ async def test_get_businesses_all(session: AsyncSession) -> None:
         service = BusinessService()
         result = await service.get_businesses(session)
 
-        mock_get.assert_called_once_with(0, 100)
+        mock_get.assert_called_once_with(0, 100, cursor=None, count_mode=None)
         assert result.count == 2
         assert len(result.data) == 2
         assert result.data[0].name == "Service Test 1"
@@ -80,7 +80,9 @@ async def test_get_businesses_with_owner_filter(session: AsyncSession) -> None:
         business_filter = BusinessesFilters(owner_id=owner_id)
         result = await service.get_businesses(session, business_filter=business_filter)
 
-        mock_get.assert_called_once_with(0, 100, owner_id=owner_id)
+        mock_get.assert_called_once_with(
+            0, 100, cursor=None, count_mode=None, owner_id=owner_id
+        )
         assert result.count == 2
         assert all(b.owner_id == owner_id for b in result.data)
 
@@ -115,6 +117,34 @@ async def test_get_businesses_with_pagination(session: AsyncSession) -> None:
         service = BusinessService()
         result = await service.get_businesses(session, skip=0, limit=2)
 
-        mock_get.assert_called_once_with(0, 2)
+        mock_get.assert_called_once_with(0, 2, cursor=None, count_mode=None)
         assert result.count == 5
         assert len(result.data) == 2
+
+
+async def test_get_business_is_fetched_once_per_session(session: AsyncSession) -> None:
+    business = Business(
+        business_public_id=uuid.uuid4(),
+        name="Cached Business",
+        location="Location",
+        owner_id=uuid.uuid4(),
+        latitude=0.1,
+        longitude=0.4,
+    )
+
+    with patch(
+        "app.repository.business_repository.BusinessRepository.get_business"
+    ) as mock_get:
+        mock_get.return_value = business
+
+        service = BusinessService()
+        first = await service.get_business(session, business.business_public_id)
+        await service.validate_user_is_owner(
+            session, business.business_public_id, business.owner_id
+        )
+        second = await BusinessService().get_business(
+            session, business.business_public_id
+        )
+
+        mock_get.assert_called_once_with(business.business_public_id)
+        assert first is second is business
@@ -10,6 +10,7 @@ from app.repository.business_repository import BusinessRepository
 from app.services.court_owner_verification_service import (
     CourtOwnerVerificationService,
 )
+from app.tests.utils.utils import count_queries, create_business_and_padel_court
 from app.utilities.exceptions import (
     BusinessNotFoundHTTPException,
     NotFoundException,
@@ -111,3 +112,35 @@ async def test_verification_fail_not_court_of_court_owner_service(
         )
     # assert
     assert e.value.detail == "No se encontró Cancha"
+
+
+async def test_verification_of_court_owner_runs_one_query(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, court = await create_business_and_padel_court(session, owner_id)
+    service = CourtOwnerVerificationService()
+    # test
+    with count_queries(session) as queries:
+        await service.verification_of_court_owner(
+            session, owner_id, court.name, business.business_public_id
+        )
+    # assert
+    assert len(queries) == 1
+
+
+async def test_verification_without_name_fail_court_of_other_business(
+    session: AsyncSession,
+) -> None:
+    owner_id = uuid.uuid4()
+    business, _ = await create_business_and_padel_court(session, owner_id)
+    _, other_court = await create_business_and_padel_court(session, uuid.uuid4())
+    service = CourtOwnerVerificationService()
+    # test
+    with pytest.raises(NotFoundException):
+        await service.verification_of_court_owner_without_name(
+            session,
+            owner_id,
+            business.business_public_id,
+            other_court.court_public_id,
+        )
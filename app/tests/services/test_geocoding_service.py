@@ -0,0 +1,78 @@
+from typing import Any
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.services.geocoding_service import (
+    GeocodingService,
+    geocoding_cache,
+    normalize_address,
+)
+from app.services.google_service import GoogleService
+from app.utilities.exceptions import ExternalServiceInvalidLocalizationException
+
+
+def mock_google(monkeypatch: Any, result: tuple[float, float] | None) -> list[str]:
+    calls = []
+
+    async def mock_get_coordinates(_self: Any, address: str) -> tuple[float, float]:
+        calls.append(address)
+        if result is None:
+            raise ExternalServiceInvalidLocalizationException(
+                service_name="google-address"
+            )
+        return result
+
+    monkeypatch.setattr(GoogleService, "get_coordinates", mock_get_coordinates)
+    return calls
+
+
+async def test_normalize_address() -> None:
+    # assert
+    assert normalize_address("  Av. Belgrano   3450 ") == "av belgrano 3450"
+    assert normalize_address("AV BELGRANO, 3450") == "av belgrano 3450"
+    assert normalize_address("Av. Córdoba 1200") == "av cordoba 1200"
+
+
+async def test_get_coordinates_calls_google_once_for_same_address(
+    session: AsyncSession, monkeypatch: Any
+) -> None:
+    calls = mock_google(monkeypatch, (0.4, 0.3))
+    service = GeocodingService()
+    # test
+    first = await service.get_coordinates(session, "Av. Belgrano 3450")
+    second = await service.get_coordinates(session, "av belgrano, 3450")
+    # assert
+    assert first == second == (0.4, 0.3)
+    assert len(calls) == 1
+    assert service.get_stats()["memory_hits"] == 1
+    assert service.get_stats()["misses"] == 1
+
+
+async def test_get_coordinates_uses_persistent_cache(
+    session: AsyncSession, monkeypatch: Any
+) -> None:
+    calls = mock_google(monkeypatch, (0.4, 0.3))
+    service = GeocodingService()
+    await service.get_coordinates(session, "Av. Belgrano 3450")
+    geocoding_cache.clear()
+    # test
+    coordinates = await service.get_coordinates(session, "Av. Belgrano 3450")
+    # assert
+    assert coordinates == (0.4, 0.3)
+    assert len(calls) == 1
+    assert service.get_stats()["persistent_hits"] == 1
+
+
+async def test_get_coordinates_caches_invalid_address(
+    session: AsyncSession, monkeypatch: Any
+) -> None:
+    calls = mock_google(monkeypatch, None)
+    service = GeocodingService()
+    with pytest.raises(ExternalServiceInvalidLocalizationException):
+        await service.get_coordinates(session, "Invalid 0")
+    # test
+    with pytest.raises(ExternalServiceInvalidLocalizationException):
+        await service.get_coordinates(session, "Invalid 0")
+    # assert
+    assert len(calls) == 1
@@ -36,7 +36,9 @@ async def test_get_padel_courts_all(session: AsyncSession) -> None:
         service = PadelCourtService()
         result = await service.get_padel_courts(session)
 
-        mock_get.assert_called_once_with(None, None, 0, 100)
+        mock_get.assert_called_once_with(
+            None, None, 0, 100, cursor=None, count_mode=None
+        )
         assert result.count == 2
         assert len(result.data) == 2
         assert result.data[0].name == "Service Court X"
@@ -74,7 +76,9 @@ async def test_get_padel_courts_with_business_filter(session: AsyncSession) -> N
         court_filters = PadelCourtFilter(business_public_id=business_public_id)
         result = await service.get_padel_courts(session, court_filters=court_filters)
 
-        mock_get.assert_called_once_with(business_public_id, None, 0, 100)
+        mock_get.assert_called_once_with(
+            business_public_id, None, 0, 100, cursor=None, count_mode=None
+        )
         assert result.count == 2
         assert all(c.business_public_id == business_public_id for c in result.data)
 
@@ -105,7 +109,7 @@ async def test_get_padel_courts_with_pagination(session: AsyncSession) -> None:
         service = PadelCourtService()
         result = await service.get_padel_courts(session, skip=0, limit=2)
 
-        mock_get.assert_called_once_with(None, None, 0, 2)
+        mock_get.assert_called_once_with(None, None, 0, 2, cursor=None, count_mode=None)
         assert result.count == 5
         assert len(result.data) == 2
 
@@ -146,6 +150,34 @@ async def test_get_padel_courts_with_business_and_user_filter(
             session, court_filters=court_filters, user_id=user_id
         )
 
-        mock_get.assert_called_once_with(business_public_id, user_id, 0, 100)
+        mock_get.assert_called_once_with(
+            business_public_id, user_id, 0, 100, cursor=None, count_mode=None
+        )
         assert result.count == 2
         assert all(c.business_public_id == business_public_id for c in result.data)
+
+
+async def test_get_padel_court_is_fetched_once_per_session(
+    session: AsyncSession,
+) -> None:
+    court = PadelCourt(
+        name="Cached Court",
+        business_public_id=uuid.uuid4(),
+        price_per_hour=Decimal("100"),
+    )
+
+    with patch(
+        "app.repository.padel_court_repository.PadelCourtRepository.get_padel_court"
+    ) as mock_get:
+        mock_get.return_value = court
+
+        service = PadelCourtService()
+        first = await service.get_padel_court(
+            session, court.name, court.business_public_id
+        )
+        second = await service.get_padel_court(
+            session, court.name, court.business_public_id
+        )
+
+        mock_get.assert_called_once_with(court.name, court.business_public_id)
+        assert first is second is court
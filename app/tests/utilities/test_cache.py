@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.utilities import cache
+from app.utilities.cache import TTLCache
+
+
+async def test_get_returns_value_and_counts_hits() -> None:
+    ttl_cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    ttl_cache.set("a", 1)
+    # assert
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.hits == 1
+    assert ttl_cache.misses == 1
+
+
+async def test_set_evicts_least_recently_used() -> None:
+    ttl_cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    # test
+    ttl_cache.set("c", 3)
+    # assert
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("c") == 3
+
+
+async def test_get_expired_entry_returns_none(monkeypatch: Any) -> None:
+    now = 1000.0
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: now))
+    ttl_cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2, ttl=120)
+    # test
+    now = 1061.0
+    # assert
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+    assert len(ttl_cache) == 1
+
+
+async def test_memory_backend_set_get_and_delete() -> None:
+    backend = cache.MemoryCacheBackend(max_size=10, ttl=60)
+    await backend.set("a", b"1", ttl=60)
+    await backend.set("b", b"2", ttl=60)
+    # test
+    await backend.delete("a", "missing")
+    # assert
+    assert await backend.get("a") is None
+    assert await backend.get("b") == b"2"
+
+
+async def test_redis_backend_without_redis_package_raise_error(
+    monkeypatch: Any,
+) -> None:
+    monkeypatch.setattr(cache, "REDIS_AVAILABLE", False)
+    # test
+    with pytest.raises(RuntimeError):
+        cache.RedisCacheBackend("redis://localhost:6379/0")
@@ -0,0 +1,49 @@
+import datetime
+import uuid
+
+import pytest
+
+from app.utilities.cursor import (
+    decode_cursor,
+    decode_int_id_cursor,
+    decode_uuid_id_cursor,
+    encode_cursor,
+    encode_id_cursor,
+)
+from app.utilities.exceptions import NotAcceptableException
+
+
+async def test_decode_cursor_returns_encoded_values() -> None:
+    cursor = encode_cursor([datetime.date(2025, 1, 1), 5, 10])
+    # test
+    values = decode_cursor(cursor, 3)
+    # assert
+    assert values == ["2025-01-01", 5, 10]
+
+
+async def test_decode_invalid_cursor_raise_not_acceptable() -> None:
+    # test
+    with pytest.raises(NotAcceptableException):
+        decode_cursor("not a cursor", 3)
+
+
+async def test_decode_cursor_with_other_length_raise_not_acceptable() -> None:
+    cursor = encode_cursor([1, 2])
+    # test
+    with pytest.raises(NotAcceptableException):
+        decode_cursor(cursor, 3)
+
+
+async def test_decode_id_cursors_return_encoded_id() -> None:
+    id = uuid.uuid4()
+    # assert
+    assert decode_int_id_cursor(encode_id_cursor(7)) == 7
+    assert decode_uuid_id_cursor(encode_id_cursor(id)) == id
+
+
+async def test_decode_id_cursor_with_other_type_raise_not_acceptable() -> None:
+    # test
+    with pytest.raises(NotAcceptableException):
+        decode_int_id_cursor(encode_id_cursor("7"))
+    with pytest.raises(NotAcceptableException):
+        decode_uuid_id_cursor(encode_id_cursor(7))
@@ -0,0 +1,72 @@
+import asyncio
+
+import asyncpg  # type: ignore[import-untyped]
+
+from app.core.config import test_settings
+from app.utilities.events import EventBroker, LocalEventBackend, PostgresEventBackend
+
+
+async def test_local_broker_delivers_to_every_subscriber() -> None:
+    broker = EventBroker(LocalEventBackend())
+    async with broker.subscribe() as first, broker.subscribe() as second:
+        # test
+        await broker.publish("event")
+        # assert
+        assert first.get_nowait() == "event"
+        assert second.get_nowait() == "event"
+    assert broker.subscribers_count == 0
+
+
+async def test_full_subscriber_queue_drops_the_oldest_event() -> None:
+    broker = EventBroker(LocalEventBackend(), max_queue_size=2)
+    async with broker.subscribe() as queue:
+        # test
+        for payload in ("1", "2", "3"):
+            await broker.publish(payload)
+        # assert
+        assert [queue.get_nowait(), queue.get_nowait()] == ["2", "3"]
+
+
+async def test_postgres_backend_delivers_to_the_brokers_of_every_worker() -> None:
+    dsn = str(test_settings.SQLALCHEMY_DATABASE_URI).replace(
+        "postgresql+asyncpg://", "postgresql://", 1
+    )
+    worker_1 = EventBroker(PostgresEventBackend(dsn, channel="test_events"))
+    worker_2 = EventBroker(PostgresEventBackend(dsn, channel="test_events"))
+    try:
+        async with worker_1.subscribe() as queue_1, worker_2.subscribe() as queue_2:
+            # test
+            await worker_1.publish("event")
+            # assert
+            assert await asyncio.wait_for(queue_1.get(), 5) == "event"
+            assert await asyncio.wait_for(queue_2.get(), 5) == "event"
+    finally:
+        await worker_1.close()
+        await worker_2.close()
+
+
+async def test_postgres_backend_listens_again_after_losing_the_connection() -> None:
+    dsn = str(test_settings.SQLALCHEMY_DATABASE_URI).replace(
+        "postgresql+asyncpg://", "postgresql://", 1
+    )
+    backend = PostgresEventBackend(dsn, channel="test_events_reconnect")
+    worker = EventBroker(backend)
+    admin = await asyncpg.connect(dsn)
+    try:
+        async with worker.subscribe() as queue:
+            lost_connection = backend.connection
+            # test
+            await admin.execute(
+                "SELECT pg_terminate_backend($1)", lost_connection.get_server_pid()
+            )
+            for _ in range(50):
+                if backend.connection not in (None, lost_connection):
+                    break
+                await asyncio.sleep(0.1)
+            await admin.execute("SELECT pg_notify('test_events_reconnect', 'event')")
+            # assert
+            assert backend.connection is not lost_connection
+            assert await asyncio.wait_for(queue.get(), 5) == "event"
+    finally:
+        await admin.close()
+        await worker.close()
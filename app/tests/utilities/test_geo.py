@@ -0,0 +1,21 @@
+import math
+
+from app.utilities.geo import KM_PER_DEGREE_OF_LATITUDE, get_bounding_box
+
+
+async def test_bounding_box_contains_radius() -> None:
+    latitude, longitude = -34.6037, -58.3816
+    # test
+    min_lat, max_lat, min_lng, max_lng = get_bounding_box(latitude, longitude, 10)
+    # assert
+    assert math.isclose(max_lat - latitude, 10 / KM_PER_DEGREE_OF_LATITUDE)
+    assert math.isclose(latitude - min_lat, 10 / KM_PER_DEGREE_OF_LATITUDE)
+    assert max_lng - longitude > max_lat - latitude
+    assert math.isclose(longitude - min_lng, max_lng - longitude)
+
+
+async def test_bounding_box_near_pole_covers_every_longitude() -> None:
+    # test
+    bounding_box = get_bounding_box(89.99, 0, 10)
+    # assert
+    assert bounding_box[2:] == (-180.0, 180.0)
@@ -0,0 +1,20 @@
+from app.utilities.http_cache import compute_etag, etag_matches
+
+
+async def test_compute_etag_is_quoted_and_depends_on_the_body() -> None:
+    # test
+    etag = compute_etag(b'{"data": []}')
+    # assert
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == compute_etag(b'{"data": []}')
+    assert etag != compute_etag(b'{"data": [1]}')
+
+
+async def test_etag_matches_lists_weak_tags_and_wildcard() -> None:
+    etag = '"abc"'
+    # assert
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"x", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"abcd"', etag)
+    assert not etag_matches(None, etag)
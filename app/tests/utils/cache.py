@@ -0,0 +1,29 @@
+from app.utilities.cache import TTLCache
+
+
+class FakeSharedCacheBackend:
+    """In-memory stand-in for a shared backend such as Redis.
+
+    Every backend built over the same store sees the same entries, like the
+    uvicorn workers of a deployment do with a shared server.
+    """
+
+    def __init__(self, store: TTLCache[str, bytes]) -> None:
+        self.store = store
+        self.closed = False
+
+    async def get(self, key: str) -> bytes | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.store.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.delete(key)
+
+    async def clear(self) -> None:
+        self.store.clear()
+
+    async def close(self) -> None:
+        self.closed = True
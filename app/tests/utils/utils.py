@@ -1,18 +1,53 @@
+import os
 import random
 import string
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
+import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.models.business import Business, BusinessCreate
+from app.models.padel_court import PadelCourt, PadelCourtCreate
+from app.repository.business_repository import BusinessRepository
 from app.services.google_service import GoogleService
 
+# Timing comparisons are too noisy for shared CI, run them with RUN_BENCHMARKS=1
+benchmark = pytest.mark.skipif(
+    not os.getenv("RUN_BENCHMARKS"), reason="benchmark, set RUN_BENCHMARKS=1"
+)
+
 
 def random_lower_string() -> str:
     return "".join(random.choices(string.ascii_lowercase, k=32))
 
 
+@contextmanager
+def count_queries(
+    session: AsyncSession, with_parameters: bool = False
+) -> Iterator[list[Any]]:
+    """Collect every SQL statement sent to the database inside the block.
+
+    With with_parameters each one is collected as a (statement, parameters) tuple.
+    """
+    statements: list[Any] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append((args[2], args[3]) if with_parameters else args[2])
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
 def get_x_api_key_header() -> dict[str, str]:
     headers = {"x-api-key": f"{settings.API_KEY}"}
     return headers
@@ -25,7 +60,7 @@ async def create_business_for_routes(
     location: str,
     parameters: dict[str, str | int | uuid.UUID],
     monkeypatch: Any,
-) -> dict[str, str]:
+) -> dict[str, Any]:
     GET_COORDS_RESULT = (0.4, 0.3)
 
     async def mock_get_coordinates(_self: Any, _: str) -> tuple[float, float]:
@@ -63,3 +98,24 @@ async def create_padel_court_for_routes(
         },
     )
     return dict(response.json())
+
+
+async def create_business_and_padel_court(
+    session: AsyncSession,
+    owner_id: uuid.UUID,
+    court_name: str = "Padel Si",
+    coordinates: tuple[float, float] = (0.1, 0.4),
+) -> tuple[Business, PadelCourt]:
+    """Create a business and one of its courts straight through the session."""
+    business_in = BusinessCreate(name="Padel Ya", location="Av La plata 210")
+    business = await BusinessRepository(session).create_business(
+        owner_id, business_in, *coordinates
+    )
+    padel_court_in = PadelCourtCreate(name=court_name, price_per_hour="15000.00")
+    padel_court = PadelCourt.model_validate(
+        padel_court_in, update={"business_public_id": business.business_public_id}
+    )
+    session.add(padel_court)
+    await session.commit()
+    await session.refresh(padel_court)
+    return business, padel_court
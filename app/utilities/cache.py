@@ -0,0 +1,124 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from importlib.util import find_spec
+from typing import Any, Generic, Protocol, TypeVar
+
+REDIS_AVAILABLE = find_spec("redis") is not None
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """In-process LRU cache whose entries expire after a time to live."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CacheBackend(Protocol):
+    """Key/value store of serialized values with a time to live, in seconds."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+    async def clear(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """Backend local to the process: each worker has its own entries."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.entries: TTLCache[str, bytes] = TTLCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, key: str) -> bytes | None:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.entries.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.entries.delete(key)
+
+    async def clear(self) -> None:
+        self.entries.clear()
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisCacheBackend:
+    """Backend shared by every worker, so they all see the invalidations.
+
+    Needs the optional redis package. Size is bounded by the maxmemory policy
+    of the Redis server.
+    """
+
+    def __init__(self, url: str, prefix: str = "business-service:") -> None:
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("The redis cache backend needs the redis package")
+        import redis.asyncio as redis
+
+        self.client: Any = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        value: bytes | None = await self.client.get(self.prefix + key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(self.prefix + key, value, px=int(ttl * 1000))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=self.prefix + "*"):
+            await self.client.delete(key)
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,45 @@
+import base64
+import binascii
+import json
+import uuid
+from typing import Any
+
+from app.utilities.exceptions import NotAcceptableException
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    payload = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, n_values: int) -> list[Any]:
+    """Decode a cursor made by encode_cursor, checking it holds n_values values."""
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise NotAcceptableException("cursor inválido")
+    if not isinstance(values, list) or len(values) != n_values:
+        raise NotAcceptableException("cursor inválido")
+    return values
+
+
+def encode_id_cursor(id: Any) -> str:
+    """Cursor of a page sorted by id, pointing after the row with that id."""
+    return encode_cursor([id])
+
+
+def decode_int_id_cursor(cursor: str) -> int:
+    (id,) = decode_cursor(cursor, 1)
+    if not isinstance(id, int) or isinstance(id, bool):
+        raise NotAcceptableException("cursor inválido")
+    return id
+
+
+def decode_uuid_id_cursor(cursor: str) -> uuid.UUID:
+    (id,) = decode_cursor(cursor, 1)
+    try:
+        return uuid.UUID(str(id))
+    except ValueError:
+        raise NotAcceptableException("cursor inválido")
@@ -3,11 +3,10 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, Header, Query
-from sqlalchemy.orm import sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
-from app.core.db import get_async_engine
+from app.core.db import get_session_maker
 from app.utilities.exceptions import (
     NotAuthorizedException,
     NotEnoughPermissionsException,
@@ -33,12 +32,7 @@ async def get_business_public_id_param(
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None, None]:
-    async_session = sessionmaker(
-        bind=get_async_engine(),
-        class_=AsyncSession,
-        expire_on_commit=False,  # type: ignore[call-overload]
-    )
-    async with async_session() as session:
+    async with get_session_maker()() as session:
         yield session
 
 
@@ -0,0 +1,105 @@
+import json
+import uuid
+from typing import TypeVar
+
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.utilities.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+
+ModelType = TypeVar("ModelType", bound=SQLModel)
+
+
+def business_cache_key(business_public_id: uuid.UUID) -> str:
+    return f"business:{business_public_id}"
+
+
+def padel_court_cache_key(business_public_id: uuid.UUID, court_name: str) -> str:
+    return f"padel_court:{business_public_id}:{court_name}"
+
+
+class EntityCache:
+    """Read-through cache of database entities, serialized as JSON.
+
+    Entities read from the cache are merged into the session without a query,
+    so they can be updated as if they had been selected.
+    """
+
+    def __init__(self, backend: CacheBackend | None, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self, session: AsyncSession, model: type[ModelType], key: str
+    ) -> ModelType | None:
+        if self.backend is None:
+            return None
+        data = await self.backend.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entity = model.model_validate(json.loads(data))
+        make_transient_to_detached(entity)
+        return await session.merge(entity, load=False)
+
+    async def set(self, key: str, entity: SQLModel) -> None:
+        if self.backend is not None:
+            await self.backend.set(key, entity.model_dump_json().encode(), self.ttl)
+
+    async def delete(self, *keys: str) -> None:
+        if self.backend is not None:
+            await self.backend.delete(*keys)
+
+    async def clear(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        if self.backend is not None:
+            await self.backend.clear()
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+
+
+_entity_cache: EntityCache | None = None
+
+
+def _build_backend() -> CacheBackend | None:
+    backend = settings.ENTITY_CACHE_BACKEND
+    if backend is None:
+        backend = "redis" if settings.REDIS_URL else "none"
+    if backend == "redis":
+        if not settings.REDIS_URL:
+            raise RuntimeError("ENTITY_CACHE_BACKEND=redis needs REDIS_URL")
+        return RedisCacheBackend(settings.REDIS_URL)
+    if backend == "memory":
+        return MemoryCacheBackend(
+            max_size=settings.ENTITY_CACHE_MAX_SIZE, ttl=settings.ENTITY_CACHE_TTL
+        )
+    return None
+
+
+def get_entity_cache() -> EntityCache:
+    """Process-wide entity cache, built from the settings on first use."""
+    global _entity_cache
+    if _entity_cache is None:
+        _entity_cache = EntityCache(_build_backend(), settings.ENTITY_CACHE_TTL)
+    return _entity_cache
+
+
+def set_entity_cache(entity_cache: EntityCache | None) -> None:
+    """Replace the process-wide entity cache, None rebuilds it from the settings."""
+    global _entity_cache
+    _entity_cache = entity_cache
+
+
+async def close_entity_cache() -> None:
+    global _entity_cache
+    if _entity_cache is not None:
+        await _entity_cache.close()
+    _entity_cache = None
@@ -0,0 +1,220 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any, Protocol
+
+import asyncpg  # type: ignore[import-untyped]
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[str], None]
+
+
+class EventBackend(Protocol):
+    """Carries published payloads to the brokers of every subscribed process."""
+
+    async def start(self, deliver: Deliver) -> None: ...
+
+    async def publish(self, payload: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class LocalEventBackend:
+    """Backend local to the process: only this worker's subscribers get events."""
+
+    def __init__(self) -> None:
+        self.deliver: Deliver | None = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self.deliver = deliver
+
+    async def publish(self, payload: str) -> None:
+        if self.deliver is not None:
+            self.deliver(payload)
+
+    async def close(self) -> None:
+        self.deliver = None
+
+
+class PostgresEventBackend:
+    """Backend shared by every worker through Postgres LISTEN/NOTIFY.
+
+    A dedicated asyncpg connection listens on the channel and is also used to
+    notify, so payloads published by any worker reach all of them (including
+    the one that published). Payloads must stay under 8000 bytes.
+
+    If the connection is lost (e.g. the database restarts) it is opened and
+    listened on again in the background, waiting up to max_reconnect_delay
+    seconds between attempts. Payloads notified meanwhile are lost.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = "availability_events",
+        max_reconnect_delay: float = 30,
+    ) -> None:
+        self.dsn = dsn
+        self.channel = channel
+        self.max_reconnect_delay = max_reconnect_delay
+        self.connection: Any = None
+        self.deliver: Deliver | None = None
+        self._lock = asyncio.Lock()
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def start(self, deliver: Deliver) -> None:
+        self.deliver = deliver
+        self._closed = False
+        async with self._lock:
+            await self._connect()
+
+    async def _connect(self) -> None:
+        connection = await asyncpg.connect(self.dsn)
+        await connection.add_listener(self.channel, self._on_notification)
+        connection.add_termination_listener(self._on_termination)
+        self.connection = connection
+
+    def _on_notification(
+        self, _connection: Any, _pid: int, _channel: str, payload: str
+    ) -> None:
+        if self.deliver is not None:
+            self.deliver(payload)
+
+    def _on_termination(self, connection: Any) -> None:
+        if self._closed or connection is not self.connection:
+            return
+        logger.warning(f"Lost the connection listening on {self.channel}")
+        self.connection = None
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = 0.1
+        while not self._closed:
+            async with self._lock:
+                if self.connection is not None:
+                    return
+                try:
+                    await self._connect()
+                    logger.info(f"Listening on {self.channel} again")
+                    return
+                except (OSError, asyncpg.PostgresError) as e:
+                    logger.warning(f"Could not listen on {self.channel}: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def publish(self, payload: str) -> None:
+        async with self._lock:
+            if self.connection is None or self.connection.is_closed():
+                raise ConnectionError(f"Not connected to {self.channel}")
+            await self.connection.execute(
+                "SELECT pg_notify($1, $2)", self.channel, payload
+            )
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self.connection is not None:
+            await self.connection.close()
+            self.connection = None
+
+
+class EventBroker:
+    """In-process pub/sub of string payloads, fed by an EventBackend.
+
+    Every subscriber has its own bounded queue; when a slow subscriber's queue
+    is full its oldest payload is dropped so publishers never block.
+    """
+
+    def __init__(self, backend: EventBackend, max_queue_size: int = 100) -> None:
+        self.backend = backend
+        self.max_queue_size = max_queue_size
+        self._subscribers: set[asyncio.Queue[str]] = set()
+        self._started = False
+        self._start_lock = asyncio.Lock()
+
+    async def _ensure_started(self) -> None:
+        async with self._start_lock:
+            if not self._started:
+                await self.backend.start(self._deliver)
+                self._started = True
+
+    def _deliver(self, payload: str) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+    async def publish(self, payload: str) -> None:
+        """Publish the payload, logging instead of raising if the backend fails.
+
+        Events are published after the change is committed, a failure here must
+        not turn a successful request into an error.
+        """
+        try:
+            await self._ensure_started()
+            await self.backend.publish(payload)
+        except Exception as e:
+            logger.warning(f"Could not publish event: {e}")
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue[str]]:
+        """Queue receiving every payload published while the block is active."""
+        await self._ensure_started()
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    @property
+    def subscribers_count(self) -> int:
+        return len(self._subscribers)
+
+    async def close(self) -> None:
+        if self._started:
+            await self.backend.close()
+            self._started = False
+
+
+_event_broker: EventBroker | None = None
+
+
+def _build_backend() -> EventBackend:
+    if settings.AVAILABILITY_EVENTS_BACKEND == "postgres":
+        dsn = str(settings.SQLALCHEMY_DATABASE_URI).replace(
+            "postgresql+asyncpg://", "postgresql://", 1
+        )
+        return PostgresEventBackend(dsn)
+    return LocalEventBackend()
+
+
+def get_event_broker() -> EventBroker:
+    """Process-wide event broker, built from the settings on first use."""
+    global _event_broker
+    if _event_broker is None:
+        _event_broker = EventBroker(
+            _build_backend(), settings.AVAILABILITY_EVENTS_QUEUE_SIZE
+        )
+    return _event_broker
+
+
+def set_event_broker(event_broker: EventBroker | None) -> None:
+    """Replace the process-wide event broker, None rebuilds it from the settings."""
+    global _event_broker
+    _event_broker = event_broker
+
+
+async def close_event_broker() -> None:
+    global _event_broker
+    if _event_broker is not None:
+        await _event_broker.close()
+    _event_broker = None
@@ -0,0 +1,43 @@
+import math
+from typing import Any
+
+from sqlalchemy import func
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_OF_LATITUDE = 111.045
+
+
+def get_bounding_box(
+    latitude: float, longitude: float, radius_km: float
+) -> tuple[float, float, float, float]:
+    """(min_latitude, max_latitude, min_longitude, max_longitude) around a point.
+
+    The box contains every point within radius_km, so it can be used as an
+    index-friendly prefilter before computing exact distances.
+    """
+    delta_latitude = radius_km / KM_PER_DEGREE_OF_LATITUDE
+    min_latitude = max(latitude - delta_latitude, -90.0)
+    max_latitude = min(latitude + delta_latitude, 90.0)
+    cos_latitude = math.cos(math.radians(latitude))
+    if min_latitude <= -90.0 or max_latitude >= 90.0 or cos_latitude <= 1e-9:
+        return min_latitude, max_latitude, -180.0, 180.0
+    delta_longitude = radius_km / (KM_PER_DEGREE_OF_LATITUDE * cos_latitude)
+    min_longitude = longitude - delta_longitude
+    max_longitude = longitude + delta_longitude
+    if min_longitude < -180.0 or max_longitude > 180.0:
+        return min_latitude, max_latitude, -180.0, 180.0
+    return min_latitude, max_latitude, min_longitude, max_longitude
+
+
+def haversine_distance_km(
+    latitude_column: Any, longitude_column: Any, latitude: float, longitude: float
+) -> Any:
+    """SQL expression of the great-circle distance in km from a point to a row."""
+    delta_latitude = func.radians(latitude_column - latitude)
+    delta_longitude = func.radians(longitude_column - longitude)
+    a = func.power(func.sin(delta_latitude / 2), 2) + func.cos(
+        math.radians(latitude)
+    ) * func.cos(func.radians(latitude_column)) * func.power(
+        func.sin(delta_longitude / 2), 2
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.sqrt(func.least(1.0, a)))
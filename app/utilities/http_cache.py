@@ -0,0 +1,46 @@
+import hashlib
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+# Cache-Control policies of the read endpoints. Listings can be reused for a
+# short while, availability changes with every reservation so it is always
+# revalidated (cheap thanks to the ETag).
+LISTING_CACHE_CONTROL = "private, max-age=30"
+AVAILABILITY_CACHE_CONTROL = "private, no-cache"
+# Event streams must not be cached nor buffered by proxies.
+AVAILABILITY_EVENTS_HEADERS = {"Cache-Control": "no-store", "X-Accel-Buffering": "no"}
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag of a response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether the If-None-Match header matches the ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cached_json_response(
+    request: Request,
+    content: BaseModel,
+    cache_control: str,
+) -> Response:
+    """JSON response with ETag and Cache-Control headers.
+
+    When the request If-None-Match header matches the ETag the body is not
+    sent, a 304 Not Modified is answered instead.
+    """
+    body = content.model_dump_json().encode()
+    etag = compute_etag(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -115,15 +115,88 @@ AVAILABLE_DATE_POST_RESPONSES = {
     **AVAILABLE_DATE_NOT_ACCEPTABLE,
 }
 AVAILABLE_DATE_DELETE_RESPONSES = {
+    status.HTTP_200_OK: {
+        "description": "Retorna la cantidad de disponibilidades eliminadas, si se pidió con return_count."
+    },
     **AVAILABLE_DATE_NOT_FOUND,
     **AVAILABLE_DATE_UNAUTHORIZED_OWNED,
+    **AVAILABLE_DATE_ALREADY_RESERVED,
 }
 AVAILABLE_DATE_GET_RESPONSES = {
     status.HTTP_200_OK: {
         "description": "Retorna una lista de disponbilidades de emparejamiento dada una fecha."
     }
 }
+AVAILABLE_DATE_RANGE_GET_RESPONSES = {
+    status.HTTP_200_OK: {
+        "description": "Retorna las disponibilidades de emparejamiento de un rango de fechas, agrupadas por día."
+    },
+    **AVAILABLE_DATE_NOT_ACCEPTABLE,
+}
+AVAILABLE_DATE_SEARCH_RESPONSES = {
+    status.HTTP_200_OK: {
+        "description": "Retorna las disponibilidades libres de todas las canchas que cumplen el filtro."
+    },
+    **AVAILABLE_DATE_NOT_ACCEPTABLE,
+}
 AVAILABLE_DATE_PATCH_RESPONSES = {
     **AVAILABLE_DATE_NOT_FOUND,
     **AVAILABLE_DATE_ALREADY_RESERVED,
 }
+AVAILABLE_DATE_HOLD_POST_RESPONSES = {
+    status.HTTP_201_CREATED: {
+        "description": "Retorna las disponibilidades retenidas, el hold_id y su vencimiento."
+    },
+    **AVAILABLE_DATE_NOT_FOUND,
+    **AVAILABLE_DATE_ALREADY_RESERVED,
+    **AVAILABLE_DATE_NOT_ACCEPTABLE,
+}
+AVAILABLE_DATE_HOLD_DELETE_RESPONSES = {**AVAILABLE_DATE_NOT_ACCEPTABLE}
+AVAILABLE_DATE_RANGE_PATCH_RESPONSES = {
+    status.HTTP_200_OK: {
+        "description": "Retorna las disponibilidades reservadas, todas o ninguna."
+    },
+    **AVAILABLE_DATE_NOT_FOUND,
+    **AVAILABLE_DATE_ALREADY_RESERVED,
+    **AVAILABLE_DATE_NOT_ACCEPTABLE,
+}
+
+# availability templates
+AVAILABILITY_TEMPLATE_PUT_RESPONSES = {
+    status.HTTP_200_OK: {
+        "description": "Retorna la plantilla semanal de disponibilidades de la cancha."
+    },
+    **AVAILABLE_DATE_NOT_FOUND,
+    **AVAILABLE_DATE_UNAUTHORIZED_OWNED,
+    **AVAILABLE_DATE_NOT_ACCEPTABLE,
+}
+AVAILABILITY_TEMPLATE_GET_RESPONSES = {
+    status.HTTP_200_OK: {
+        "description": "Retorna la plantilla semanal de disponibilidades de la cancha."
+    },
+    **AVAILABLE_DATE_NOT_FOUND,
+}
+AVAILABILITY_TEMPLATE_EXCEPTION_RESPONSES = {
+    **AVAILABLE_DATE_NOT_FOUND,
+    **AVAILABLE_DATE_UNAUTHORIZED_OWNED,
+}
+
+# available matches bulk creation
+AVAILABLE_DATE_BULK_POST_RESPONSES = {
+    status.HTTP_201_CREATED: {
+        "description": "Disponibilidades creadas, retorna el trabajo terminado."
+    },
+    status.HTTP_202_ACCEPTED: {
+        "description": "Retorna el trabajo pendiente, consultar su progreso en la URL del header Location."
+    },
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {
+        "description": "No se pudieron crear las disponibilidades, retorna el trabajo fallido."
+    },
+    **AVAILABLE_DATE_NOT_FOUND,
+    **AVAILABLE_DATE_UNAUTHORIZED_OWNED,
+    **AVAILABLE_DATE_NOT_ACCEPTABLE,
+}
+AVAILABLE_DATE_BULK_GET_RESPONSES = {
+    status.HTTP_200_OK: {"description": "Retorna el progreso del trabajo."},
+    status.HTTP_404_NOT_FOUND: {"description": "Trabajo no encontrado."},
+}
@@ -0,0 +1,121 @@
+import json
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement, Select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class CountMode(str, Enum):
+    """How the total count of a listing is computed.
+
+    exact: counted in the same query as the page, with a window function.
+    estimated: planner statistics, without scanning the filtered rows.
+    none: not computed, count is returned as null.
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class _ExplainJson(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJson)
+def _compile_explain_json(
+    element: _ExplainJson, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_count(
+    session: AsyncSession, query: Any, table_name: str | None = None
+) -> int:
+    """Estimated number of rows of query.
+
+    For unfiltered listings pass table_name to read pg_class.reltuples. Otherwise
+    (or if the table was never analyzed) the planner row estimate is used.
+    """
+    # Raw statements run on the connection of the session, in its transaction
+    connection = await session.connection()
+    if table_name is not None:
+        reltuples_query = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"
+        )
+        result = await connection.execute(reltuples_query, {"table": table_name})
+        reltuples = result.scalar_one()
+        if reltuples >= 0:
+            return int(reltuples)
+    result = await connection.execute(_ExplainJson(query))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def fetch_page(
+    session: AsyncSession,
+    page_query: Any,
+    filtered_query: Any,
+    count_mode: CountMode,
+    *,
+    keyset: bool = False,
+    offset: bool = False,
+    table_name: str | None = None,
+) -> tuple[list[Any], int | None]:
+    """Run page_query and compute the total count of filtered_query.
+
+    page_query is filtered_query plus its pagination (keyset predicate, offset,
+    order and limit). With exact count the total goes as an extra column of the
+    page: a count(*) OVER () window, or, for keyset pages where the window would
+    only see the rows after the cursor, an uncorrelated scalar subquery. Rows
+    are returned without that column, as the entity itself when page_query
+    selects a single one.
+    """
+    single_entity = len(page_query.column_descriptions) == 1
+    total_count: int | None = None
+    rows: list[Any]
+    if count_mode == CountMode.EXACT:
+        total_column: ColumnElement[int]
+        if keyset:
+            total_column = (
+                select(func.count())
+                .select_from(filtered_query.subquery())
+                .scalar_subquery()
+            )
+        else:
+            total_column = func.count().over()
+        total_label = total_column.label("total_count")
+        entities = [column["expr"] for column in page_query.column_descriptions]
+        # session.exec returns scalars for a single entity, which would drop the
+        # total column: the page is run as a statement with explicit columns.
+        page_query = Select(*entities, total_label).from_statement(
+            page_query.add_columns(total_label)
+        )
+    rows = list((await session.exec(page_query)).all())
+
+    if count_mode == CountMode.EXACT:
+        if rows:
+            total_count = rows[0][-1]
+        elif keyset or offset:
+            # Past the last page there is no row to carry the total.
+            count_query = select(func.count()).select_from(filtered_query.subquery())
+            total_count = (await session.exec(count_query)).one()
+        else:
+            total_count = 0
+        rows = [row[0] if single_entity else tuple(row[:-1]) for row in rows]
+    elif count_mode == CountMode.ESTIMATED:
+        total_count = await estimate_count(session, filtered_query, table_name)
+    return rows, total_count
@@ -0,0 +1,25 @@
+import uuid
+from collections.abc import Hashable
+from typing import Any
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+REQUEST_CACHE_INFO_KEY = "request_cache"
+
+
+def get_request_cache(session: AsyncSession) -> dict[Hashable, Any]:
+    """Entities already fetched in this request, shared by every service.
+
+    A session is opened per request (get_db), so its info dict lives exactly as
+    long as the request does.
+    """
+    cache: dict[Hashable, Any] = session.info.setdefault(REQUEST_CACHE_INFO_KEY, {})
+    return cache
+
+
+def business_key(business_public_id: uuid.UUID) -> Hashable:
+    return ("business", business_public_id)
+
+
+def padel_court_key(business_public_id: uuid.UUID, court_name: str) -> Hashable:
+    return ("padel_court", business_public_id, court_name)
@@ -0,0 +1,18 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(job: Callable[[], Awaitable[None]], interval: float) -> None:
+    """Run the job now and then every interval seconds, until cancelled.
+
+    A failing run is logged and does not stop the next ones.
+    """
+    while True:
+        try:
+            await job()
+        except Exception as e:
+            logger.warning(f"Scheduled job {job.__name__} failed: {e}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,7 @@
+#!/usr/bin/env bash
+
+set -e
+set -x
+
+# Migrate the schema once, before the workers start
+python -m app.migrations upgrade